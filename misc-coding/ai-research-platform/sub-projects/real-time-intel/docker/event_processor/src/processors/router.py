@@ -2,12 +2,12 @@
 Event Routing Engine - Intelligent routing decisions for processed events
 """
 
-import asyncio
 import httpx
-import json
+import re
 import structlog
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import ClassVar, Final, List, Dict, Any, Optional
 
 from ..models import (
     RoutingDecision, EventSeverity, EventUrgency, EventType,
@@ -16,17 +16,79 @@ from ..models import (
 
 logger = structlog.get_logger(__name__)
 
+# Integer ranks so routing decisions reduce to plain int comparisons
+_SEV_RANK = {
+    EventSeverity.INFO: 1,
+    EventSeverity.LOW: 2,
+    EventSeverity.MEDIUM: 3,
+    EventSeverity.HIGH: 4,
+    EventSeverity.CRITICAL: 5
+}
+_URG_RANK = {
+    EventUrgency.BATCH: 1,
+    EventUrgency.LOW: 2,
+    EventUrgency.NORMAL: 3,
+    EventUrgency.HIGH: 4,
+    EventUrgency.IMMEDIATE: 5
+}
+# Routing configuration (read-only, shared by all router instances)
+_ROUTING_RULES: Final = MappingProxyType({
+    'critical_threshold': 0.9,
+    'high_priority_threshold': 0.7,
+    'portfolio_relevance_threshold': 0.5,
+    'immediate_routing_types': (
+        EventType.BREAKING_NEWS,
+        EventType.EARNINGS_ANNOUNCEMENT,
+        EventType.MERGER_ACQUISITION
+    )
+})
+
+_DELIVERY_CHANNELS: Final = MappingProxyType({
+    'immediate_alert': MappingProxyType({'latency': 0, 'reliability': 0.99}),
+    'priority_alert': MappingProxyType({'latency': 30, 'reliability': 0.98}),
+    'email': MappingProxyType({'latency': 300, 'reliability': 0.95}),
+    'dashboard': MappingProxyType({'latency': 60, 'reliability': 0.99}),
+    'api': MappingProxyType({'latency': 10, 'reliability': 0.99}),
+    'batch_feed': MappingProxyType({'latency': 3600, 'reliability': 0.99})
+})
+
+# Cap on routing criteria contributed by a single routing factor
+MAX_CRITERIA_PER_TASK = 4
+
+# Delivery delay in minutes, indexed by urgency rank
+_DELAY_BY_URG_RANK = (None, 240, 60, 15, 5, 0)
+
 class EventRouter:
     """Intelligent event routing and delivery decisions"""
     
+    # One connection pool shared by every router instance
+    _shared_client: ClassVar[Optional[httpx.AsyncClient]] = None
+    _refcount: ClassVar[int] = 0
+    
     def __init__(self, mac_studio_endpoint: str = "http://10.0.0.100:8000"):
         self.mac_studio_endpoint = mac_studio_endpoint
-        self.http_client = httpx.AsyncClient(timeout=30.0)
+        
+        if EventRouter._shared_client is None:
+            EventRouter._shared_client = httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        EventRouter._refcount += 1
+        self.http_client = EventRouter._shared_client
+        self._closed = False
         
         # Routing configuration
-        self.routing_rules = self._load_routing_rules()
-        self.delivery_channels = self._load_delivery_channels()
+        self.routing_rules = _ROUTING_RULES
+        self.delivery_channels = _DELIVERY_CHANNELS
         self.portfolio_holdings = {}  # This would be loaded from holdings service
+        self._ticker_weights: Dict[str, float] = {}  # Validated at load time
+        
+        # Company name -> ticker lookup tables
+        self._alias_exact, self._alias_pattern = self._load_company_aliases()
+        
+        # Per-event routing summaries, logged in batches
+        self._log_buf: List[Dict[str, Any]] = []
+        self._log_buf_max = 64
         
     async def initialize(self):
         """Initialize event router"""
@@ -41,50 +103,32 @@ class EventRouter:
         severity_assessment: SeverityAssessment
     ) -> RoutingDecision:
         """Determine routing for processed event"""
-        logger.info("Routing event", event_id=event.event_id)
-        
         try:
-            # Multiple routing factors
-            routing_tasks = [
-                self._assess_portfolio_relevance(event, entities),
-                self._determine_delivery_channels(severity_assessment, event),
-                self._calculate_routing_priority(severity_assessment, event),
-                self._assess_audience_targeting(event, entities, severity_assessment)
-            ]
+            sev_r = _SEV_RANK[severity_assessment.severity]
+            urg_r = _URG_RANK[severity_assessment.urgency]
             
-            # Execute routing analysis
-            results = await asyncio.gather(*routing_tasks, return_exceptions=True)
+            # Multiple routing factors
+            portfolio_result = self._assess_portfolio_relevance(event, entities)
+            channels_result = self._determine_delivery_channels(sev_r, urg_r, event)
+            priority_result = self._calculate_routing_priority(severity_assessment, sev_r, urg_r, event)
+            audience_result = self._assess_audience_targeting(event, entities, severity_assessment, sev_r, urg_r)
             
             # Process results
-            portfolio_relevance = 0.0
-            affected_holdings = []
-            delivery_channels = ["standard"]
-            priority_level = 1
-            audience_targets = []
-            routing_criteria = []
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Routing task {i} failed", error=str(result))
-                    continue
-                
-                if i == 0:  # Portfolio relevance
-                    portfolio_relevance = result.get('relevance_score', 0.0)
-                    affected_holdings = result.get('affected_holdings', [])
-                    routing_criteria.extend(result.get('criteria', []))
-                elif i == 1:  # Delivery channels
-                    delivery_channels = result.get('channels', ["standard"])
-                    routing_criteria.extend(result.get('criteria', []))
-                elif i == 2:  # Priority
-                    priority_level = result.get('priority', 1)
-                    routing_criteria.extend(result.get('criteria', []))
-                elif i == 3:  # Audience targeting
-                    audience_targets = result.get('targets', [])
-                    routing_criteria.extend(result.get('criteria', []))
+            portfolio_relevance = portfolio_result['relevance_score']
+            affected_holdings = portfolio_result['affected_holdings']
+            delivery_channels = channels_result['channels']
+            priority_level = priority_result['priority']
+            audience_targets = audience_result['targets']
+            routing_criteria = (
+                portfolio_result['criteria'] +
+                channels_result['criteria'] +
+                priority_result['criteria'] +
+                audience_result['criteria']
+            )
             
             # Determine primary and secondary destinations
             primary_destination, secondary_destinations = self._determine_destinations(
-                severity_assessment, portfolio_relevance, audience_targets, delivery_channels
+                sev_r, urg_r, portfolio_relevance, audience_targets, delivery_channels
             )
             
             # Calculate routing confidence
@@ -93,11 +137,12 @@ class EventRouter:
             )
             
             # Determine delivery method and timing
-            delivery_method = self._determine_delivery_method(severity_assessment)
-            delivery_delay = self._calculate_delivery_delay(severity_assessment)
-            expiry_time = self._calculate_expiry_time(event, severity_assessment)
+            delivery_method = self._determine_delivery_method(sev_r, urg_r)
+            delivery_delay = self._calculate_delivery_delay(urg_r)
+            expiry_time = self._calculate_expiry_time(event, sev_r, urg_r)
             
-            routing_decision = RoutingDecision(
+            # Values are produced internally, so skip per-field validation
+            routing_decision = RoutingDecision.model_construct(
                 primary_destination=primary_destination,
                 secondary_destinations=secondary_destinations,
                 routing_score=routing_score,
@@ -110,11 +155,14 @@ class EventRouter:
                 expiry_time=expiry_time
             )
             
-            logger.info("Event routing completed", 
-                       event_id=event.event_id,
-                       primary_destination=primary_destination,
-                       portfolio_relevance=portfolio_relevance,
-                       priority=priority_level)
+            self._log_buf.append({
+                'event_id': event.event_id,
+                'primary': primary_destination,
+                'portfolio_relevance': portfolio_relevance,
+                'priority': priority_level
+            })
+            if len(self._log_buf) >= self._log_buf_max:
+                self._flush_log_buffer()
             
             return routing_decision
             
@@ -133,72 +181,67 @@ class EventRouter:
                 priority_level=1
             )
     
-    async def _assess_portfolio_relevance(self, event: NewsEvent, entities: List[Entity]) -> Dict[str, Any]:
+    def _assess_portfolio_relevance(self, event: NewsEvent, entities: List[Entity]) -> Dict[str, Any]:
         """Assess relevance to portfolio holdings"""
         relevance_score = 0.0
         affected_holdings = []
         criteria = []
         
-        try:
-            # Check for ticker matches
-            ticker_entities = [e for e in entities if e.entity_type == "TICKER" and e.ticker_symbol]
+        # Check for ticker matches
+        ticker_entities = [e for e in entities if e.entity_type == "TICKER" and e.ticker_symbol]
+        
+        for entity in ticker_entities:
+            ticker = entity.ticker_symbol
             
-            for entity in ticker_entities:
-                ticker = entity.ticker_symbol
+            position_weight = self._ticker_weights.get(ticker)  # Portfolio weight
+            if position_weight is not None:
+                # Calculate relevance based on holding size and entity confidence
+                entity_confidence = entity.confidence
                 
-                if ticker in self.portfolio_holdings:
-                    holding = self.portfolio_holdings[ticker]
-                    
-                    # Calculate relevance based on holding size and entity confidence
-                    position_weight = holding.get('weight', 0.0)  # Portfolio weight
-                    entity_confidence = entity.confidence
-                    
-                    # Higher relevance for larger positions and high-confidence entities
-                    ticker_relevance = (position_weight * 0.7) + (entity_confidence * 0.3)
-                    relevance_score = max(relevance_score, ticker_relevance)
-                    
+                # Higher relevance for larger positions and high-confidence entities
+                ticker_relevance = (position_weight * 0.7) + (entity_confidence * 0.3)
+                relevance_score = max(relevance_score, ticker_relevance)
+                
+                affected_holdings.append({
+                    'ticker': ticker,
+                    'company': entity.entity_value,
+                    'position_weight': position_weight,
+                    'relevance': ticker_relevance
+                })
+                
+                if len(criteria) < MAX_CRITERIA_PER_TASK:
+                    criteria.append(f"Portfolio holding: {ticker} ({position_weight:.1%})")
+        
+        # Check for company name matches
+        company_entities = [e for e in entities if e.entity_type in ["COMPANY", "ORG"]]
+        
+        for entity in company_entities:
+            # Try to map company name to ticker
+            ticker = self._map_company_to_ticker(entity.entity_value)
+            
+            position_weight = self._ticker_weights.get(ticker) if ticker else None
+            if position_weight is not None:
+                # Lower confidence for company name matches
+                company_relevance = position_weight * 0.5 * entity.confidence
+                relevance_score = max(relevance_score, company_relevance)
+                
+                if not any(h['ticker'] == ticker for h in affected_holdings):
                     affected_holdings.append({
                         'ticker': ticker,
                         'company': entity.entity_value,
                         'position_weight': position_weight,
-                        'relevance': ticker_relevance
+                        'relevance': company_relevance
                     })
                     
-                    criteria.append(f"Portfolio holding: {ticker} ({position_weight:.1%})")
-            
-            # Check for company name matches
-            company_entities = [e for e in entities if e.entity_type in ["COMPANY", "ORG"]]
-            
-            for entity in company_entities:
-                # Try to map company name to ticker
-                ticker = self._map_company_to_ticker(entity.entity_value)
-                
-                if ticker and ticker in self.portfolio_holdings:
-                    holding = self.portfolio_holdings[ticker]
-                    position_weight = holding.get('weight', 0.0)
-                    
-                    # Lower confidence for company name matches
-                    company_relevance = position_weight * 0.5 * entity.confidence
-                    relevance_score = max(relevance_score, company_relevance)
-                    
-                    if not any(h['ticker'] == ticker for h in affected_holdings):
-                        affected_holdings.append({
-                            'ticker': ticker,
-                            'company': entity.entity_value,
-                            'position_weight': position_weight,
-                            'relevance': company_relevance
-                        })
-                        
+                    if len(criteria) < MAX_CRITERIA_PER_TASK:
                         criteria.append(f"Company match: {entity.entity_value} -> {ticker}")
-            
-            # Sector/industry relevance
-            sector_relevance = self._assess_sector_relevance(entities)
-            if sector_relevance > 0.1:
-                relevance_score = max(relevance_score, sector_relevance)
+        
+        # Sector/industry relevance
+        sector_relevance = self._assess_sector_relevance(entities)
+        if sector_relevance > 0.1:
+            relevance_score = max(relevance_score, sector_relevance)
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append(f"Sector relevance: {sector_relevance:.2f}")
-            
-        except Exception as e:
-            logger.error("Portfolio relevance assessment failed", error=str(e))
         
         return {
             'relevance_score': relevance_score,
@@ -206,173 +249,145 @@ class EventRouter:
             'criteria': criteria
         }
     
-    async def _determine_delivery_channels(
+    def _determine_delivery_channels(
         self, 
-        severity_assessment: SeverityAssessment, 
+        sev_r: int,
+        urg_r: int,
         event: NewsEvent
     ) -> Dict[str, Any]:
         """Determine appropriate delivery channels"""
         channels = ["standard"]
         criteria = []
         
-        try:
-            severity = severity_assessment.severity
-            urgency = severity_assessment.urgency
-            
-            # Channel selection based on severity and urgency
-            if severity == EventSeverity.CRITICAL:
-                channels = ["immediate_alert", "email", "dashboard", "api"]
-                criteria.append("Critical severity - all channels")
-            elif severity == EventSeverity.HIGH:
-                if urgency in [EventUrgency.IMMEDIATE, EventUrgency.HIGH]:
-                    channels = ["priority_alert", "email", "dashboard"]
-                    criteria.append("High severity + urgent - priority channels")
-                else:
-                    channels = ["email", "dashboard", "api"]
-                    criteria.append("High severity - standard channels")
-            elif severity == EventSeverity.MEDIUM:
-                if urgency == EventUrgency.IMMEDIATE:
-                    channels = ["priority_alert", "dashboard"]
-                    criteria.append("Medium severity + immediate - priority alert")
-                else:
-                    channels = ["dashboard", "api"]
-                    criteria.append("Medium severity - dashboard and API")
+        # Channel selection based on severity and urgency
+        if sev_r == 5:
+            channels = ["immediate_alert", "email", "dashboard", "api"]
+            criteria.append("Critical severity - all channels")
+        elif sev_r == 4:
+            if urg_r >= 4:
+                channels = ["priority_alert", "email", "dashboard"]
+                criteria.append("High severity + urgent - priority channels")
             else:
-                channels = ["api", "batch_feed"]
-                criteria.append("Low severity - background channels")
-            
-            # Event type specific channels
-            if event.classification:
-                event_type = event.classification.event_type
-                
-                if event_type == EventType.EARNINGS_ANNOUNCEMENT:
-                    if "earnings_feed" not in channels:
-                        channels.append("earnings_feed")
-                    criteria.append("Earnings event - earnings feed")
-                elif event_type == EventType.BREAKING_NEWS:
-                    if "breaking_news" not in channels:
-                        channels.append("breaking_news")
-                    criteria.append("Breaking news - breaking news feed")
-                elif event_type in [EventType.REGULATORY_UPDATE, EventType.LITIGATION]:
-                    if "regulatory_feed" not in channels:
-                        channels.append("regulatory_feed")
-                    criteria.append("Regulatory event - regulatory feed")
+                channels = ["email", "dashboard", "api"]
+                criteria.append("High severity - standard channels")
+        elif sev_r == 3:
+            if urg_r == 5:
+                channels = ["priority_alert", "dashboard"]
+                criteria.append("Medium severity + immediate - priority alert")
+            else:
+                channels = ["dashboard", "api"]
+                criteria.append("Medium severity - dashboard and API")
+        else:
+            channels = ["api", "batch_feed"]
+            criteria.append("Low severity - background channels")
         
-        except Exception as e:
-            logger.error("Delivery channel determination failed", error=str(e))
+        # Event type specific channels
+        if event.classification:
+            event_type = event.classification.event_type
+            
+            if event_type == EventType.EARNINGS_ANNOUNCEMENT:
+                if "earnings_feed" not in channels:
+                    channels.append("earnings_feed")
+                criteria.append("Earnings event - earnings feed")
+            elif event_type == EventType.BREAKING_NEWS:
+                if "breaking_news" not in channels:
+                    channels.append("breaking_news")
+                criteria.append("Breaking news - breaking news feed")
+            elif event_type in [EventType.REGULATORY_UPDATE, EventType.LITIGATION]:
+                if "regulatory_feed" not in channels:
+                    channels.append("regulatory_feed")
+                criteria.append("Regulatory event - regulatory feed")
         
         return {'channels': channels, 'criteria': criteria}
     
-    async def _calculate_routing_priority(
+    def _calculate_routing_priority(
         self, 
         severity_assessment: SeverityAssessment, 
+        sev_r: int,
+        urg_r: int,
         event: NewsEvent
     ) -> Dict[str, Any]:
         """Calculate routing priority level"""
-        priority = 1
         criteria = []
         
-        try:
-            severity = severity_assessment.severity
-            urgency = severity_assessment.urgency
-            
-            # Base priority from severity
-            severity_priority = {
-                EventSeverity.CRITICAL: 5,
-                EventSeverity.HIGH: 4,
-                EventSeverity.MEDIUM: 3,
-                EventSeverity.LOW: 2,
-                EventSeverity.INFO: 1
-            }
-            
-            # Base priority from urgency
-            urgency_priority = {
-                EventUrgency.IMMEDIATE: 5,
-                EventUrgency.HIGH: 4,
-                EventUrgency.NORMAL: 3,
-                EventUrgency.LOW: 2,
-                EventUrgency.BATCH: 1
-            }
-            
-            # Take the maximum of severity and urgency priority
-            priority = max(
-                severity_priority.get(severity, 1),
-                urgency_priority.get(urgency, 1)
-            )
-            
-            criteria.append(f"Severity: {severity.value} -> {severity_priority.get(severity, 1)}")
-            criteria.append(f"Urgency: {urgency.value} -> {urgency_priority.get(urgency, 1)}")
-            
-            # Market hours boost
-            if event.published_at:
-                market_hours_factor = self._is_market_hours(event.published_at)
-                if market_hours_factor and priority < 5:
-                    priority = min(5, priority + 1)
-                    criteria.append("Market hours priority boost")
+        # Base priority is the higher of the severity and urgency ranks
+        priority = max(sev_r, urg_r)
         
-        except Exception as e:
-            logger.error("Priority calculation failed", error=str(e))
+        criteria.append(f"Severity: {severity_assessment.severity.value} -> {sev_r}")
+        criteria.append(f"Urgency: {severity_assessment.urgency.value} -> {urg_r}")
+        
+        # Market hours boost
+        if event.published_at:
+            market_hours_factor = self._is_market_hours(event.published_at)
+            if market_hours_factor and priority < 5:
+                priority = min(5, priority + 1)
+                criteria.append("Market hours priority boost")
         
         return {'priority': priority, 'criteria': criteria}
     
-    async def _assess_audience_targeting(
+    def _assess_audience_targeting(
         self,
         event: NewsEvent,
         entities: List[Entity],
-        severity_assessment: SeverityAssessment
+        severity_assessment: SeverityAssessment,
+        sev_r: int,
+        urg_r: int
     ) -> Dict[str, Any]:
         """Determine target audiences for the event"""
         targets = []
         criteria = []
         
-        try:
-            # Investor targeting
-            if severity_assessment.market_impact_score > 0.6:
-                targets.append("investors")
+        # Investor targeting
+        if severity_assessment.market_impact_score > 0.6:
+            targets.append("investors")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("High market impact - investor targeting")
-            
-            # Analyst targeting
-            if event.classification and event.classification.event_type in [
-                EventType.EARNINGS_ANNOUNCEMENT, 
-                EventType.ANALYST_UPGRADE, 
-                EventType.ANALYST_DOWNGRADE
-            ]:
-                targets.append("analysts")
+        
+        # Analyst targeting
+        if event.classification and event.classification.event_type in [
+            EventType.EARNINGS_ANNOUNCEMENT, 
+            EventType.ANALYST_UPGRADE, 
+            EventType.ANALYST_DOWNGRADE
+        ]:
+            targets.append("analysts")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("Analyst-relevant event type")
-            
-            # Trader targeting
-            if severity_assessment.urgency in [EventUrgency.IMMEDIATE, EventUrgency.HIGH]:
-                targets.append("traders")
+        
+        # Trader targeting
+        if urg_r >= 4:
+            targets.append("traders")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("High urgency - trader targeting")
-            
-            # Risk manager targeting
-            if severity_assessment.severity in [EventSeverity.CRITICAL, EventSeverity.HIGH]:
-                targets.append("risk_managers")
+        
+        # Risk manager targeting
+        if sev_r >= 4:
+            targets.append("risk_managers")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("High severity - risk manager targeting")
-            
-            # Portfolio manager targeting
-            portfolio_entities = [e for e in entities if e.entity_type in ["TICKER", "COMPANY"]]
-            if portfolio_entities:
-                targets.append("portfolio_managers")
+        
+        # Portfolio manager targeting
+        portfolio_entities = [e for e in entities if e.entity_type in ["TICKER", "COMPANY"]]
+        if portfolio_entities:
+            targets.append("portfolio_managers")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("Portfolio-relevant entities")
-            
-            # Compliance targeting
-            if event.classification and event.classification.event_type in [
-                EventType.REGULATORY_UPDATE, 
-                EventType.LITIGATION,
-                EventType.INVESTIGATION
-            ]:
-                targets.append("compliance")
+        
+        # Compliance targeting
+        if event.classification and event.classification.event_type in [
+            EventType.REGULATORY_UPDATE, 
+            EventType.LITIGATION,
+            EventType.INVESTIGATION
+        ]:
+            targets.append("compliance")
+            if len(criteria) < MAX_CRITERIA_PER_TASK:
                 criteria.append("Regulatory/compliance event")
-            
-        except Exception as e:
-            logger.error("Audience targeting failed", error=str(e))
         
         return {'targets': targets, 'criteria': criteria}
     
     def _determine_destinations(
         self,
-        severity_assessment: SeverityAssessment,
+        sev_r: int,
+        urg_r: int,
         portfolio_relevance: float,
         audience_targets: List[str],
         delivery_channels: List[str]
@@ -382,13 +397,13 @@ class EventRouter:
         # Primary destination logic
         if portfolio_relevance > 0.7:
             primary = "portfolio_alerts"
-        elif severity_assessment.severity == EventSeverity.CRITICAL:
+        elif sev_r == 5:
             primary = "critical_alerts"
-        elif severity_assessment.urgency == EventUrgency.IMMEDIATE:
+        elif urg_r == 5:
             primary = "immediate_feed"
         elif "investors" in audience_targets:
             primary = "investor_feed"
-        elif severity_assessment.severity == EventSeverity.HIGH:
+        elif sev_r == 4:
             primary = "priority_feed"
         else:
             primary = "general_feed"
@@ -443,36 +458,28 @@ class EventRouter:
         
         return min(1.0, sum(confidence_factors))
     
-    def _determine_delivery_method(self, severity_assessment: SeverityAssessment) -> str:
+    def _determine_delivery_method(self, sev_r: int, urg_r: int) -> str:
         """Determine delivery method based on severity"""
         
-        if severity_assessment.severity == EventSeverity.CRITICAL:
+        if sev_r == 5:
             return "push_notification"
-        elif severity_assessment.urgency == EventUrgency.IMMEDIATE:
+        elif urg_r == 5:
             return "priority_delivery"
-        elif severity_assessment.severity == EventSeverity.HIGH:
+        elif sev_r == 4:
             return "priority_delivery"
         else:
             return "standard"
     
-    def _calculate_delivery_delay(self, severity_assessment: SeverityAssessment) -> Optional[int]:
+    def _calculate_delivery_delay(self, urg_r: int) -> Optional[int]:
         """Calculate delivery delay in minutes"""
-        
-        if severity_assessment.urgency == EventUrgency.IMMEDIATE:
-            return 0  # No delay
-        elif severity_assessment.urgency == EventUrgency.HIGH:
-            return 5  # 5 minute delay
-        elif severity_assessment.urgency == EventUrgency.NORMAL:
-            return 15  # 15 minute delay
-        elif severity_assessment.urgency == EventUrgency.LOW:
-            return 60  # 1 hour delay
-        else:  # BATCH
-            return 240  # 4 hour delay
+        # IMMEDIATE: none, HIGH: 5m, NORMAL: 15m, LOW: 1h, BATCH: 4h
+        return _DELAY_BY_URG_RANK[urg_r]
     
     def _calculate_expiry_time(
         self, 
         event: NewsEvent, 
-        severity_assessment: SeverityAssessment
+        sev_r: int,
+        urg_r: int
     ) -> Optional[datetime]:
         """Calculate when event becomes stale"""
         
@@ -480,9 +487,9 @@ class EventRouter:
             return None
         
         # Expiry based on event type and severity
-        if severity_assessment.severity == EventSeverity.CRITICAL:
+        if sev_r == 5:
             expiry_hours = 4  # Critical events expire quickly
-        elif severity_assessment.urgency == EventUrgency.IMMEDIATE:
+        elif urg_r == 5:
             expiry_hours = 8
         elif event.classification and event.classification.event_type == EventType.BREAKING_NEWS:
             expiry_hours = 12
@@ -518,24 +525,17 @@ class EventRouter:
     
     def _map_company_to_ticker(self, company_name: str) -> Optional[str]:
         """Map company name to ticker symbol"""
-        # Simplified mapping - would use comprehensive database
-        company_mappings = {
-            'apple': 'AAPL',
-            'microsoft': 'MSFT',
-            'google': 'GOOGL',
-            'alphabet': 'GOOGL',
-            'amazon': 'AMZN',
-            'tesla': 'TSLA',
-            'meta': 'META',
-            'facebook': 'META',
-            'nvidia': 'NVDA',
-            'netflix': 'NFLX'
-        }
+        normalized_name = company_name.casefold().strip()
+        
+        # Exact alias hit covers the common "Apple" / "Apple Inc." forms
+        ticker = self._alias_exact.get(normalized_name)
+        if ticker:
+            return ticker
         
-        normalized_name = company_name.lower()
-        for key, ticker in company_mappings.items():
-            if key in normalized_name:
-                return ticker
+        # Fall back to a single substring scan over all known names
+        match = self._alias_pattern.search(normalized_name)
+        if match:
+            return self._alias_exact[match.group(0)]
         
         return None
     
@@ -568,31 +568,57 @@ class EventRouter:
             'V': {'weight': 0.02, 'shares': 300, 'sector': 'Financial Services'},
             'WMT': {'weight': 0.02, 'shares': 400, 'sector': 'Consumer Defensive'}
         }
-    
-    def _load_routing_rules(self) -> Dict[str, Any]:
-        """Load routing rules configuration"""
-        return {
-            'critical_threshold': 0.9,
-            'high_priority_threshold': 0.7,
-            'portfolio_relevance_threshold': 0.5,
-            'immediate_routing_types': [
-                EventType.BREAKING_NEWS,
-                EventType.EARNINGS_ANNOUNCEMENT,
-                EventType.MERGER_ACQUISITION
-            ]
+        
+        # Validate shape once so the per-event path can skip defensive lookups
+        missing_weight = [ticker for ticker, holding in self.portfolio_holdings.items() if 'weight' not in holding]
+        if missing_weight:
+            raise ValueError(f"Portfolio holdings missing weight: {', '.join(missing_weight)}")
+        
+        self._ticker_weights = {
+            ticker: float(holding['weight']) for ticker, holding in self.portfolio_holdings.items()
         }
     
-    def _load_delivery_channels(self) -> Dict[str, Any]:
-        """Load delivery channel configuration"""
-        return {
-            'immediate_alert': {'latency': 0, 'reliability': 0.99},
-            'priority_alert': {'latency': 30, 'reliability': 0.98},
-            'email': {'latency': 300, 'reliability': 0.95},
-            'dashboard': {'latency': 60, 'reliability': 0.99},
-            'api': {'latency': 10, 'reliability': 0.99},
-            'batch_feed': {'latency': 3600, 'reliability': 0.99}
+    def _load_company_aliases(self) -> tuple[Dict[str, str], re.Pattern]:
+        """Build exact-match alias table and substring fallback pattern"""
+        # Simplified mapping - would use comprehensive database
+        company_mappings = {
+            'apple': 'AAPL',
+            'microsoft': 'MSFT',
+            'google': 'GOOGL',
+            'alphabet': 'GOOGL',
+            'amazon': 'AMZN',
+            'tesla': 'TSLA',
+            'meta': 'META',
+            'facebook': 'META',
+            'nvidia': 'NVDA',
+            'netflix': 'NFLX'
         }
+        suffixes = ['inc', 'inc.', 'corp', 'corp.', 'corporation', 'co', 'co.', 'plc', 'ltd', 'ltd.', 'platforms']
+        
+        alias_exact = dict(company_mappings)
+        for name, ticker in company_mappings.items():
+            for suffix in suffixes:
+                alias_exact[f"{name} {suffix}"] = ticker
+                alias_exact[f"{name}, {suffix}"] = ticker
+        
+        alias_pattern = re.compile('|'.join(re.escape(name) for name in company_mappings))
+        
+        return alias_exact, alias_pattern
+    
+    def _flush_log_buffer(self):
+        """Emit buffered routing summaries as a single log event"""
+        if self._log_buf:
+            logger.info("Event routing batch completed", count=len(self._log_buf), items=self._log_buf)
+            self._log_buf = []
     
     async def close(self):
-        """Close HTTP client and cleanup resources"""
-        await self.http_client.aclose() 
\ No newline at end of file
+        """Release shared HTTP client and cleanup resources"""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_log_buffer()
+        
+        EventRouter._refcount -= 1
+        if EventRouter._refcount == 0 and EventRouter._shared_client is not None:
+            await EventRouter._shared_client.aclose()
+            EventRouter._shared_client = None 
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Scoring Kernels - Numba-compiled numeric cores for severity assessment
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def combine_scores(
+    subscores: np.ndarray,
+    weights: np.ndarray,
+    severity_modifiers: np.ndarray,
+    urgency_multipliers: np.ndarray,
+    has_confident_entity: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Combine per-event subscores into overall severity, urgency and confidence
+
+    subscores is an (N, 4) array of market, company, time-sensitivity and
+    stakeholder scores. Returns three length-N arrays.
+    """
+    n = subscores.shape[0]
+    overall = np.empty(n)
+    urgency = np.empty(n)
+    confidence = np.empty(n)
+
+    for i in range(n):
+        m = subscores[i, 0]
+        c = subscores[i, 1]
+        t = subscores[i, 2]
+        s = subscores[i, 3]
+
+        # Weighted severity with event type modifier, clipped to [0, 1]
+        score = (m * weights[0] + c * weights[1] + t * weights[2] + s * weights[3]) * severity_modifiers[i]
+        score = min(1.0, max(0.0, score))
+        overall[i] = score
+
+        # Urgency leans on time sensitivity, scaled by market hours
+        urgency[i] = (t * 0.7 + score * 0.3) * urgency_multipliers[i]
+
+        # Confidence: entity clarity, consistent subscores, extreme subscores
+        conf = 0.6
+        if has_confident_entity[i]:
+            conf += 0.2
+        mean = (m + c + t + s) * 0.25
+        variance = ((m - mean) ** 2 + (c - mean) ** 2 + (t - mean) ** 2 + (s - mean) ** 2) * 0.25
+        if variance < 0.1:
+            conf += 0.15
+        if (m > 0.8 or m < 0.2 or c > 0.8 or c < 0.2 or
+                t > 0.8 or t < 0.2 or s > 0.8 or s < 0.2):
+            conf += 0.15
+        confidence[i] = min(1.0, conf)
+
+    return overall, urgency, confidence
@@ -2,33 +2,192 @@
 Severity Assessment Processor - Event impact and urgency evaluation
 """
 
-import asyncio
-import httpx
+import bisect
+import hashlib
 import json
 import re
 import structlog
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from itertools import chain, islice
+from types import MappingProxyType
+from typing import Final, FrozenSet, List, Dict, Any, Optional, Set, Tuple
+import ahocorasick
+import cachetools
 import numpy as np
 
 from ..models import (
     EventSeverity, EventUrgency, SeverityAssessment, 
     EventType, NewsEvent, Entity
 )
+from .scoring_kernels import combine_scores
 
 logger = structlog.get_logger(__name__)
 
+# Mega-cap tickers that carry outsized market impact
+_MEGA_TICKERS = frozenset({'AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA'})
+_COMPANY_ENTITY_TYPES = frozenset({'COMPANY', 'ORG', 'TICKER'})
+_ORG_ENTITY_TYPES = frozenset({'COMPANY', 'ORG'})
+# Financial metric matches beyond this add nothing to the score (4 * 0.3 >= 1.0)
+_FIN_METRIC_SATURATION = 4
+# Text analyses memoized by content hash (wire stories are reposted heavily)
+_TEXT_CACHE_SIZE = 10_000
+# Cap on factors reported per assessment
+MAX_ASSESSMENT_FACTORS = 10
+# Keyword hits for events with no text to scan
+_NO_KEYWORD_HITS: Final = MappingProxyType({})
+
+# Per event type market impact scores and severity modifiers
+_EVENT_TYPE_MARKET_IMPACT: Dict[EventType, float] = {
+    EventType.BREAKING_NEWS: 0.9,
+    EventType.EARNINGS_ANNOUNCEMENT: 0.8,
+    EventType.MERGER_ACQUISITION: 0.9,
+    EventType.REGULATORY_UPDATE: 0.7,
+    EventType.MARKET_MOVEMENT: 0.8,
+    EventType.ECONOMIC_INDICATOR: 0.7,
+    EventType.ANALYST_UPGRADE: 0.6,
+    EventType.ANALYST_DOWNGRADE: 0.6,
+    EventType.IPO_NEWS: 0.7,
+    EventType.BANKRUPTCY: 1.0,
+    EventType.EXECUTIVE_CHANGE: 0.5,
+    EventType.PRODUCT_LAUNCH: 0.4,
+    EventType.GENERAL_NEWS: 0.3
+}
+_EVENT_TYPE_SEVERITY_MODIFIER: Dict[EventType, float] = {
+    EventType.BREAKING_NEWS: 1.2,
+    EventType.BANKRUPTCY: 1.3,
+    EventType.MERGER_ACQUISITION: 1.1,
+    EventType.EARNINGS_ANNOUNCEMENT: 1.1,
+    EventType.REGULATORY_UPDATE: 1.1,
+    EventType.IPO_NEWS: 1.1,
+    EventType.GENERAL_NEWS: 0.9,
+    EventType.PRODUCT_LAUNCH: 0.9
+}
+
+# Assessment configuration (read-only, shared by all assessor instances)
+_SEVERITY_WEIGHTS: Final = MappingProxyType({
+    'market_impact': 0.35,
+    'company_impact': 0.25,
+    'time_sensitivity': 0.25,
+    'stakeholder_impact': 0.15
+})
+
+_URGENCY_FACTORS: Final = MappingProxyType({
+    'breaking_news': 0.9,
+    'market_hours': 0.3,
+    'after_hours': 0.2,
+    'weekend': 0.1
+})
+
+_MARKET_IMPACT_KEYWORDS: Final = MappingProxyType({
+    'high': (
+        'bankruptcy', 'chapter 11', 'insolvency', 'default',
+        'merger', 'acquisition', 'takeover', 'buyout',
+        'earnings miss', 'earnings beat', 'guidance',
+        'fda approval', 'fda rejection', 'recall',
+        'investigation', 'lawsuit', 'settlement',
+        'ceo', 'resignation', 'fired', 'stepping down',
+        'halt', 'suspend', 'delisted'
+    ),
+    'medium': (
+        'revenue', 'profit', 'loss', 'sales',
+        'upgrade', 'downgrade', 'target',
+        'partnership', 'agreement', 'contract',
+        'expansion', 'growth', 'decline',
+        'announcement', 'launch', 'release'
+    )
+})
+
+_URGENCY_KEYWORDS: Final = MappingProxyType({
+    'urgent': (
+        'breaking', 'urgent', 'alert', 'immediate', 'emergency',
+        'halt', 'suspend', 'stop', 'pause', 'crisis'
+    ),
+    'time': (
+        'today', 'now', 'just', 'moments ago', 'minutes ago',
+        'this morning', 'this afternoon', 'developing'
+    )
+})
+
+# Company-specific impact indicators, highest impact first
+_COMPANY_INDICATORS: Final = (
+    ('bankruptcy', 1.0), ('ipo', 0.9),
+    ('earnings', 0.8), ('restructuring', 0.8), ('acquisition', 0.8), ('merger', 0.8),
+    ('revenue', 0.7), ('profit', 0.7), ('loss', 0.7), ('layoffs', 0.7), ('investigation', 0.7),
+    ('guidance', 0.6), ('expansion', 0.6), ('lawsuit', 0.6),
+    ('outlook', 0.5), ('partnership', 0.5)
+)
+
+_STAKEHOLDER_INDICATORS: Final = MappingProxyType({
+    'investors': ('investor', 'shareholder', 'stock', 'share', 'dividend', 'return'),
+    'customers': ('customer', 'consumer', 'user', 'client', 'subscriber'),
+    'employees': ('employee', 'worker', 'staff', 'layoff', 'hiring', 'job'),
+    'regulators': ('sec', 'fda', 'ftc', 'regulatory', 'compliance', 'investigation'),
+    'partners': ('partner', 'supplier', 'vendor', 'alliance', 'collaboration'),
+    'competitors': ('competitor', 'rival', 'competition', 'market share')
+})
+
+
+@dataclass
+class EntityStats:
+    """Entity features shared by the assessments, gathered in one pass"""
+    entity_count: int = 0
+    company_count: int = 0
+    major_entity_weight: int = 0
+    major_company_factor: float = 0.0
+    company_factors: List[str] = field(default_factory=list)
+    has_high_confidence: bool = False
+
+
 class SeverityAssessor:
     """Advanced event severity and urgency assessment"""
     
+    _MEGA_TICKERS = _MEGA_TICKERS
+    
+    # Score thresholds (ascending) and the level each band maps to
+    _SEV_THR = (0.3, 0.5, 0.7, 0.9)
+    _SEV_LVL = (
+        EventSeverity.INFO, EventSeverity.LOW, EventSeverity.MEDIUM,
+        EventSeverity.HIGH, EventSeverity.CRITICAL
+    )
+    _URG_THR = (0.2, 0.4, 0.7, 0.9)
+    _URG_LVL = (
+        EventUrgency.BATCH, EventUrgency.LOW, EventUrgency.NORMAL,
+        EventUrgency.HIGH, EventUrgency.IMMEDIATE
+    )
+    
     def __init__(self, mac_studio_endpoint: str = "http://10.0.0.100:8000"):
         self.mac_studio_endpoint = mac_studio_endpoint
-        self.http_client = httpx.AsyncClient(timeout=30.0)
         
         # Assessment criteria and weights
-        self.severity_weights = self._load_severity_weights()
-        self.urgency_factors = self._load_urgency_factors()
-        self.market_impact_keywords = self._load_market_impact_keywords()
+        self.severity_weights = _SEVERITY_WEIGHTS
+        self._sev_w = (
+            self.severity_weights['market_impact'],
+            self.severity_weights['company_impact'],
+            self.severity_weights['time_sensitivity'],
+            self.severity_weights['stakeholder_impact']
+        )
+        self._sev_w_arr = np.array(self._sev_w)
+        self.urgency_factors = _URGENCY_FACTORS
+        self.market_impact_keywords = _MARKET_IMPACT_KEYWORDS
+        self.urgency_keywords = _URGENCY_KEYWORDS
+        self.company_indicators = _COMPANY_INDICATORS
+        self.stakeholder_indicators = _STAKEHOLDER_INDICATORS
+        
+        # One automaton over every assessment keyword, scanned once per event
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._text_cache: cachetools.LRUCache = cachetools.LRUCache(maxsize=_TEXT_CACHE_SIZE)
+        
+        # High-impact financial metric patterns, combined into one pass
+        self._fin_metric_re = re.compile(
+            r'(?:\$\d+\.?\d*\s*billion'
+            r'|\$\d+\.?\d*b\b'
+            r'|\d+%\s*(?:increase|decrease|drop|rise)'
+            r'|eps.*\$\d+\.\d+'
+            r'|revenue.*\$\d+\.?\d*\s*(?:billion|million))',
+            re.IGNORECASE
+        )
         
     async def initialize(self):
         """Initialize severity assessor"""
@@ -39,42 +198,11 @@ class SeverityAssessor:
         logger.info("Assessing event severity", event_id=event.event_id)
         
         try:
-            # Multiple assessment approaches
-            assessment_tasks = [
-                self._assess_market_impact(event, entities),
-                self._assess_company_impact(event, entities),
-                self._assess_time_sensitivity(event),
-                self._assess_stakeholder_impact(event, entities)
-            ]
-            
-            # Execute all assessment tasks
-            results = await asyncio.gather(*assessment_tasks, return_exceptions=True)
-            
-            # Process results
-            market_impact = 0.5
-            company_impact = 0.5
-            time_sensitivity = 0.5
-            stakeholder_impact = 0.5
-            
-            assessment_factors = []
-            
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    logger.error(f"Assessment task {i} failed", error=str(result))
-                    continue
-                
-                if i == 0:  # Market impact
-                    market_impact = result.get('score', 0.5)
-                    assessment_factors.extend(result.get('factors', []))
-                elif i == 1:  # Company impact
-                    company_impact = result.get('score', 0.5)
-                    assessment_factors.extend(result.get('factors', []))
-                elif i == 2:  # Time sensitivity
-                    time_sensitivity = result.get('score', 0.5)
-                    assessment_factors.extend(result.get('factors', []))
-                elif i == 3:  # Stakeholder impact
-                    stakeholder_impact = result.get('score', 0.5)
-                    assessment_factors.extend(result.get('factors', []))
+            entity_stats = self._classify_entities(entities)
+            market_hours_score = self._assess_market_hours_impact(event.published_at)
+            market_impact, company_impact, time_sensitivity, stakeholder_impact, assessment_factors = (
+                self._compute_subscores(event, entity_stats, market_hours_score)
+            )
             
             # Calculate overall severity score
             overall_severity = self._calculate_overall_severity(
@@ -83,15 +211,17 @@ class SeverityAssessor:
             
             # Determine severity and urgency levels
             severity_level = self._determine_severity_level(overall_severity)
-            urgency_level = self._determine_urgency_level(time_sensitivity, overall_severity, event)
+            urgency_level = self._determine_urgency_level(
+                time_sensitivity, overall_severity, event, market_hours_score
+            )
             
             # Calculate confidence based on assessment quality
             confidence = self._calculate_assessment_confidence(
-                market_impact, company_impact, time_sensitivity, stakeholder_impact, entities
+                market_impact, company_impact, time_sensitivity, stakeholder_impact, entity_stats
             )
             
             # Generate reasoning
-            reasoning = await self._generate_reasoning(
+            reasoning = self._generate_reasoning(
                 event, market_impact, company_impact, time_sensitivity, stakeholder_impact
             )
             
@@ -104,7 +234,7 @@ class SeverityAssessor:
                 stakeholder_impact_score=stakeholder_impact,
                 overall_severity_score=overall_severity,
                 confidence=confidence,
-                assessment_factors=assessment_factors[:10],  # Limit factors
+                assessment_factors=assessment_factors,
                 reasoning=reasoning
             )
             
@@ -121,222 +251,314 @@ class SeverityAssessor:
                         error=str(e), 
                         event_id=event.event_id)
             
-            # Return default assessment
-            return SeverityAssessment(
-                severity=EventSeverity.MEDIUM,
-                urgency=EventUrgency.NORMAL,
-                market_impact_score=0.5,
-                company_impact_score=0.5,
-                time_sensitivity_score=0.5,
-                stakeholder_impact_score=0.5,
-                overall_severity_score=0.5,
-                confidence=0.5,
-                assessment_factors=["default_assessment"],
-                reasoning="Assessment failed, using default severity"
-            )
+            return self._default_assessment()
     
-    async def _assess_market_impact(self, event: NewsEvent, entities: List[Entity]) -> Dict[str, Any]:
-        """Assess potential market impact"""
-        score = 0.5
-        factors = []
+    async def assess_severity_batch(
+        self, 
+        events: List[NewsEvent], 
+        entities_per_event: List[List[Entity]]
+    ) -> List[SeverityAssessment]:
+        """Assess a batch of events, combining subscores in vectorized form"""
+        n = len(events)
+        logger.info("Assessing event severity batch", count=n)
+        
+        if n == 0:
+            return []
+        
+        # Per-event text/entity analysis stays in Python; numeric inputs go to arrays
+        subscores = np.full((n, 4), 0.5)
+        severity_modifiers = np.ones(n)
+        urgency_multipliers = np.ones(n)
+        has_confident_entity = np.zeros(n, dtype=bool)
+        failed = np.zeros(n, dtype=bool)
+        factors_per_event: List[List[str]] = []
+        
+        for i, (event, entities) in enumerate(zip(events, entities_per_event)):
+            try:
+                entity_stats = self._classify_entities(entities)
+                market_hours_score = self._assess_market_hours_impact(event.published_at)
+                *scores, factors = self._compute_subscores(event, entity_stats, market_hours_score)
+                subscores[i] = scores
+                if event.classification:
+                    severity_modifiers[i] = self._get_event_type_severity_modifier(event.classification.event_type)
+                if event.published_at:
+                    urgency_multipliers[i] = 0.8 + market_hours_score * 0.2
+                has_confident_entity[i] = entity_stats.has_high_confidence
+                factors_per_event.append(factors)
+            except Exception as e:
+                logger.error("Severity assessment failed", error=str(e), event_id=event.event_id)
+                failed[i] = True
+                factors_per_event.append([])
+        
+        # Overall severity, urgency and confidence in one compiled pass
+        overall, urgency, confidence = combine_scores(
+            subscores, self._sev_w_arr, severity_modifiers, urgency_multipliers, has_confident_entity
+        )
+        severity_idx = np.searchsorted(self._SEV_THR, overall, side='right')
+        urgency_idx = np.searchsorted(self._URG_THR, urgency, side='right')
+        
+        assessments = []
+        for i, event in enumerate(events):
+            if failed[i]:
+                assessments.append(self._default_assessment())
+                continue
+            
+            market_impact, company_impact, time_sensitivity, stakeholder_impact = subscores[i].tolist()
+            assessments.append(SeverityAssessment(
+                severity=self._SEV_LVL[severity_idx[i]],
+                urgency=self._URG_LVL[urgency_idx[i]],
+                market_impact_score=market_impact,
+                company_impact_score=company_impact,
+                time_sensitivity_score=time_sensitivity,
+                stakeholder_impact_score=stakeholder_impact,
+                overall_severity_score=float(overall[i]),
+                confidence=float(confidence[i]),
+                assessment_factors=factors_per_event[i],
+                reasoning=self._generate_reasoning(
+                    event, market_impact, company_impact, time_sensitivity, stakeholder_impact
+                )
+            ))
         
+        logger.info("Severity batch assessment completed", count=n, failed=int(failed.sum()))
+        
+        return assessments
+    
+    def _compute_subscores(
+        self, 
+        event: NewsEvent, 
+        entity_stats: EntityStats,
+        market_hours_score: float
+    ) -> Tuple[float, float, float, float, List[str]]:
+        """Run the four assessments and return their scores plus combined factors"""
+        # Keyword hits and financial metrics from a single pass over the text;
+        # events with neither title nor content have nothing to scan
+        if event.title or event.content:
+            keyword_hits, financial_score = self._analyze_text(f"{event.title or ''} {event.content or ''}".lower())
+        else:
+            keyword_hits, financial_score = _NO_KEYWORD_HITS, 0.0
+        
+        # Multiple assessment approaches (pure CPU work, run inline)
+        results = [
+            self._run_assessment("market_impact", self._assess_market_impact, event, entity_stats, keyword_hits, financial_score),
+            self._run_assessment("company_impact", self._assess_company_impact, event, entity_stats, keyword_hits),
+            self._run_assessment("time_sensitivity", self._assess_time_sensitivity, event, keyword_hits, market_hours_score),
+            self._run_assessment("stakeholder_impact", self._assess_stakeholder_impact, event, keyword_hits)
+        ]
+        
+        # Process results
+        market_impact, company_impact, time_sensitivity, stakeholder_impact = (
+            result.get('score', 0.5) for result in results
+        )
+        
+        # Keep the first MAX_ASSESSMENT_FACTORS factors without building the full list
+        assessment_factors = list(islice(
+            chain.from_iterable(result.get('factors', ()) for result in results),
+            MAX_ASSESSMENT_FACTORS
+        ))
+        
+        return market_impact, company_impact, time_sensitivity, stakeholder_impact, assessment_factors
+    
+    def _default_assessment(self) -> SeverityAssessment:
+        """Fallback assessment used when scoring fails"""
+        return SeverityAssessment(
+            severity=EventSeverity.MEDIUM,
+            urgency=EventUrgency.NORMAL,
+            market_impact_score=0.5,
+            company_impact_score=0.5,
+            time_sensitivity_score=0.5,
+            stakeholder_impact_score=0.5,
+            overall_severity_score=0.5,
+            confidence=0.5,
+            assessment_factors=["default_assessment"],
+            reasoning="Assessment failed, using default severity"
+        )
+    
+    def _classify_entities(self, entities: List[Entity]) -> EntityStats:
+        """Classify entities once for the market, company and confidence assessments"""
+        stats = EntityStats(entity_count=len(entities))
+        
+        for entity in entities:
+            entity_type = entity.entity_type
+            is_mega = entity.ticker_symbol in self._MEGA_TICKERS
+            
+            if entity.confidence > 0.8:
+                stats.has_high_confidence = True
+            
+            # Market impact weighting
+            if entity_type == 'TICKER':
+                stats.major_entity_weight += 2 if is_mega else 1  # Mega-cap stocks count double
+            elif entity_type in _ORG_ENTITY_TYPES:
+                if entity.market_cap and entity.market_cap.endswith(('B', 'T')):
+                    stats.major_entity_weight += 1
+            
+            # Company impact: the last major company seen sets the factor
+            if entity_type in _COMPANY_ENTITY_TYPES:
+                stats.company_count += 1
+                if entity.market_cap and entity.market_cap.endswith('B'):  # Billion+ market cap
+                    stats.major_company_factor = 0.8
+                    stats.company_factors.append(f"Major company: {entity.entity_value}")
+                elif is_mega:
+                    stats.major_company_factor = 0.9
+                    stats.company_factors.append(f"Mega-cap company: {entity.entity_value}")
+        
+        return stats
+    
+    def _run_assessment(self, name: str, assess, *args) -> Dict[str, Any]:
+        """Run a single assessment, falling back to a neutral result on failure"""
         try:
-            text = f"{event.title} {event.content}".lower()
-            
-            # Check for high-impact keywords
-            high_impact_keywords = self.market_impact_keywords.get('high', [])
-            medium_impact_keywords = self.market_impact_keywords.get('medium', [])
-            
-            high_matches = sum(1 for keyword in high_impact_keywords if keyword in text)
-            medium_matches = sum(1 for keyword in medium_impact_keywords if keyword in text)
-            
-            # Base score from keywords
-            keyword_score = min(1.0, (high_matches * 0.3 + medium_matches * 0.15))
-            
-            # Event type factor
-            event_type_score = self._get_event_type_market_impact(event.classification.event_type if event.classification else None)
-            
-            # Entity-based impact (tickers, large companies)
-            entity_score = self._assess_entity_market_impact(entities)
-            
-            # Financial metrics factor
-            financial_score = self._assess_financial_metrics_impact(text)
-            
-            # Combine scores
-            scores = [keyword_score, event_type_score, entity_score, financial_score]
-            weights = [0.3, 0.3, 0.25, 0.15]
-            
-            score = sum(s * w for s, w in zip(scores, weights))
-            
-            # Add assessment factors
-            if high_matches > 0:
-                factors.append(f"High-impact keywords: {high_matches}")
-            if event_type_score > 0.7:
-                factors.append("High-impact event type")
-            if entity_score > 0.7:
-                factors.append("Major market entities involved")
-            if financial_score > 0.7:
-                factors.append("Significant financial metrics")
-            
+            return assess(*args)
         except Exception as e:
-            logger.error("Market impact assessment failed", error=str(e))
+            logger.error("Assessment task failed", task=name, error=str(e))
+            return {'score': 0.5, 'factors': []}
+    
+    def _assess_market_impact(
+        self, 
+        event: NewsEvent, 
+        entity_stats: EntityStats, 
+        keyword_hits: Dict[str, FrozenSet[str]],
+        financial_score: float
+    ) -> Dict[str, Any]:
+        """Assess potential market impact"""
+        factors = []
+        
+        # Check for high-impact keywords
+        high_matches = len(keyword_hits.get('market_high', frozenset()))
+        medium_matches = len(keyword_hits.get('market_medium', frozenset()))
+        
+        # Base score from keywords
+        keyword_score = min(1.0, (high_matches * 0.3 + medium_matches * 0.15))
+        
+        # Event type factor
+        event_type_score = self._get_event_type_market_impact(event.classification.event_type if event.classification else None)
+        
+        # Entity-based impact (tickers, large companies)
+        entity_score = self._assess_entity_market_impact(entity_stats)
+        
+        # Combine scores
+        scores = [keyword_score, event_type_score, entity_score, financial_score]
+        weights = [0.3, 0.3, 0.25, 0.15]
+        
+        score = sum(s * w for s, w in zip(scores, weights))
+        
+        # Add assessment factors
+        if high_matches > 0:
+            factors.append(f"High-impact keywords: {high_matches}")
+        if event_type_score > 0.7:
+            factors.append("High-impact event type")
+        if entity_score > 0.7:
+            factors.append("Major market entities involved")
+        if financial_score > 0.7:
+            factors.append("Significant financial metrics")
         
         return {'score': score, 'factors': factors}
     
-    async def _assess_company_impact(self, event: NewsEvent, entities: List[Entity]) -> Dict[str, Any]:
+    def _assess_company_impact(
+        self, 
+        event: NewsEvent, 
+        entity_stats: EntityStats, 
+        keyword_hits: Dict[str, FrozenSet[str]]
+    ) -> Dict[str, Any]:
         """Assess company-specific impact"""
-        score = 0.5
         factors = []
         
-        try:
-            text = f"{event.title} {event.content}".lower()
-            
-            # Check for company-specific impact indicators
-            company_indicators = [
-                ('earnings', 0.8), ('revenue', 0.7), ('profit', 0.7), ('loss', 0.7),
-                ('guidance', 0.6), ('outlook', 0.5), ('restructuring', 0.8),
-                ('layoffs', 0.7), ('expansion', 0.6), ('acquisition', 0.8),
-                ('merger', 0.8), ('partnership', 0.5), ('ipo', 0.9),
-                ('bankruptcy', 1.0), ('lawsuit', 0.6), ('investigation', 0.7)
-            ]
-            
-            max_impact = 0.0
-            for indicator, impact in company_indicators:
-                if indicator in text:
-                    max_impact = max(max_impact, impact)
+        # Check for company-specific impact indicators
+        indicator_hits = keyword_hits.get('company', frozenset())
+        
+        # Indicators are ordered by impact, so the first hit is the maximum
+        max_impact = 0.0
+        if indicator_hits:
+            for indicator, impact in self.company_indicators:
+                if indicator in indicator_hits:
+                    max_impact = impact
                     factors.append(f"Company indicator: {indicator}")
+                    break
+        
+        # Entity-based company impact
+        if entity_stats.company_count:
+            # More entities = potentially broader impact
+            entity_factor = min(1.0, entity_stats.company_count / 5.0)
             
-            # Entity-based company impact
-            company_entities = [e for e in entities if e.entity_type in ['COMPANY', 'ORG', 'TICKER']]
-            
-            if company_entities:
-                # More entities = potentially broader impact
-                entity_factor = min(1.0, len(company_entities) / 5.0)
-                
-                # Check for major companies (by market cap if available)
-                major_company_factor = 0.0
-                for entity in company_entities:
-                    if entity.market_cap and 'B' in entity.market_cap:  # Billion+ market cap
-                        major_company_factor = 0.8
-                        factors.append(f"Major company: {entity.entity_value}")
-                    elif entity.ticker_symbol in ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA']:
-                        major_company_factor = 0.9
-                        factors.append(f"Mega-cap company: {entity.entity_value}")
-                
-                entity_score = (entity_factor + major_company_factor) / 2
-            else:
-                entity_score = 0.3  # Low impact if no clear company entities
-            
-            # Combine scores
-            score = max(max_impact, entity_score)
+            # Major companies (by market cap if available)
+            factors.extend(entity_stats.company_factors)
             
-        except Exception as e:
-            logger.error("Company impact assessment failed", error=str(e))
+            entity_score = (entity_factor + entity_stats.major_company_factor) / 2
+        else:
+            entity_score = 0.3  # Low impact if no clear company entities
+        
+        # Combine scores
+        score = max(max_impact, entity_score)
         
         return {'score': score, 'factors': factors}
     
-    async def _assess_time_sensitivity(self, event: NewsEvent) -> Dict[str, Any]:
+    def _assess_time_sensitivity(
+        self, 
+        event: NewsEvent, 
+        keyword_hits: Dict[str, FrozenSet[str]], 
+        market_hours_score: float
+    ) -> Dict[str, Any]:
         """Assess time sensitivity and urgency"""
-        score = 0.5
         factors = []
         
-        try:
-            text = f"{event.title} {event.content}".lower()
-            
-            # Time-sensitive keywords
-            urgent_keywords = [
-                'breaking', 'urgent', 'alert', 'immediate', 'emergency',
-                'halt', 'suspend', 'stop', 'pause', 'crisis'
-            ]
-            
-            time_keywords = [
-                'today', 'now', 'just', 'moments ago', 'minutes ago',
-                'this morning', 'this afternoon', 'developing'
-            ]
-            
-            # Check for urgency indicators
-            urgent_matches = sum(1 for keyword in urgent_keywords if keyword in text)
-            time_matches = sum(1 for keyword in time_keywords if keyword in text)
-            
-            keyword_score = min(1.0, urgent_matches * 0.4 + time_matches * 0.2)
-            
-            # Publication recency
-            now = datetime.now()
-            if event.published_at:
-                time_diff = now - event.published_at
-                
-                if time_diff <= timedelta(hours=1):
-                    recency_score = 1.0
-                    factors.append("Published within 1 hour")
-                elif time_diff <= timedelta(hours=4):
-                    recency_score = 0.8
-                    factors.append("Published within 4 hours")
-                elif time_diff <= timedelta(hours=24):
-                    recency_score = 0.6
-                    factors.append("Published within 24 hours")
-                else:
-                    recency_score = 0.3
+        # Check for urgency indicators
+        urgent_matches = len(keyword_hits.get('urgent', frozenset()))
+        time_matches = len(keyword_hits.get('time', frozenset()))
+        
+        keyword_score = min(1.0, urgent_matches * 0.4 + time_matches * 0.2)
+        
+        # Publication recency
+        now = datetime.now()
+        if event.published_at:
+            time_diff = now - event.published_at
+            
+            if time_diff <= timedelta(hours=1):
+                recency_score = 1.0
+                factors.append("Published within 1 hour")
+            elif time_diff <= timedelta(hours=4):
+                recency_score = 0.8
+                factors.append("Published within 4 hours")
+            elif time_diff <= timedelta(hours=24):
+                recency_score = 0.6
+                factors.append("Published within 24 hours")
             else:
-                recency_score = 0.5
-            
-            # Market hours consideration
-            market_hours_score = self._assess_market_hours_impact(event.published_at)
-            
-            # Combine scores
-            score = max(keyword_score, (recency_score + market_hours_score) / 2)
-            
-            if urgent_matches > 0:
-                factors.append(f"Urgent keywords: {urgent_matches}")
-            if time_matches > 0:
-                factors.append(f"Time-sensitive keywords: {time_matches}")
-            
-        except Exception as e:
-            logger.error("Time sensitivity assessment failed", error=str(e))
+                recency_score = 0.3
+        else:
+            recency_score = 0.5
+        
+        # Combine scores (market hours score is computed once per event by the caller)
+        score = max(keyword_score, (recency_score + market_hours_score) / 2)
+        
+        if urgent_matches > 0:
+            factors.append(f"Urgent keywords: {urgent_matches}")
+        if time_matches > 0:
+            factors.append(f"Time-sensitive keywords: {time_matches}")
         
         return {'score': score, 'factors': factors}
     
-    async def _assess_stakeholder_impact(self, event: NewsEvent, entities: List[Entity]) -> Dict[str, Any]:
+    def _assess_stakeholder_impact(self, event: NewsEvent, keyword_hits: Dict[str, FrozenSet[str]]) -> Dict[str, Any]:
         """Assess impact on various stakeholders"""
-        score = 0.5
         factors = []
         
-        try:
-            text = f"{event.title} {event.content}".lower()
-            
-            # Stakeholder groups
-            stakeholder_indicators = {
-                'investors': ['investor', 'shareholder', 'stock', 'share', 'dividend', 'return'],
-                'customers': ['customer', 'consumer', 'user', 'client', 'subscriber'],
-                'employees': ['employee', 'worker', 'staff', 'layoff', 'hiring', 'job'],
-                'regulators': ['sec', 'fda', 'ftc', 'regulatory', 'compliance', 'investigation'],
-                'partners': ['partner', 'supplier', 'vendor', 'alliance', 'collaboration'],
-                'competitors': ['competitor', 'rival', 'competition', 'market share']
-            }
-            
-            affected_stakeholders = []
-            max_impact = 0.0
-            
-            for stakeholder, keywords in stakeholder_indicators.items():
-                matches = sum(1 for keyword in keywords if keyword in text)
-                if matches > 0:
-                    affected_stakeholders.append(stakeholder)
-                    # Different stakeholder types have different impact weights
-                    weight = 0.8 if stakeholder in ['investors', 'regulators'] else 0.6
-                    impact = min(1.0, matches * 0.2) * weight
-                    max_impact = max(max_impact, impact)
-            
-            # Broad stakeholder impact increases severity
-            if len(affected_stakeholders) > 3:
-                score = min(1.0, max_impact + 0.2)
-                factors.append(f"Multiple stakeholder groups affected: {len(affected_stakeholders)}")
-            else:
-                score = max_impact
-            
-            if affected_stakeholders:
-                factors.append(f"Stakeholders: {', '.join(affected_stakeholders)}")
-            
-        except Exception as e:
-            logger.error("Stakeholder impact assessment failed", error=str(e))
+        affected_stakeholders = []
+        max_impact = 0.0
+        
+        for stakeholder in self.stakeholder_indicators:
+            matches = len(keyword_hits.get(f'stakeholder:{stakeholder}', frozenset()))
+            if matches > 0:
+                affected_stakeholders.append(stakeholder)
+                # Different stakeholder types have different impact weights
+                weight = 0.8 if stakeholder in ['investors', 'regulators'] else 0.6
+                impact = min(1.0, matches * 0.2) * weight
+                max_impact = max(max_impact, impact)
+        
+        # Broad stakeholder impact increases severity
+        if len(affected_stakeholders) > 3:
+            score = min(1.0, max_impact + 0.2)
+            factors.append(f"Multiple stakeholder groups affected: {len(affected_stakeholders)}")
+        else:
+            score = max_impact
+        
+        if affected_stakeholders:
+            factors.append(f"Stakeholders: {', '.join(affected_stakeholders)}")
         
         return {'score': score, 'factors': factors}
     
@@ -351,12 +573,12 @@ class SeverityAssessor:
         """Calculate overall severity score"""
         
         # Base weighted score
-        weights = self.severity_weights
+        wm, wc, wt, ws = self._sev_w
         base_score = (
-            market_impact * weights['market_impact'] +
-            company_impact * weights['company_impact'] +
-            time_sensitivity * weights['time_sensitivity'] +
-            stakeholder_impact * weights['stakeholder_impact']
+            market_impact * wm +
+            company_impact * wc +
+            time_sensitivity * wt +
+            stakeholder_impact * ws
         )
         
         # Event type modifier
@@ -369,22 +591,14 @@ class SeverityAssessor:
     
     def _determine_severity_level(self, overall_score: float) -> EventSeverity:
         """Convert numeric score to severity level"""
-        if overall_score >= 0.9:
-            return EventSeverity.CRITICAL
-        elif overall_score >= 0.7:
-            return EventSeverity.HIGH
-        elif overall_score >= 0.5:
-            return EventSeverity.MEDIUM
-        elif overall_score >= 0.3:
-            return EventSeverity.LOW
-        else:
-            return EventSeverity.INFO
+        return self._SEV_LVL[bisect.bisect_right(self._SEV_THR, overall_score)]
     
     def _determine_urgency_level(
         self, 
         time_sensitivity: float, 
         overall_severity: float, 
-        event: NewsEvent
+        event: NewsEvent,
+        market_hours_score: float
     ) -> EventUrgency:
         """Determine urgency level based on time sensitivity and severity"""
         
@@ -393,19 +607,9 @@ class SeverityAssessor:
         
         # Market hours consideration
         if event.published_at:
-            market_hours_factor = self._assess_market_hours_impact(event.published_at)
-            urgency_score *= (0.8 + market_hours_factor * 0.2)
-        
-        if urgency_score >= 0.9:
-            return EventUrgency.IMMEDIATE
-        elif urgency_score >= 0.7:
-            return EventUrgency.HIGH
-        elif urgency_score >= 0.4:
-            return EventUrgency.NORMAL
-        elif urgency_score >= 0.2:
-            return EventUrgency.LOW
-        else:
-            return EventUrgency.BATCH
+            urgency_score *= (0.8 + market_hours_score * 0.2)
+        
+        return self._URG_LVL[bisect.bisect_right(self._URG_THR, urgency_score)]
     
     def _calculate_assessment_confidence(
         self,
@@ -413,7 +617,7 @@ class SeverityAssessor:
         company_impact: float, 
         time_sensitivity: float,
         stakeholder_impact: float,
-        entities: List[Entity]
+        entity_stats: EntityStats
     ) -> float:
         """Calculate confidence in the assessment"""
         
@@ -421,14 +625,18 @@ class SeverityAssessor:
         confidence_factors = []
         
         # Clear entity identification increases confidence
-        if entities:
-            high_confidence_entities = [e for e in entities if e.confidence > 0.8]
-            if high_confidence_entities:
-                confidence_factors.append(0.2)
+        if entity_stats.has_high_confidence:
+            confidence_factors.append(0.2)
         
         # Consistent scores across dimensions
-        scores = [market_impact, company_impact, time_sensitivity, stakeholder_impact]
-        score_variance = np.var(scores)
+        scores = (market_impact, company_impact, time_sensitivity, stakeholder_impact)
+        mean = (market_impact + company_impact + time_sensitivity + stakeholder_impact) * 0.25
+        score_variance = (
+            (market_impact - mean) ** 2 +
+            (company_impact - mean) ** 2 +
+            (time_sensitivity - mean) ** 2 +
+            (stakeholder_impact - mean) ** 2
+        ) * 0.25
         
         if score_variance < 0.1:  # Low variance = consistent assessment
             confidence_factors.append(0.15)
@@ -444,7 +652,7 @@ class SeverityAssessor:
         
         return min(1.0, base_confidence + bonus_confidence)
     
-    async def _generate_reasoning(
+    def _generate_reasoning(
         self,
         event: NewsEvent,
         market_impact: float,
@@ -492,57 +700,19 @@ class SeverityAssessor:
         if not event_type:
             return 0.5
         
-        impact_scores = {
-            EventType.BREAKING_NEWS: 0.9,
-            EventType.EARNINGS_ANNOUNCEMENT: 0.8,
-            EventType.MERGER_ACQUISITION: 0.9,
-            EventType.REGULATORY_UPDATE: 0.7,
-            EventType.MARKET_MOVEMENT: 0.8,
-            EventType.ECONOMIC_INDICATOR: 0.7,
-            EventType.ANALYST_UPGRADE: 0.6,
-            EventType.ANALYST_DOWNGRADE: 0.6,
-            EventType.IPO_NEWS: 0.7,
-            EventType.BANKRUPTCY: 1.0,
-            EventType.EXECUTIVE_CHANGE: 0.5,
-            EventType.PRODUCT_LAUNCH: 0.4,
-            EventType.GENERAL_NEWS: 0.3
-        }
-        
-        return impact_scores.get(event_type, 0.5)
+        return _EVENT_TYPE_MARKET_IMPACT.get(event_type, 0.5)
     
     def _get_event_type_severity_modifier(self, event_type: EventType) -> float:
         """Get severity modifier based on event type"""
-        modifiers = {
-            EventType.BREAKING_NEWS: 1.2,
-            EventType.BANKRUPTCY: 1.3,
-            EventType.MERGER_ACQUISITION: 1.1,
-            EventType.EARNINGS_ANNOUNCEMENT: 1.1,
-            EventType.REGULATORY_UPDATE: 1.1,
-            EventType.IPO_NEWS: 1.1,
-            EventType.GENERAL_NEWS: 0.9,
-            EventType.PRODUCT_LAUNCH: 0.9
-        }
-        
-        return modifiers.get(event_type, 1.0)
+        return _EVENT_TYPE_SEVERITY_MODIFIER.get(event_type, 1.0)
     
-    def _assess_entity_market_impact(self, entities: List[Entity]) -> float:
+    def _assess_entity_market_impact(self, entity_stats: EntityStats) -> float:
         """Assess market impact based on entities involved"""
-        if not entities:
+        if not entity_stats.entity_count:
             return 0.3
         
         # Major companies and tickers have higher impact
-        major_entities = 0
-        total_entities = len(entities)
-        
-        for entity in entities:
-            if entity.entity_type == 'TICKER':
-                if entity.ticker_symbol in ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'TSLA', 'META', 'NVDA']:
-                    major_entities += 2  # Mega-cap stocks
-                else:
-                    major_entities += 1
-            elif entity.entity_type in ['COMPANY', 'ORG']:
-                if entity.market_cap and ('B' in entity.market_cap or 'T' in entity.market_cap):
-                    major_entities += 1
+        major_entities = entity_stats.major_entity_weight
         
         # Calculate impact score
         if major_entities >= 3:
@@ -556,18 +726,38 @@ class SeverityAssessor:
     
     def _assess_financial_metrics_impact(self, text: str) -> float:
         """Assess impact based on financial metrics mentioned"""
-        high_impact_metrics = [
-            r'\$\d+\.?\d*\s*billion', r'\$\d+\.?\d*b\b', 
-            r'\d+%\s*(?:increase|decrease|drop|rise)',
-            r'eps.*\$\d+\.\d+', r'revenue.*\$\d+\.?\d*\s*(?:billion|million)'
-        ]
+        # Every metric pattern needs a '$' or '%'; most headlines have neither
+        if '$' not in text and '%' not in text:
+            return 0.0
         
-        matches = 0
-        for pattern in high_impact_metrics:
-            matches += len(re.findall(pattern, text, re.IGNORECASE))
+        # Score saturates at _FIN_METRIC_SATURATION matches; stop scanning there
+        matches = sum(1 for _ in islice(self._fin_metric_re.finditer(text), _FIN_METRIC_SATURATION))
         
         return min(1.0, matches * 0.3)
     
+    def _analyze_text(self, text: str) -> Tuple[Dict[str, FrozenSet[str]], float]:
+        """Keyword hits and financial metric score for text, memoized by content hash"""
+        key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        cached = self._text_cache.get(key)
+        if cached is None:
+            # Frozen so callers sharing a cached entry cannot mutate it
+            hits = {k: frozenset(v) for k, v in self._scan_keywords(text).items()}
+            cached = (hits, self._assess_financial_metrics_impact(text))
+            self._text_cache[key] = cached
+        
+        return cached
+    
+    def _scan_keywords(self, text: str) -> Dict[str, Set[str]]:
+        """Collect distinct keyword hits per category in a single pass over text"""
+        keyword_hits: Dict[str, Set[str]] = defaultdict(set)
+        
+        # O(len(text) + matches) regardless of how many keywords are registered
+        for _, (keyword, categories) in self._keyword_automaton.iter(text):
+            for category in categories:
+                keyword_hits[category].add(keyword)
+        
+        return keyword_hits
+    
     def _assess_market_hours_impact(self, published_at: Optional[datetime]) -> float:
         """Assess urgency based on market hours"""
         if not published_at:
@@ -585,45 +775,31 @@ class SeverityAssessor:
         else:  # Outside market hours
             return 0.5
     
-    def _load_severity_weights(self) -> Dict[str, float]:
-        """Load severity assessment weights"""
-        return {
-            'market_impact': 0.35,
-            'company_impact': 0.25,
-            'time_sensitivity': 0.25,
-            'stakeholder_impact': 0.15
-        }
-    
-    def _load_urgency_factors(self) -> Dict[str, float]:
-        """Load urgency assessment factors"""
-        return {
-            'breaking_news': 0.9,
-            'market_hours': 0.3,
-            'after_hours': 0.2,
-            'weekend': 0.1
-        }
-    
-    def _load_market_impact_keywords(self) -> Dict[str, List[str]]:
-        """Load market impact keywords"""
-        return {
-            'high': [
-                'bankruptcy', 'chapter 11', 'insolvency', 'default',
-                'merger', 'acquisition', 'takeover', 'buyout',
-                'earnings miss', 'earnings beat', 'guidance',
-                'fda approval', 'fda rejection', 'recall',
-                'investigation', 'lawsuit', 'settlement',
-                'ceo', 'resignation', 'fired', 'stepping down',
-                'halt', 'suspend', 'delisted'
-            ],
-            'medium': [
-                'revenue', 'profit', 'loss', 'sales',
-                'upgrade', 'downgrade', 'target',
-                'partnership', 'agreement', 'contract',
-                'expansion', 'growth', 'decline',
-                'announcement', 'launch', 'release'
-            ]
+    def _build_keyword_automaton(self) -> ahocorasick.Automaton:
+        """Build an Aho-Corasick automaton tagging each keyword with its categories"""
+        categories: Dict[str, Tuple[str, ...]] = {
+            'market_high': self.market_impact_keywords['high'],
+            'market_medium': self.market_impact_keywords['medium'],
+            'urgent': self.urgency_keywords['urgent'],
+            'time': self.urgency_keywords['time'],
+            'company': tuple(indicator for indicator, _ in self.company_indicators)
         }
+        for stakeholder, keywords in self.stakeholder_indicators.items():
+            categories[f'stakeholder:{stakeholder}'] = keywords
+        
+        # A keyword may feed several assessments (e.g. 'halt', 'investigation')
+        keyword_categories: Dict[str, List[str]] = defaultdict(list)
+        for category, keywords in categories.items():
+            for keyword in keywords:
+                keyword_categories[keyword].append(category)
+        
+        automaton = ahocorasick.Automaton()
+        for keyword, keyword_cats in keyword_categories.items():
+            automaton.add_word(keyword, (keyword, tuple(keyword_cats)))
+        automaton.make_automaton()
+        
+        return automaton
     
     async def close(self):
-        """Close HTTP client and cleanup resources"""
-        await self.http_client.aclose() 
\ No newline at end of file
+        """Cleanup resources (assessment is local; kept for processor lifecycle parity)"""
+        return 
\ No newline at end of file
@@ -4,11 +4,13 @@ Database Manager for Event Processor Service
 
 import asyncio
 import asyncpg
-import json
+import orjson
 import structlog
+import time
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Set, Tuple, Union
 from contextlib import asynccontextmanager
+from functools import lru_cache
 
 from ..models import (
     NewsEvent, ProcessingStatus, EventType, EventSeverity, EventUrgency,
@@ -17,13 +19,396 @@ from ..models import (
 
 logger = structlog.get_logger(__name__)
 
+
+def _jsonb_encode(value: Any) -> bytes:
+    """Encode a JSONB parameter in binary wire format (version byte + JSON text)"""
+    return b'\x01' + orjson.dumps(value)
+
+
+def _jsonb_decode(data: bytes) -> Any:
+    """Decode a binary JSONB value"""
+    return orjson.loads(data[1:])
+
+
+# Write buffer limits: flush when this many events are pending or after this long
+WRITE_BUFFER_MAX_EVENTS = 500
+WRITE_BUFFER_FLUSH_INTERVAL = 0.1  # seconds
+
+# Queued after the last event on shutdown; the flusher exits once it reaches it
+_FLUSH_STOP = object()
+
+# Relations search_events can hydrate, with the select-list column that loads each
+SEARCH_RELATIONS = {
+    'classification': """(SELECT to_jsonb(ec) FROM event_classifications ec
+        WHERE ec.event_id = pe.event_id LIMIT 1) AS classification_json""",
+    'entities': """(SELECT jsonb_agg(to_jsonb(ee)) FROM event_entities ee
+        WHERE ee.event_id = pe.event_id) AS entities_json"""
+}
+
+# Retention cleanup deletes at most this many events per statement, pausing in between
+CLEANUP_BATCH_SIZE = 5000
+CLEANUP_BATCH_PAUSE = 0.05  # seconds
+
+# Processing stats are approximate; serve repeated callers from memory for this long
+STATS_CACHE_TTL = 5.0  # seconds
+
+# Migrations under sql/migrations this module's queries depend on; startup fails until
+# the database has reached this version
+REQUIRED_SCHEMA_VERSION = 3
+
+_SQL_SCHEMA_VERSION = "SELECT COALESCE(MAX(version), 0) FROM event_processor_schema_migrations"
+
+# Ingest transactions commit without waiting for WAL flush. A crash can lose the last
+# few hundred milliseconds of stored events but never corrupts data; reads stay durable.
+_SQL_ASYNC_COMMIT = "SET LOCAL synchronous_commit = off"
+
+# Statements issued by store_event; module constants keep the text identical per call
+# so asyncpg's per-connection statement cache always hits
+_SQL_INSERT_EVENT = """
+    INSERT INTO processed_events (
+        event_id, article_id, source_id, title, content, summary, url,
+        published_at, discovered_at, author, status, processing_version,
+        created_at, updated_at, created_by, updated_by
+    ) VALUES (
+        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16
+    ) RETURNING event_id
+"""
+
+# Final pipeline write for an event stored earlier by store_event
+_SQL_COMPLETE_EVENT = """
+    UPDATE processed_events
+    SET status = $2, error_details = NULL, updated_at = $3
+    WHERE event_id = $1
+"""
+
+_SQL_INSERT_CLASSIFICATION = """
+    INSERT INTO event_classifications (
+        event_id, event_type, confidence, confidence_level,
+        primary_indicators, secondary_indicators, alternative_types,
+        reasoning, model_used, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+"""
+
+_SQL_INSERT_SEVERITY = """
+    INSERT INTO event_severity_assessments (
+        event_id, severity, urgency, market_impact_score,
+        company_impact_score, time_sensitivity_score, stakeholder_impact_score,
+        overall_severity_score, confidence, assessment_factors,
+        reasoning, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+"""
+
+_SQL_INSERT_ENTITY = """
+    INSERT INTO event_entities (
+        event_id, entity_id, entity_type, entity_value, confidence,
+        start_pos, end_pos, context, ticker_symbol, exchange,
+        sector, market_cap, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+"""
+
+_SQL_INSERT_ENRICHMENT = """
+    INSERT INTO event_enrichments (
+        event_id, sentiment_score, sentiment_label, emotion_scores,
+        language, readability_score, complexity_score, word_count,
+        sentence_count, paragraph_count, topics, keywords,
+        financial_metrics, price_targets, content_quality_score,
+        credibility_score, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
+"""
+
+_SQL_INSERT_ROUTING = """
+    INSERT INTO event_routing (
+        event_id, primary_destination, secondary_destinations,
+        routing_score, routing_criteria, portfolio_relevance,
+        affected_holdings, delivery_method, priority_level,
+        delivery_delay, expiry_time, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
+"""
+
+_SQL_INSERT_METRICS = """
+    INSERT INTO event_processing_metrics (
+        event_id, processing_start_time, processing_end_time,
+        total_processing_time, classification_time, enrichment_time,
+        routing_time, memory_usage, cpu_usage, processing_quality_score,
+        error_count, retry_count, created_at
+    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
+"""
+
+# Read path for the event API: the response document is assembled server-side with
+# exactly the NewsEvent field names, so it matches the endpoint's response model
+_SQL_EVENT_JSON = """
+    SELECT jsonb_build_object(
+        'event_id', pe.event_id,
+        'article_id', pe.article_id,
+        'source_id', pe.source_id,
+        'title', pe.title,
+        'content', pe.content,
+        'summary', pe.summary,
+        'url', pe.url,
+        'published_at', pe.published_at,
+        'discovered_at', pe.discovered_at,
+        'author', pe.author,
+        'status', pe.status,
+        'processing_version', pe.processing_version,
+        'error_details', pe.error_details,
+        'created_at', pe.created_at,
+        'updated_at', pe.updated_at,
+        'created_by', pe.created_by,
+        'updated_by', pe.updated_by,
+        'classification', (
+            SELECT jsonb_build_object(
+                'event_type', ec.event_type,
+                'confidence', ec.confidence,
+                'confidence_level', ec.confidence_level,
+                'primary_indicators', ec.primary_indicators,
+                'secondary_indicators', ec.secondary_indicators,
+                'alternative_types', ec.alternative_types,
+                'reasoning', ec.reasoning,
+                'model_used', ec.model_used
+            )
+            FROM event_classifications ec
+            WHERE ec.event_id = pe.event_id LIMIT 1
+        ),
+        'entities', COALESCE((
+            SELECT jsonb_agg(jsonb_build_object(
+                'entity_id', ee.entity_id,
+                'entity_type', ee.entity_type,
+                'entity_value', ee.entity_value,
+                'confidence', ee.confidence,
+                'start_pos', ee.start_pos,
+                'end_pos', ee.end_pos,
+                'context', ee.context,
+                'ticker_symbol', ee.ticker_symbol,
+                'exchange', ee.exchange,
+                'sector', ee.sector,
+                'market_cap', ee.market_cap
+            ))
+            FROM event_entities ee
+            WHERE ee.event_id = pe.event_id
+        ), '[]'::jsonb),
+        'severity_assessment', (
+            SELECT jsonb_build_object(
+                'severity', esa.severity,
+                'urgency', esa.urgency,
+                'market_impact_score', esa.market_impact_score,
+                'company_impact_score', esa.company_impact_score,
+                'time_sensitivity_score', esa.time_sensitivity_score,
+                'stakeholder_impact_score', esa.stakeholder_impact_score,
+                'overall_severity_score', esa.overall_severity_score,
+                'confidence', esa.confidence,
+                'assessment_factors', esa.assessment_factors,
+                'reasoning', esa.reasoning
+            )
+            FROM event_severity_assessments esa
+            WHERE esa.event_id = pe.event_id LIMIT 1
+        ),
+        'enrichment', (
+            SELECT jsonb_build_object(
+                'sentiment_score', een.sentiment_score,
+                'sentiment_label', een.sentiment_label,
+                'emotion_scores', een.emotion_scores,
+                'language', een.language,
+                'readability_score', een.readability_score,
+                'complexity_score', een.complexity_score,
+                'word_count', een.word_count,
+                'sentence_count', een.sentence_count,
+                'paragraph_count', een.paragraph_count,
+                'topics', een.topics,
+                'keywords', een.keywords,
+                'financial_metrics', een.financial_metrics,
+                'price_targets', een.price_targets,
+                'content_quality_score', een.content_quality_score,
+                'credibility_score', een.credibility_score
+            )
+            FROM event_enrichments een
+            WHERE een.event_id = pe.event_id LIMIT 1
+        ),
+        'routing', (
+            SELECT jsonb_build_object(
+                'primary_destination', er.primary_destination,
+                'secondary_destinations', er.secondary_destinations,
+                'routing_score', er.routing_score,
+                'routing_criteria', er.routing_criteria,
+                'portfolio_relevance', er.portfolio_relevance,
+                'affected_holdings', er.affected_holdings,
+                'delivery_method', er.delivery_method,
+                'priority_level', er.priority_level,
+                'delivery_delay', er.delivery_delay,
+                'expiry_time', er.expiry_time
+            )
+            FROM event_routing er
+            WHERE er.event_id = pe.event_id LIMIT 1
+        ),
+        'processing_metrics', (
+            SELECT jsonb_build_object(
+                'processing_start_time', epm.processing_start_time,
+                'processing_end_time', epm.processing_end_time,
+                'total_processing_time', epm.total_processing_time,
+                'classification_time', epm.classification_time,
+                'enrichment_time', epm.enrichment_time,
+                'routing_time', epm.routing_time,
+                'memory_usage', epm.memory_usage,
+                'cpu_usage', epm.cpu_usage,
+                'processing_quality_score', epm.processing_quality_score,
+                'error_count', epm.error_count,
+                'retry_count', epm.retry_count
+            )
+            FROM event_processing_metrics epm
+            WHERE epm.event_id = pe.event_id LIMIT 1
+        )
+    )::text
+    FROM processed_events pe
+    WHERE pe.event_id = $1
+"""
+
+_PROCESSING_STATS_SQL = """
+    WITH totals AS (
+        SELECT
+            COUNT(*) AS total_events,
+            COUNT(*) FILTER (WHERE created_at >= CURRENT_DATE) AS events_today,
+            COUNT(*) FILTER (WHERE status = 'failed' AND created_at >= CURRENT_DATE) AS error_count
+        FROM processed_events
+    ),
+    avg_time AS (
+        SELECT AVG(total_processing_time) AS avg_processing_time
+        FROM event_processing_metrics
+        WHERE total_processing_time IS NOT NULL
+    ),
+    status_dist AS (
+        SELECT jsonb_object_agg(status, count) AS status_distribution
+        FROM (
+            SELECT status, COUNT(*) AS count
+            FROM processed_events
+            GROUP BY status
+        ) s
+    ),
+    type_dist AS (
+        SELECT jsonb_object_agg(event_type, count) AS event_type_distribution
+        FROM (
+            SELECT ec.event_type, COUNT(*) AS count
+            FROM event_classifications ec
+            JOIN processed_events pe ON ec.event_id = pe.event_id
+            WHERE pe.created_at >= CURRENT_DATE - INTERVAL '7 days'
+            GROUP BY ec.event_type
+        ) t
+    ),
+    severity_dist AS (
+        SELECT jsonb_object_agg(severity, count) AS severity_distribution
+        FROM (
+            SELECT esa.severity, COUNT(*) AS count
+            FROM event_severity_assessments esa
+            JOIN processed_events pe ON esa.event_id = pe.event_id
+            WHERE pe.created_at >= CURRENT_DATE - INTERVAL '7 days'
+            GROUP BY esa.severity
+        ) v
+    )
+    SELECT *
+    FROM totals, avg_time, status_dist, type_dist, severity_dist
+"""
+
+# search_events / get_event_count filters, in parameter order, with their conditions
+_SEARCH_FILTERS = ('start_date', 'end_date', 'event_types', 'severity_levels', 'tickers')
+_FILTER_CONDITIONS = {
+    'start_date': "published_at >= $%d",
+    'end_date': "published_at <= $%d",
+    'event_types': """EXISTS (
+        SELECT 1 FROM event_classifications ec
+        WHERE ec.event_id = pe.event_id AND ec.event_type = ANY($%d)
+    )""",
+    'severity_levels': """EXISTS (
+        SELECT 1 FROM event_severity_assessments esa
+        WHERE esa.event_id = pe.event_id AND esa.severity = ANY($%d)
+    )""",
+    'tickers': """EXISTS (
+        SELECT 1 FROM event_entities ee
+        WHERE ee.event_id = pe.event_id AND ee.ticker_symbol = ANY($%d)
+    )"""
+}
+
+
+@lru_cache(maxsize=128)
+def _build_where(shape: Tuple[str, ...], keyword_count: int) -> Tuple[str, int]:
+    """Build the WHERE clause for a filter shape; returns it and the last parameter index"""
+    conditions = []
+    param_count = 0
+    
+    for name in shape:
+        param_count += 1
+        conditions.append(_FILTER_CONDITIONS[name] % param_count)
+    
+    if keyword_count:
+        keyword_conditions = []
+        for _ in range(keyword_count):
+            param_count += 1
+            keyword_conditions.append(f"(title ILIKE ${param_count} OR content ILIKE ${param_count})")
+        conditions.append(f"({' OR '.join(keyword_conditions)})")
+    
+    where_sql = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    return where_sql, param_count
+
+
+@lru_cache(maxsize=128)
+def _build_search_sql(
+    shape: Tuple[str, ...],
+    keyword_count: int,
+    use_keyset: bool,
+    sort_by: str,
+    sort_order: str,
+    relations: Tuple[str, ...]
+) -> str:
+    """Build the search_events page query for a query shape"""
+    where_sql, param_count = _build_where(shape, keyword_count)
+    
+    if use_keyset:
+        keyset_condition = (
+            f"(published_at, event_id) {'<' if sort_order == 'DESC' else '>'} "
+            f"(${param_count + 1}, ${param_count + 2})"
+        )
+        where_sql = f"{where_sql} AND {keyset_condition}" if where_sql else f"WHERE {keyset_condition}"
+        param_count += 2
+    
+    # Pagination
+    limit_clause = f"LIMIT ${param_count + 1}"
+    offset_clause = "" if use_keyset else f"OFFSET ${param_count + 2}"
+    
+    # Order by clause (event_id breaks ties so keyset pages are stable)
+    if sort_by == 'published_at':
+        order_clause = f"ORDER BY published_at {sort_order}, event_id {sort_order}"
+    else:
+        order_clause = f"ORDER BY {sort_by} {sort_order}"
+    
+    # Requested relations are aggregated server-side so the page costs one round-trip
+    relation_columns = "".join(f", {SEARCH_RELATIONS[name]}" for name in relations)
+    
+    return f"""
+        SELECT pe.*{relation_columns}
+        FROM processed_events pe
+        {where_sql}
+        {order_clause}
+        {limit_clause}
+        {offset_clause}
+    """
+
+
 class DatabaseManager:
     """Async PostgreSQL database manager for Event Processor"""
     
-    def __init__(self, connection_string: str):
+    def __init__(self, connection_string: str, min_pool_size: int = 10, max_pool_size: int = 50):
         self.connection_string = connection_string
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
         self.pool: Optional[asyncpg.Pool] = None
         
+        # Coalescing write buffer drained by a background flusher
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._buffer_full = asyncio.Event()
+        
+        # Short-lived processing stats cache
+        self._stats_cached: Optional[ProcessingStatsResponse] = None
+        self._stats_at = 0.0
+        self._stats_lock = asyncio.Lock()
+        
     async def initialize(self):
         """Initialize database connection pool"""
         try:
@@ -31,9 +416,12 @@ class DatabaseManager:
             
             self.pool = await asyncpg.create_pool(
                 self.connection_string,
-                min_size=5,
-                max_size=20,
+                min_size=self.min_pool_size,
+                max_size=self.max_pool_size,
                 command_timeout=60,
+                statement_cache_size=2048,  # mixed read/write workload; avoid evicting hot statements
+                max_inactive_connection_lifetime=300,
+                init=self._init_connection,
                 server_settings={
                     'application_name': 'event_processor',
                     'timezone': 'UTC'
@@ -44,35 +432,74 @@ class DatabaseManager:
             async with self.pool.acquire() as connection:
                 await connection.execute('SELECT 1')
             
+            await self._verify_schema()
+            
+            self._flush_task = asyncio.create_task(self._flusher())
+            
             logger.info("Database connection pool initialized successfully")
             
         except Exception as e:
             logger.error("Failed to initialize database connection pool", error=str(e))
             raise
     
+    async def _init_connection(self, conn: asyncpg.Connection):
+        """Exchange JSONB with Python objects directly, in binary form"""
+        await conn.set_type_codec(
+            'jsonb', 
+            schema='pg_catalog', 
+            encoder=_jsonb_encode, 
+            decoder=_jsonb_decode, 
+            format='binary'
+        )
+    
+    async def _verify_schema(self):
+        """Fail startup unless the database has the migrations this code needs"""
+        async with self.pool.acquire() as connection:
+            if await connection.fetchval("SELECT to_regclass('event_processor_schema_migrations')") is None:
+                version = 0
+            else:
+                version = await connection.fetchval(_SQL_SCHEMA_VERSION)
+        
+        if version < REQUIRED_SCHEMA_VERSION:
+            raise RuntimeError(
+                f"Database schema is at version {version} but the event processor needs "
+                f"{REQUIRED_SCHEMA_VERSION}; apply sql/migrations first"
+            )
+    
     @asynccontextmanager
-    async def get_connection(self):
-        """Get database connection from pool"""
+    async def get_connection(self, conn: Optional[asyncpg.Connection] = None):
+        """Get database connection from pool, or reuse the caller's connection"""
+        if conn is not None:
+            yield conn
+            return
+        
         if not self.pool:
             raise RuntimeError("Database pool not initialized")
         
         async with self.pool.acquire() as connection:
             yield connection
     
+    @asynccontextmanager
+    async def _read_snapshot(self, conn: asyncpg.Connection):
+        """Run multi-query reads on one read-only snapshot unless already in a transaction"""
+        if conn.is_in_transaction():
+            yield
+            return
+        
+        async with conn.transaction(isolation='repeatable_read', readonly=True):
+            yield
+    
     async def store_event(self, event: NewsEvent) -> str:
         """Store processed news event"""
         try:
-            async with self.get_connection() as conn:
+            # One timestamp for every row of this event
+            now = datetime.now()
+            
+            async with self.get_connection() as conn, conn.transaction():
+                await conn.execute(_SQL_ASYNC_COMMIT)
+                
                 # Insert main event record
-                event_id = await conn.fetchval("""
-                    INSERT INTO processed_events (
-                        event_id, article_id, source_id, title, content, summary, url,
-                        published_at, discovered_at, author, status, processing_version,
-                        created_at, updated_at, created_by, updated_by
-                    ) VALUES (
-                        $1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16
-                    ) RETURNING event_id
-                """, 
+                event_id = await conn.fetchval(_SQL_INSERT_EVENT,
                 event.event_id, event.article_id, event.source_id, event.title, 
                 event.content, event.summary, event.url, event.published_at, 
                 event.discovered_at, event.author, event.status.value, 
@@ -81,31 +508,18 @@ class DatabaseManager:
                 
                 # Store classification if available
                 if event.classification:
-                    await conn.execute("""
-                        INSERT INTO event_classifications (
-                            event_id, event_type, confidence, confidence_level,
-                            primary_indicators, secondary_indicators, alternative_types,
-                            reasoning, model_used, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
-                    """,
+                    await conn.execute(_SQL_INSERT_CLASSIFICATION,
                     event.event_id, event.classification.event_type.value,
                     event.classification.confidence, event.classification.confidence_level.value,
-                    json.dumps(event.classification.primary_indicators),
-                    json.dumps(event.classification.secondary_indicators),
-                    json.dumps(event.classification.alternative_types),
+                    event.classification.primary_indicators,
+                    event.classification.secondary_indicators,
+                    event.classification.alternative_types,
                     event.classification.reasoning, event.classification.model_used,
-                    datetime.now())
+                    now)
                 
                 # Store severity assessment if available
                 if event.severity_assessment:
-                    await conn.execute("""
-                        INSERT INTO event_severity_assessments (
-                            event_id, severity, urgency, market_impact_score,
-                            company_impact_score, time_sensitivity_score, stakeholder_impact_score,
-                            overall_severity_score, confidence, assessment_factors,
-                            reasoning, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                    """,
+                    await conn.execute(_SQL_INSERT_SEVERITY,
                     event.event_id, event.severity_assessment.severity.value,
                     event.severity_assessment.urgency.value,
                     event.severity_assessment.market_impact_score,
@@ -114,79 +528,52 @@ class DatabaseManager:
                     event.severity_assessment.stakeholder_impact_score,
                     event.severity_assessment.overall_severity_score,
                     event.severity_assessment.confidence,
-                    json.dumps(event.severity_assessment.assessment_factors),
-                    event.severity_assessment.reasoning, datetime.now())
+                    event.severity_assessment.assessment_factors,
+                    event.severity_assessment.reasoning, now)
                 
-                # Store entities if available
+                # Store entities if available (one Parse, one Bind/Execute per entity)
                 if event.entities:
-                    for entity in event.entities:
-                        await conn.execute("""
-                            INSERT INTO event_entities (
-                                event_id, entity_id, entity_type, entity_value, confidence,
-                                start_pos, end_pos, context, ticker_symbol, exchange,
-                                sector, market_cap, created_at
-                            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-                        """,
-                        event.event_id, entity.entity_id, entity.entity_type,
-                        entity.entity_value, entity.confidence, entity.start_pos,
-                        entity.end_pos, entity.context, entity.ticker_symbol,
-                        entity.exchange, entity.sector, entity.market_cap,
-                        datetime.now())
+                    await conn.executemany(_SQL_INSERT_ENTITY, [
+                        (event.event_id, entity.entity_id, entity.entity_type,
+                         entity.entity_value, entity.confidence, entity.start_pos,
+                         entity.end_pos, entity.context, entity.ticker_symbol,
+                         entity.exchange, entity.sector, entity.market_cap,
+                         now)
+                        for entity in event.entities
+                    ])
                 
                 # Store enrichment data if available
                 if event.enrichment:
-                    await conn.execute("""
-                        INSERT INTO event_enrichments (
-                            event_id, sentiment_score, sentiment_label, emotion_scores,
-                            language, readability_score, complexity_score, word_count,
-                            sentence_count, paragraph_count, topics, keywords,
-                            financial_metrics, price_targets, content_quality_score,
-                            credibility_score, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13, $14, $15, $16, $17)
-                    """,
+                    await conn.execute(_SQL_INSERT_ENRICHMENT,
                     event.event_id, event.enrichment.sentiment_score,
                     event.enrichment.sentiment_label,
-                    json.dumps(event.enrichment.emotion_scores),
+                    event.enrichment.emotion_scores,
                     event.enrichment.language, event.enrichment.readability_score,
                     event.enrichment.complexity_score, event.enrichment.word_count,
                     event.enrichment.sentence_count, event.enrichment.paragraph_count,
-                    json.dumps(event.enrichment.topics),
-                    json.dumps(event.enrichment.keywords),
-                    json.dumps(event.enrichment.financial_metrics),
-                    json.dumps(event.enrichment.price_targets),
+                    event.enrichment.topics,
+                    event.enrichment.keywords,
+                    event.enrichment.financial_metrics,
+                    event.enrichment.price_targets,
                     event.enrichment.content_quality_score,
-                    event.enrichment.credibility_score, datetime.now())
+                    event.enrichment.credibility_score, now)
                 
                 # Store routing decision if available
                 if event.routing:
-                    await conn.execute("""
-                        INSERT INTO event_routing (
-                            event_id, primary_destination, secondary_destinations,
-                            routing_score, routing_criteria, portfolio_relevance,
-                            affected_holdings, delivery_method, priority_level,
-                            delivery_delay, expiry_time, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                    """,
+                    await conn.execute(_SQL_INSERT_ROUTING,
                     event.event_id, event.routing.primary_destination,
-                    json.dumps(event.routing.secondary_destinations),
+                    event.routing.secondary_destinations,
                     event.routing.routing_score,
-                    json.dumps(event.routing.routing_criteria),
+                    event.routing.routing_criteria,
                     event.routing.portfolio_relevance,
-                    json.dumps(event.routing.affected_holdings),
+                    event.routing.affected_holdings,
                     event.routing.delivery_method, event.routing.priority_level,
                     event.routing.delivery_delay, event.routing.expiry_time,
-                    datetime.now())
+                    now)
                 
                 # Store processing metrics if available
                 if event.processing_metrics:
-                    await conn.execute("""
-                        INSERT INTO event_processing_metrics (
-                            event_id, processing_start_time, processing_end_time,
-                            total_processing_time, classification_time, enrichment_time,
-                            routing_time, memory_usage, cpu_usage, processing_quality_score,
-                            error_count, retry_count, created_at
-                        ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
-                    """,
+                    await conn.execute(_SQL_INSERT_METRICS,
                     event.event_id, event.processing_metrics.processing_start_time,
                     event.processing_metrics.processing_end_time,
                     event.processing_metrics.total_processing_time,
@@ -197,7 +584,7 @@ class DatabaseManager:
                     event.processing_metrics.cpu_usage,
                     event.processing_metrics.processing_quality_score,
                     event.processing_metrics.error_count,
-                    event.processing_metrics.retry_count, datetime.now())
+                    event.processing_metrics.retry_count, now)
                 
                 logger.info("Event stored successfully", event_id=event_id)
                 return event_id
@@ -206,10 +593,246 @@ class DatabaseManager:
             logger.error("Failed to store event", error=str(e), event_id=event.event_id)
             raise
     
-    async def get_event(self, event_id: str) -> Optional[NewsEvent]:
+    async def complete_events_bulk(self, events: List[NewsEvent]) -> int:
+        """Write the pipeline results of already-stored events using COPY
+        
+        The processed_events rows exist from store_event, so only the child rows are
+        inserted and each event's status is updated, all in one transaction.
+        """
+        if not events:
+            return 0
+        
+        try:
+            now = datetime.now()
+            
+            async with self.get_connection() as conn, conn.transaction():
+                await conn.execute(_SQL_ASYNC_COMMIT)
+                
+                await conn.executemany(_SQL_COMPLETE_EVENT, [
+                    (e.event_id, e.status.value, now) for e in events
+                ])
+                
+                classification_records = [
+                    (e.event_id, e.classification.event_type.value, e.classification.confidence,
+                     e.classification.confidence_level.value,
+                     e.classification.primary_indicators,
+                     e.classification.secondary_indicators,
+                     e.classification.alternative_types,
+                     e.classification.reasoning, e.classification.model_used, now)
+                    for e in events if e.classification
+                ]
+                if classification_records:
+                    await conn.copy_records_to_table(
+                        'event_classifications',
+                        columns=[
+                            'event_id', 'event_type', 'confidence', 'confidence_level',
+                            'primary_indicators', 'secondary_indicators', 'alternative_types',
+                            'reasoning', 'model_used', 'created_at'
+                        ],
+                        records=classification_records
+                    )
+                
+                severity_records = [
+                    (e.event_id, e.severity_assessment.severity.value,
+                     e.severity_assessment.urgency.value,
+                     e.severity_assessment.market_impact_score,
+                     e.severity_assessment.company_impact_score,
+                     e.severity_assessment.time_sensitivity_score,
+                     e.severity_assessment.stakeholder_impact_score,
+                     e.severity_assessment.overall_severity_score,
+                     e.severity_assessment.confidence,
+                     e.severity_assessment.assessment_factors,
+                     e.severity_assessment.reasoning, now)
+                    for e in events if e.severity_assessment
+                ]
+                if severity_records:
+                    await conn.copy_records_to_table(
+                        'event_severity_assessments',
+                        columns=[
+                            'event_id', 'severity', 'urgency', 'market_impact_score',
+                            'company_impact_score', 'time_sensitivity_score', 'stakeholder_impact_score',
+                            'overall_severity_score', 'confidence', 'assessment_factors',
+                            'reasoning', 'created_at'
+                        ],
+                        records=severity_records
+                    )
+                
+                entity_records = [
+                    (e.event_id, entity.entity_id, entity.entity_type, entity.entity_value,
+                     entity.confidence, entity.start_pos, entity.end_pos, entity.context,
+                     entity.ticker_symbol, entity.exchange, entity.sector, entity.market_cap, now)
+                    for e in events if e.entities
+                    for entity in e.entities
+                ]
+                if entity_records:
+                    await conn.copy_records_to_table(
+                        'event_entities',
+                        columns=[
+                            'event_id', 'entity_id', 'entity_type', 'entity_value', 'confidence',
+                            'start_pos', 'end_pos', 'context', 'ticker_symbol', 'exchange',
+                            'sector', 'market_cap', 'created_at'
+                        ],
+                        records=entity_records
+                    )
+                
+                enrichment_records = [
+                    (e.event_id, e.enrichment.sentiment_score, e.enrichment.sentiment_label,
+                     e.enrichment.emotion_scores, e.enrichment.language,
+                     e.enrichment.readability_score, e.enrichment.complexity_score,
+                     e.enrichment.word_count, e.enrichment.sentence_count,
+                     e.enrichment.paragraph_count, e.enrichment.topics,
+                     e.enrichment.keywords,
+                     e.enrichment.financial_metrics,
+                     e.enrichment.price_targets,
+                     e.enrichment.content_quality_score, e.enrichment.credibility_score, now)
+                    for e in events if e.enrichment
+                ]
+                if enrichment_records:
+                    await conn.copy_records_to_table(
+                        'event_enrichments',
+                        columns=[
+                            'event_id', 'sentiment_score', 'sentiment_label', 'emotion_scores',
+                            'language', 'readability_score', 'complexity_score', 'word_count',
+                            'sentence_count', 'paragraph_count', 'topics', 'keywords',
+                            'financial_metrics', 'price_targets', 'content_quality_score',
+                            'credibility_score', 'created_at'
+                        ],
+                        records=enrichment_records
+                    )
+                
+                routing_records = [
+                    (e.event_id, e.routing.primary_destination,
+                     e.routing.secondary_destinations, e.routing.routing_score,
+                     e.routing.routing_criteria, e.routing.portfolio_relevance,
+                     e.routing.affected_holdings, e.routing.delivery_method,
+                     e.routing.priority_level, e.routing.delivery_delay,
+                     e.routing.expiry_time, now)
+                    for e in events if e.routing
+                ]
+                if routing_records:
+                    await conn.copy_records_to_table(
+                        'event_routing',
+                        columns=[
+                            'event_id', 'primary_destination', 'secondary_destinations',
+                            'routing_score', 'routing_criteria', 'portfolio_relevance',
+                            'affected_holdings', 'delivery_method', 'priority_level',
+                            'delivery_delay', 'expiry_time', 'created_at'
+                        ],
+                        records=routing_records
+                    )
+                
+                metrics_records = [
+                    (e.event_id, e.processing_metrics.processing_start_time,
+                     e.processing_metrics.processing_end_time,
+                     e.processing_metrics.total_processing_time,
+                     e.processing_metrics.classification_time,
+                     e.processing_metrics.enrichment_time,
+                     e.processing_metrics.routing_time,
+                     e.processing_metrics.memory_usage, e.processing_metrics.cpu_usage,
+                     e.processing_metrics.processing_quality_score,
+                     e.processing_metrics.error_count, e.processing_metrics.retry_count, now)
+                    for e in events if e.processing_metrics
+                ]
+                if metrics_records:
+                    await conn.copy_records_to_table(
+                        'event_processing_metrics',
+                        columns=[
+                            'event_id', 'processing_start_time', 'processing_end_time',
+                            'total_processing_time', 'classification_time', 'enrichment_time',
+                            'routing_time', 'memory_usage', 'cpu_usage', 'processing_quality_score',
+                            'error_count', 'retry_count', 'created_at'
+                        ],
+                        records=metrics_records
+                    )
+            
+            logger.info("Event batch completed successfully", count=len(events))
+            return len(events)
+            
+        except Exception as e:
+            logger.error("Failed to complete event batch", error=str(e), count=len(events))
+            raise
+    
+    async def buffer_event(self, event: NewsEvent):
+        """Queue an event's final write for the next bulk flush and wait until it commits
+        
+        Raises whatever the write raised, so the caller can mark the event failed.
+        """
+        if self._flush_task is None:
+            raise RuntimeError("Write buffer not running")
+        
+        done = asyncio.get_running_loop().create_future()
+        self._write_queue.put_nowait((event, done))
+        if self._write_queue.qsize() >= WRITE_BUFFER_MAX_EVENTS:
+            self._buffer_full.set()
+        await done
+    
+    async def _flusher(self):
+        """Drain the write buffer in batches bounded by size and flush interval
+        
+        Returns after flushing everything queued ahead of the stop sentinel.
+        """
+        stopping = False
+        while not stopping:
+            # Block for the first event, then give the batch one interval to fill up
+            item = await self._write_queue.get()
+            if item is _FLUSH_STOP:
+                return
+            batch = [item]
+            try:
+                await asyncio.wait_for(self._buffer_full.wait(), WRITE_BUFFER_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._buffer_full.clear()
+            
+            while len(batch) < WRITE_BUFFER_MAX_EVENTS and not self._write_queue.empty():
+                item = self._write_queue.get_nowait()
+                if item is _FLUSH_STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            
+            await self._flush_batch(batch)
+    
+    async def _flush_batch(self, batch: List[Tuple[NewsEvent, asyncio.Future]]):
+        """Write a drained batch and report the outcome to each waiting caller
+        
+        A failed batch is retried one event at a time, so a single bad event fails
+        only its own caller.
+        """
+        try:
+            await self.complete_events_bulk([event for event, _ in batch])
+        except Exception as e:
+            if len(batch) > 1:
+                logger.warning("Write buffer flush failed, retrying per event", error=str(e), count=len(batch))
+                for item in batch:
+                    await self._flush_batch([item])
+                return
+            
+            _, done = batch[0]
+            if not done.done():
+                done.set_exception(e)
+            return
+        
+        for _, done in batch:
+            if not done.done():
+                done.set_result(None)
+    
+    async def _drain_write_buffer(self):
+        """Stop the flusher once everything already queued has been written"""
+        if self._flush_task:
+            self._write_queue.put_nowait(_FLUSH_STOP)
+            self._buffer_full.set()
+            await self._flush_task
+            self._flush_task = None
+    
+    async def get_event(
+        self, 
+        event_id: str, 
+        conn: Optional[asyncpg.Connection] = None
+    ) -> Optional[NewsEvent]:
         """Retrieve event by ID"""
         try:
-            async with self.get_connection() as conn:
+            async with self.get_connection(conn) as conn, self._read_snapshot(conn):
                 # Get main event record
                 event_row = await conn.fetchrow("""
                     SELECT * FROM processed_events WHERE event_id = $1
@@ -248,10 +871,28 @@ class DatabaseManager:
             logger.error("Failed to retrieve event", error=str(e), event_id=event_id)
             return None
     
-    async def update_event_status(self, event_id: str, status: ProcessingStatus, error_details: Optional[str] = None):
-        """Update event processing status"""
+    async def get_event_json(self, event_id: str) -> Optional[bytes]:
+        """Retrieve an event with all its relations as NewsEvent-shaped JSON built by Postgres"""
         try:
             async with self.get_connection() as conn:
+                event_json = await conn.fetchval(_SQL_EVENT_JSON, event_id)
+                
+                return event_json.encode() if event_json is not None else None
+                
+        except Exception as e:
+            logger.error("Failed to retrieve event JSON", error=str(e), event_id=event_id)
+            return None
+    
+    async def update_event_status(
+        self, 
+        event_id: str, 
+        status: ProcessingStatus, 
+        error_details: Optional[str] = None,
+        conn: Optional[asyncpg.Connection] = None
+    ):
+        """Update event processing status"""
+        try:
+            async with self.get_connection(conn) as conn:
                 await conn.execute("""
                     UPDATE processed_events 
                     SET status = $2, error_details = $3, updated_at = $4
@@ -264,85 +905,58 @@ class DatabaseManager:
             logger.error("Failed to update event status", error=str(e), event_id=event_id)
             raise
     
-    async def search_events(self, query: EventQuery) -> List[NewsEvent]:
-        """Search events with filters"""
+    @staticmethod
+    def _filter_shape(query: EventQuery) -> Tuple[Tuple[str, ...], int, List[Any]]:
+        """Return which filters a query sets, its keyword count and the bound values in order"""
+        values = {
+            'start_date': query.start_date,
+            'end_date': query.end_date,
+            'event_types': [et.value for et in query.event_types] if query.event_types else None,
+            'severity_levels': [sl.value for sl in query.severity_levels] if query.severity_levels else None,
+            'tickers': query.tickers
+        }
+        shape = tuple(name for name in _SEARCH_FILTERS if values[name])
+        params = [values[name] for name in shape]
+        
+        keywords = query.keywords or []
+        params.extend(f"%{keyword}%" for keyword in keywords)
+        
+        return shape, len(keywords), params
+    
+    async def search_events(
+        self, 
+        query: EventQuery, 
+        cursor: Optional[Tuple[datetime, str]] = None,
+        include: Optional[Set[str]] = None
+    ) -> List[NewsEvent]:
+        """Search events with filters
+        
+        When cursor is the (published_at, event_id) of the last event on the previous
+        page and results are sorted by published_at, the page is fetched by keyset
+        instead of OFFSET, so deep pages cost the same as the first one.
+        
+        include names the relations to hydrate (see SEARCH_RELATIONS); None loads all.
+        """
+        if include is None:
+            include = set(SEARCH_RELATIONS)
+        
         try:
             async with self.get_connection() as conn:
-                # Build dynamic query
-                where_conditions = ["1=1"]
-                params = []
-                param_count = 0
-                
-                if query.start_date:
-                    param_count += 1
-                    where_conditions.append(f"published_at >= ${param_count}")
-                    params.append(query.start_date)
-                
-                if query.end_date:
-                    param_count += 1
-                    where_conditions.append(f"published_at <= ${param_count}")
-                    params.append(query.end_date)
-                
-                if query.event_types:
-                    param_count += 1
-                    where_conditions.append(f"""
-                        event_id IN (
-                            SELECT event_id FROM event_classifications 
-                            WHERE event_type = ANY(${param_count})
-                        )
-                    """)
-                    params.append([et.value for et in query.event_types])
-                
-                if query.severity_levels:
-                    param_count += 1
-                    where_conditions.append(f"""
-                        event_id IN (
-                            SELECT event_id FROM event_severity_assessments 
-                            WHERE severity = ANY(${param_count})
-                        )
-                    """)
-                    params.append([sl.value for sl in query.severity_levels])
-                
-                if query.tickers:
-                    param_count += 1
-                    where_conditions.append(f"""
-                        event_id IN (
-                            SELECT event_id FROM event_entities 
-                            WHERE ticker_symbol = ANY(${param_count})
-                        )
-                    """)
-                    params.append(query.tickers)
-                
-                if query.keywords:
-                    param_count += 1
-                    keyword_conditions = []
-                    for keyword in query.keywords:
-                        keyword_conditions.append(f"(title ILIKE '%{keyword}%' OR content ILIKE '%{keyword}%')")
-                    where_conditions.append(f"({' OR '.join(keyword_conditions)})")
-                
-                # Build full query
-                where_clause = " AND ".join(where_conditions)
-                
-                # Add pagination
-                offset = (query.page - 1) * query.page_size
-                param_count += 1
-                limit_clause = f"LIMIT ${param_count}"
-                params.append(query.page_size)
-                
-                param_count += 1
-                offset_clause = f"OFFSET ${param_count}"
-                params.append(offset)
+                # SQL text depends only on the query's shape and is cached per shape
+                shape, keyword_count, params = self._filter_shape(query)
+                sort_order = query.sort_order.upper()
+                use_keyset = cursor is not None and query.sort_by == 'published_at'
                 
-                # Order by clause
-                order_clause = f"ORDER BY {query.sort_by} {query.sort_order.upper()}"
+                sql = _build_search_sql(
+                    shape, keyword_count, use_keyset, query.sort_by, sort_order,
+                    tuple(name for name in SEARCH_RELATIONS if name in include)
+                )
                 
-                sql = f"""
-                    SELECT * FROM processed_events 
-                    WHERE {where_clause}
-                    {order_clause}
-                    {limit_clause}
-                    {offset_clause}
-                """
+                if use_keyset:
+                    params.extend(cursor)
+                params.append(query.page_size)
+                if not use_keyset:
+                    params.append((query.page - 1) * query.page_size)
                 
                 rows = await conn.fetch(sql, *params)
                 
@@ -369,8 +983,13 @@ class DatabaseManager:
                         updated_by=row['updated_by']
                     )
                     
-                    # Load relations for each event
-                    await self._load_event_relations(conn, event)
+                    if row.get('classification_json'):
+                        event.classification = self._classification_from_row(row['classification_json'])
+                    if row.get('entities_json'):
+                        event.entities = [
+                            self._entity_from_row(entity_row)
+                            for entity_row in row['entities_json']
+                        ]
                     events.append(event)
                 
                 return events
@@ -383,25 +1002,10 @@ class DatabaseManager:
         """Get total count of events matching query"""
         try:
             async with self.get_connection() as conn:
-                # Build count query (similar to search but without pagination)
-                where_conditions = ["1=1"]
-                params = []
-                param_count = 0
-                
-                if query.start_date:
-                    param_count += 1
-                    where_conditions.append(f"published_at >= ${param_count}")
-                    params.append(query.start_date)
-                
-                if query.end_date:
-                    param_count += 1
-                    where_conditions.append(f"published_at <= ${param_count}")
-                    params.append(query.end_date)
-                
-                # Add other filters as needed...
-                
-                where_clause = " AND ".join(where_conditions)
-                sql = f"SELECT COUNT(*) FROM processed_events WHERE {where_clause}"
+                # Same filters as search_events, without pagination
+                shape, keyword_count, params = self._filter_shape(query)
+                where_sql, _ = _build_where(shape, keyword_count)
+                sql = f"SELECT COUNT(*) FROM processed_events pe {where_sql}"
                 
                 count = await conn.fetchval(sql, *params)
                 return count or 0
@@ -411,94 +1015,19 @@ class DatabaseManager:
             return 0
     
     async def get_processing_stats(self) -> ProcessingStatsResponse:
-        """Get processing statistics"""
+        """Get processing statistics, cached for a few seconds"""
+        if self._stats_cached and time.monotonic() - self._stats_at < STATS_CACHE_TTL:
+            return self._stats_cached
+        
         try:
-            async with self.get_connection() as conn:
-                # Get basic counts
-                total_events = await conn.fetchval("""
-                    SELECT COUNT(*) FROM processed_events
-                """) or 0
-                
-                events_today = await conn.fetchval("""
-                    SELECT COUNT(*) FROM processed_events 
-                    WHERE created_at >= CURRENT_DATE
-                """) or 0
-                
-                # Get average processing time
-                avg_processing_time = await conn.fetchval("""
-                    SELECT AVG(total_processing_time) 
-                    FROM event_processing_metrics 
-                    WHERE total_processing_time IS NOT NULL
-                """) or 0.0
-                
-                # Get status distribution
-                status_rows = await conn.fetch("""
-                    SELECT status, COUNT(*) as count 
-                    FROM processed_events 
-                    GROUP BY status
-                """)
-                
-                status_distribution = {row['status']: row['count'] for row in status_rows}
-                
-                # Get event type distribution
-                type_rows = await conn.fetch("""
-                    SELECT ec.event_type, COUNT(*) as count
-                    FROM event_classifications ec
-                    JOIN processed_events pe ON ec.event_id = pe.event_id
-                    WHERE pe.created_at >= CURRENT_DATE - INTERVAL '7 days'
-                    GROUP BY ec.event_type
-                """)
-                
-                event_type_distribution = {row['event_type']: row['count'] for row in type_rows}
-                
-                # Get severity distribution
-                severity_rows = await conn.fetch("""
-                    SELECT esa.severity, COUNT(*) as count
-                    FROM event_severity_assessments esa
-                    JOIN processed_events pe ON esa.event_id = pe.event_id
-                    WHERE pe.created_at >= CURRENT_DATE - INTERVAL '7 days'
-                    GROUP BY esa.severity
-                """)
-                
-                severity_distribution = {row['severity']: row['count'] for row in severity_rows}
-                
-                # Calculate throughput
-                events_per_hour = events_today / 24.0 if events_today > 0 else 0.0
-                
-                # Get error rate
-                error_count = await conn.fetchval("""
-                    SELECT COUNT(*) FROM processed_events 
-                    WHERE status = 'failed' AND created_at >= CURRENT_DATE
-                """) or 0
-                
-                error_rate = (error_count / events_today) if events_today > 0 else 0.0
-                
-                # Mock additional metrics
-                classification_accuracy = 0.85
-                average_confidence = 0.78
-                retry_rate = 0.05
-                
-                system_performance = {
-                    'memory_usage': 65.2,
-                    'cpu_usage': 23.8,
-                    'database_connections': 12,
-                    'queue_depth': 45
-                }
+            # Single flight: one coroutine recomputes while the others wait for its result
+            async with self._stats_lock:
+                if self._stats_cached and time.monotonic() - self._stats_at < STATS_CACHE_TTL:
+                    return self._stats_cached
                 
-                return ProcessingStatsResponse(
-                    events_processed_today=events_today,
-                    events_processed_total=total_events,
-                    average_processing_time=avg_processing_time,
-                    events_per_hour=events_per_hour,
-                    classification_accuracy=classification_accuracy,
-                    average_confidence=average_confidence,
-                    status_distribution=status_distribution,
-                    event_type_distribution=event_type_distribution,
-                    severity_distribution=severity_distribution,
-                    system_performance=system_performance,
-                    error_rate=error_rate,
-                    retry_rate=retry_rate
-                )
+                self._stats_cached = await self._query_processing_stats()
+                self._stats_at = time.monotonic()
+                return self._stats_cached
                 
         except Exception as e:
             logger.error("Failed to get processing stats", error=str(e))
@@ -518,7 +1047,56 @@ class DatabaseManager:
                 retry_rate=0.0
             )
     
-    async def _load_event_relations(self, conn, event: NewsEvent):
+    async def _query_processing_stats(self) -> ProcessingStatsResponse:
+        """Compute processing statistics from the database"""
+        async with self.get_connection() as conn:
+            # All aggregates in one round-trip over a single snapshot
+            row = await conn.fetchrow(_PROCESSING_STATS_SQL)
+            
+            total_events = row['total_events'] or 0
+            events_today = row['events_today'] or 0
+            avg_processing_time = row['avg_processing_time'] or 0.0
+            error_count = row['error_count'] or 0
+            
+            status_distribution = row['status_distribution'] or {}
+            event_type_distribution = row['event_type_distribution'] or {}
+            severity_distribution = row['severity_distribution'] or {}
+            
+            # Calculate throughput
+            events_per_hour = events_today / 24.0 if events_today > 0 else 0.0
+            
+            # Get error rate
+            error_rate = (error_count / events_today) if events_today > 0 else 0.0
+            
+            # Mock additional metrics
+            classification_accuracy = 0.85
+            average_confidence = 0.78
+            retry_rate = 0.05
+            
+            system_performance = {
+                'memory_usage': 65.2,
+                'cpu_usage': 23.8,
+                'database_connections': self.pool.get_size() - self.pool.get_idle_size(),
+                'database_pool_size': self.pool.get_size(),
+                'queue_depth': 45
+            }
+            
+            return ProcessingStatsResponse(
+                events_processed_today=events_today,
+                events_processed_total=total_events,
+                average_processing_time=avg_processing_time,
+                events_per_hour=events_per_hour,
+                classification_accuracy=classification_accuracy,
+                average_confidence=average_confidence,
+                status_distribution=status_distribution,
+                event_type_distribution=event_type_distribution,
+                severity_distribution=severity_distribution,
+                system_performance=system_performance,
+                error_rate=error_rate,
+                retry_rate=retry_rate
+            )
+    
+    async def _load_event_relations(self, conn: asyncpg.Connection, event: NewsEvent):
         """Load related data for an event"""
         # Load classification
         classification_row = await conn.fetchrow("""
@@ -526,17 +1104,7 @@ class DatabaseManager:
         """, event.event_id)
         
         if classification_row:
-            from ..models import ClassificationResult, ClassificationConfidence
-            event.classification = ClassificationResult(
-                event_type=EventType(classification_row['event_type']),
-                confidence=classification_row['confidence'],
-                confidence_level=ClassificationConfidence(classification_row['confidence_level']),
-                primary_indicators=json.loads(classification_row['primary_indicators'] or '[]'),
-                secondary_indicators=json.loads(classification_row['secondary_indicators'] or '[]'),
-                alternative_types=json.loads(classification_row['alternative_types'] or '[]'),
-                reasoning=classification_row['reasoning'],
-                model_used=classification_row['model_used']
-            )
+            event.classification = self._classification_from_row(classification_row)
         
         # Load entities
         entity_rows = await conn.fetch("""
@@ -544,54 +1112,84 @@ class DatabaseManager:
         """, event.event_id)
         
         if entity_rows:
-            from ..models import Entity
-            event.entities = []
-            for row in entity_rows:
-                entity = Entity(
-                    entity_id=row['entity_id'],
-                    entity_type=row['entity_type'],
-                    entity_value=row['entity_value'],
-                    confidence=row['confidence'],
-                    start_pos=row['start_pos'],
-                    end_pos=row['end_pos'],
-                    context=row['context'],
-                    ticker_symbol=row['ticker_symbol'],
-                    exchange=row['exchange'],
-                    sector=row['sector'],
-                    market_cap=row['market_cap']
-                )
-                event.entities.append(entity)
+            event.entities = [self._entity_from_row(row) for row in entity_rows]
         
         # Load other relations (severity, enrichment, routing, metrics) as needed...
     
+    def _classification_from_row(self, row) -> 'ClassificationResult':
+        """Build a classification from a table row or its JSONB form"""
+        from ..models import ClassificationResult, ClassificationConfidence
+        
+        return ClassificationResult(
+            event_type=EventType(row['event_type']),
+            confidence=row['confidence'],
+            confidence_level=ClassificationConfidence(row['confidence_level']),
+            primary_indicators=list(row['primary_indicators'] or []),
+            secondary_indicators=list(row['secondary_indicators'] or []),
+            alternative_types=row['alternative_types'] or [],
+            reasoning=row['reasoning'],
+            model_used=row['model_used']
+        )
+    
+    def _entity_from_row(self, row) -> 'Entity':
+        """Build an entity from a table row or its JSONB form"""
+        from ..models import Entity
+        
+        return Entity(
+            entity_id=row['entity_id'],
+            entity_type=row['entity_type'],
+            entity_value=row['entity_value'],
+            confidence=row['confidence'],
+            start_pos=row['start_pos'],
+            end_pos=row['end_pos'],
+            context=row['context'],
+            ticker_symbol=row['ticker_symbol'],
+            exchange=row['exchange'],
+            sector=row['sector'],
+            market_cap=row['market_cap']
+        )
+    
     async def cleanup_old_events(self, days_to_keep: int = 30):
         """Clean up old processed events"""
         try:
             cutoff_date = datetime.now() - timedelta(days=days_to_keep)
             
-            async with self.get_connection() as conn:
-                # Delete in order to maintain referential integrity
-                deleted_count = await conn.fetchval("""
-                    WITH deleted_events AS (
-                        DELETE FROM processed_events 
-                        WHERE created_at < $1 
-                        RETURNING event_id
-                    )
-                    SELECT COUNT(*) FROM deleted_events
-                """, cutoff_date)
-                
-                logger.info("Cleaned up old events", 
-                           deleted_count=deleted_count, 
-                           cutoff_date=cutoff_date)
+            # Delete in bounded batches so each transaction stays small and vacuum keeps up;
+            # child rows go with their event through the ON DELETE CASCADE foreign keys from
+            # migration 002, which startup verifies
+            deleted_count = 0
+            while True:
+                async with self.get_connection() as conn:
+                    status = await conn.execute("""
+                        DELETE FROM processed_events
+                        WHERE ctid IN (
+                            SELECT ctid FROM processed_events
+                            WHERE created_at < $1
+                            LIMIT $2
+                        )
+                    """, cutoff_date, CLEANUP_BATCH_SIZE)
                 
-                return deleted_count
+                batch_count = int(status.split()[-1])
+                deleted_count += batch_count
+                if batch_count < CLEANUP_BATCH_SIZE:
+                    break
                 
+                await asyncio.sleep(CLEANUP_BATCH_PAUSE)
+            
+            logger.info("Cleaned up old events", 
+                       deleted_count=deleted_count, 
+                       cutoff_date=cutoff_date)
+            
+            return deleted_count
+            
         except Exception as e:
             logger.error("Failed to cleanup old events", error=str(e))
             return 0
     
     async def close(self):
         """Close database connection pool"""
+        await self._drain_write_buffer()
+        
         if self.pool:
             await self.pool.close()
             logger.info("Database connection pool closed") 
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Tests for severity assessment."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.models import (
+    ClassificationConfidence, ClassificationResult, Entity, EventType,
+    NewsEvent, ProcessingStatus
+)
+from src.processors.severity_assessor import SeverityAssessor
+
+
+STORIES = [
+    ("BREAKING: Acme Corp files for Chapter 11 bankruptcy",
+     "Trading halt announced today as the company faces an SEC investigation. "
+     "Shareholders and employees brace for layoffs.",
+     EventType.BANKRUPTCY),
+    ("Apple beats earnings estimates",
+     "AAPL reported revenue of $94.8 billion, a 12% increase, with EPS at $1.52. "
+     "Guidance for next quarter was raised and investors cheered.",
+     EventType.EARNINGS_ANNOUNCEMENT),
+    ("Analyst upgrades Microsoft on cloud growth",
+     "The price target was raised after a new partnership agreement with a major customer.",
+     EventType.ANALYST_UPGRADE),
+    ("Company hosts annual picnic",
+     "Staff gathered in the park for a relaxed afternoon.",
+     EventType.GENERAL_NEWS),
+    ("Merger talks between rivals developing",
+     "Sources say the acquisition could close this morning pending FTC compliance review.",
+     EventType.MERGER_ACQUISITION),
+    ("Untitled", "", None),
+]
+
+AGES = [timedelta(minutes=20), timedelta(hours=3), timedelta(hours=12), timedelta(days=4), None]
+
+
+def _classification(event_type: EventType) -> ClassificationResult:
+    """Minimal classification result carrying an event type."""
+    return ClassificationResult(
+        event_type=event_type,
+        confidence=0.9,
+        confidence_level=ClassificationConfidence.MEDIUM,
+        primary_indicators=[],
+        reasoning="test",
+        model_used="test"
+    )
+
+
+def _entities(index: int) -> list:
+    """A varying mix of ticker and company entities."""
+    pool = [
+        Entity(entity_type="TICKER", entity_value="AAPL", confidence=0.9, ticker_symbol="AAPL"),
+        Entity(entity_type="TICKER", entity_value="XYZ", confidence=0.6, ticker_symbol="XYZ"),
+        Entity(entity_type="COMPANY", entity_value="Acme", confidence=0.7, market_cap="12B"),
+        Entity(entity_type="ORG", entity_value="Globex", confidence=0.85, market_cap="2T"),
+        Entity(entity_type="TICKER", entity_value="MSFT", confidence=0.95, ticker_symbol="MSFT"),
+    ]
+    return pool[:index % (len(pool) + 1)]
+
+
+def _events():
+    """Every story at every publication age, with entities."""
+    now = datetime.now()
+    events, entities = [], []
+    for i, (title, content, event_type) in enumerate(STORIES):
+        for j, age in enumerate(AGES):
+            event = NewsEvent(
+                article_id=f"article_{i}_{j}",
+                source_id="test",
+                title=title,
+                content=content,
+                url=f"https://example.com/{i}/{j}",
+                published_at=now - age if age is not None else None,
+                status=ProcessingStatus.PENDING
+            )
+            event.event_id = f"event_{i}_{j}"
+            if event_type is not None:
+                event.classification = _classification(event_type)
+            events.append(event)
+            entities.append(_entities(i + j))
+    return events, entities
+
+
+@pytest.fixture
+def assessor():
+    """Severity assessor instance."""
+    return SeverityAssessor()
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_single_assessment(assessor):
+    """assess_severity_batch agrees with assess_severity for every event."""
+    events, entities = _events()
+    
+    batch = await assessor.assess_severity_batch(events, entities)
+    assert len(batch) == len(events)
+    
+    for event, event_entities, batched in zip(events, entities, batch):
+        single = await assessor.assess_severity(event, event_entities)
+        
+        assert batched.severity == single.severity, event.event_id
+        assert batched.urgency == single.urgency, event.event_id
+        assert batched.market_impact_score == pytest.approx(single.market_impact_score)
+        assert batched.company_impact_score == pytest.approx(single.company_impact_score)
+        assert batched.time_sensitivity_score == pytest.approx(single.time_sensitivity_score)
+        assert batched.stakeholder_impact_score == pytest.approx(single.stakeholder_impact_score)
+        assert batched.overall_severity_score == pytest.approx(single.overall_severity_score)
+        assert batched.confidence == pytest.approx(single.confidence)
+        assert batched.assessment_factors == single.assessment_factors
+        assert batched.reasoning == single.reasoning
+
+
+@pytest.mark.asyncio
+async def test_batch_of_nothing(assessor):
+    """An empty batch returns no assessments."""
+    assert await assessor.assess_severity_batch([], []) == []
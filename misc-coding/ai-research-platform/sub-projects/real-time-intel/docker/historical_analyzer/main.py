@@ -6,22 +6,29 @@ Provides 10-year context analysis and pattern recognition
 
 import os
 import asyncio
+import uuid
+from collections import defaultdict
 import structlog
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
 import uvicorn
-import pandas as pd
+from cachetools import TTLCache
 import numpy as np
-from datetime import datetime, timedelta
-from sklearn.preprocessing import StandardScaler
-from sklearn.cluster import KMeans
-import json
+from datetime import datetime, timezone
+import orjson
+from functools import lru_cache
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson-backed serializer for structlog's JSONRenderer"""
+    return orjson.dumps(obj, **kwargs).decode()
 
 # Configure structured logging
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -30,20 +37,24 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
-logger = structlog.get_logger(__name__)
+logger = structlog.get_logger(__name__).bind(service="historical_analyzer")
+
+# Per-event pattern analysis, reused for a minute across repeated requests
+_EVENT_PATTERNS_CACHE = TTLCache(maxsize=4096, ttl=60)
 
 # Initialize FastAPI app
 app = FastAPI(
     title="Historical Analyzer Service",
     description="10-year context analysis and pattern recognition",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -97,24 +108,120 @@ class HealthResponse(BaseModel):
     version: str
     data_coverage: Dict[str, str]
 
-# Health check endpoint
-@app.get("/health", response_model=HealthResponse)
-async def health_check():
-    """Health check endpoint"""
-    return HealthResponse(
-        status="healthy",
-        service="historical_analyzer",
-        version="1.0.0",
-        data_coverage={
+# Placeholder event corpus
+# TODO: Implement real historical event database
+_HISTORICAL_EVENTS = (
+    HistoricalEvent(
+        event_id="event_001",
+        title="COVID-19 Market Crash",
+        description="Global markets crashed due to COVID-19 pandemic fears",
+        date=datetime(2020, 3, 16),
+        category="pandemic",
+        impact_score=9.5,
+        related_symbols=["SPY", "QQQ", "DIA"],
+        market_reaction={"1d": -0.12, "1w": -0.25, "1m": -0.35}
+    ),
+    HistoricalEvent(
+        event_id="event_002",
+        title="Federal Reserve Rate Cut",
+        description="Emergency rate cut to near zero",
+        date=datetime(2020, 3, 15),
+        category="monetary_policy",
+        impact_score=8.7,
+        related_symbols=["TLT", "GLD", "USD"],
+        market_reaction={"1d": 0.05, "1w": 0.08, "1m": 0.15}
+    )
+)
+
+def _build_event_index(key) -> Dict[str, frozenset]:
+    """Map each key value to the corpus positions of its events"""
+    index: Dict[str, set] = defaultdict(set)
+    for position, event in enumerate(_HISTORICAL_EVENTS):
+        for value in key(event):
+            index[value].add(position)
+    return {value: frozenset(positions) for value, positions in index.items()}
+
+_EVENT_INDEX_SYMBOL = _build_event_index(lambda e: e.related_symbols)
+_EVENT_INDEX_CATEGORY = _build_event_index(lambda e: (e.category,))
+
+# Event dates as a column for vectorized range filtering
+_EVENT_DATES = np.array([e.date for e in _HISTORICAL_EVENTS], dtype="datetime64[us]")
+
+def _parse_date_bound(name: str, value: Optional[str]) -> Optional[np.datetime64]:
+    """Parse an ISO date query parameter, rejecting malformed values with a 400"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid {name}: {value}")
+    # Event dates are naive UTC, so shift aware bounds to UTC before dropping the offset
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(parsed, "us")
+
+# Placeholder analysis output, validated and dumped once
+# TODO: Implement real historical pattern analysis
+_PLACEHOLDER_PATTERNS = [
+    pattern.model_dump(mode="json")
+    for pattern in (
+        PatternMatch(
+            pattern_id="pattern_001",
+            similarity_score=0.87,
+            historical_date=datetime(2020, 3, 15),
+            current_context="Market volatility spike with tech selloff",
+            predicted_outcome={
+                "direction": "recovery",
+                "timeframe": "2-4 weeks",
+                "magnitude": "15-25%"
+            },
+            confidence=0.82
+        ),
+        PatternMatch(
+            pattern_id="pattern_002",
+            similarity_score=0.73,
+            historical_date=datetime(2018, 10, 10),
+            current_context="Interest rate concerns affecting growth stocks",
+            predicted_outcome={
+                "direction": "consolidation",
+                "timeframe": "1-2 months",
+                "magnitude": "5-10%"
+            },
+            confidence=0.68
+        )
+    )
+]
+
+_PLACEHOLDER_CORRELATIONS = {
+    "SPY": 0.85,
+    "QQQ": 0.78,
+    "VIX": -0.62
+}
+
+@lru_cache(maxsize=2)
+def _health_body(end_date: str) -> bytes:
+    """Serialized health payload, rebuilt only when the coverage end date rolls over"""
+    return orjson.dumps({
+        "status": "healthy",
+        "service": "historical_analyzer",
+        "version": "1.0.0",
+        "data_coverage": {
             "start_date": "2014-01-01",
-            "end_date": datetime.utcnow().strftime("%Y-%m-%d"),
+            "end_date": end_date,
             "total_events": "15,423",
             "symbols_covered": "2,847"
         }
-    )
+    })
+
+# Health check endpoint
+@app.get("/health", responses={200: {"model": HealthResponse}})
+async def health_check():
+    """Health check endpoint"""
+    end_date = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    return Response(content=_health_body(end_date), media_type="application/json")
 
 # Analyze historical patterns
-@app.post("/analyze", response_model=AnalysisResult)
+@app.post("/analyze", responses={200: {"model": AnalysisResult}})
 async def analyze_patterns(request: AnalysisRequest, background_tasks: BackgroundTasks):
     """Analyze historical patterns for given symbols"""
     logger.info("Starting historical analysis", 
@@ -122,71 +229,39 @@ async def analyze_patterns(request: AnalysisRequest, background_tasks: Backgroun
                 analysis_type=request.analysis_type)
     
     try:
-        # Generate unique request ID
-        request_id = f"analysis_{datetime.utcnow().timestamp()}"
-        
-        # Placeholder for actual analysis logic
-        # TODO: Implement real historical pattern analysis
-        patterns = [
-            PatternMatch(
-                pattern_id="pattern_001",
-                similarity_score=0.87,
-                historical_date=datetime(2020, 3, 15),
-                current_context="Market volatility spike with tech selloff",
-                predicted_outcome={
-                    "direction": "recovery",
-                    "timeframe": "2-4 weeks",
-                    "magnitude": "15-25%"
-                },
-                confidence=0.82
-            ),
-            PatternMatch(
-                pattern_id="pattern_002",
-                similarity_score=0.73,
-                historical_date=datetime(2018, 10, 10),
-                current_context="Interest rate concerns affecting growth stocks",
-                predicted_outcome={
-                    "direction": "consolidation",
-                    "timeframe": "1-2 months",
-                    "magnitude": "5-10%"
-                },
-                confidence=0.68
-            )
-        ]
+        now = datetime.now(timezone.utc)
         
-        correlations = {
-            "SPY": 0.85,
-            "QQQ": 0.78,
-            "VIX": -0.62
-        }
+        # Generate unique request ID
+        request_id = f"analysis_{uuid.uuid4().hex}"
         
         anomalies = [
             {
                 "type": "volume_spike",
                 "severity": "moderate",
                 "description": "Unusual trading volume detected",
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": now.isoformat()
             }
         ]
         
-        result = AnalysisResult(
-            request_id=request_id,
-            symbols=request.symbols,
-            analysis_type=request.analysis_type,
-            patterns=patterns,
-            correlations=correlations,
-            anomalies=anomalies,
-            summary="Analysis shows strong historical precedent for current market conditions. "
-                   "Similar patterns in 2020 and 2018 suggest potential recovery within 2-4 weeks.",
-            confidence=0.75,
-            generated_at=datetime.utcnow()
-        )
+        # Plain dict straight to orjson; the static parts were validated at import
+        result = {
+            "request_id": request_id,
+            "symbols": request.symbols,
+            "analysis_type": request.analysis_type,
+            "patterns": _PLACEHOLDER_PATTERNS,
+            "correlations": _PLACEHOLDER_CORRELATIONS,
+            "anomalies": anomalies,
+            "summary": "Analysis shows strong historical precedent for current market conditions. "
+                       "Similar patterns in 2020 and 2018 suggest potential recovery within 2-4 weeks.",
+            "confidence": 0.75,
+            "generated_at": now
+        }
         
         # Start background processing for detailed analysis
         background_tasks.add_task(process_detailed_analysis, request_id, request)
         
         logger.info("Historical analysis completed", request_id=request_id)
-        return result
+        return ORJSONResponse(result)
         
     except Exception as e:
         logger.error("Error in historical analysis", error=str(e))
@@ -207,40 +282,30 @@ async def get_historical_events(
                 category=category,
                 limit=limit)
     
+    start = _parse_date_bound("start_date", start_date)
+    end = _parse_date_bound("end_date", end_date)
+    
     try:
-        # Placeholder for actual event retrieval
-        # TODO: Implement real historical event database
-        events = [
-            HistoricalEvent(
-                event_id="event_001",
-                title="COVID-19 Market Crash",
-                description="Global markets crashed due to COVID-19 pandemic fears",
-                date=datetime(2020, 3, 16),
-                category="pandemic",
-                impact_score=9.5,
-                related_symbols=["SPY", "QQQ", "DIA"],
-                market_reaction={"1d": -0.12, "1w": -0.25, "1m": -0.35}
-            ),
-            HistoricalEvent(
-                event_id="event_002",
-                title="Federal Reserve Rate Cut",
-                description="Emergency rate cut to near zero",
-                date=datetime(2020, 3, 15),
-                category="monetary_policy",
-                impact_score=8.7,
-                related_symbols=["TLT", "GLD", "USD"],
-                market_reaction={"1d": 0.05, "1w": 0.08, "1m": 0.15}
-            )
-        ]
-        
-        # Apply filters (placeholder logic)
+        # Intersect the inverted indexes, keeping corpus order
+        candidates = None
         if symbol:
-            events = [e for e in events if symbol in e.related_symbols]
+            candidates = _EVENT_INDEX_SYMBOL.get(symbol, frozenset())
         if category:
-            events = [e for e in events if e.category == category]
+            by_category = _EVENT_INDEX_CATEGORY.get(category, frozenset())
+            candidates = by_category if candidates is None else candidates & by_category
+        if start is not None or end is not None:
+            in_range = np.ones(len(_EVENT_DATES), dtype=bool)
+            if start is not None:
+                in_range &= _EVENT_DATES >= start
+            if end is not None:
+                in_range &= _EVENT_DATES <= end
+            by_date = frozenset(np.flatnonzero(in_range).tolist())
+            candidates = by_date if candidates is None else candidates & by_date
         
-        # Limit results
-        events = events[:limit]
+        if candidates is None:
+            events = list(_HISTORICAL_EVENTS[:limit])
+        else:
+            events = [_HISTORICAL_EVENTS[i] for i in sorted(candidates)[:limit]]
         
         logger.info("Historical events retrieved", count=len(events))
         return events
@@ -255,6 +320,10 @@ async def get_event_patterns(event_id: str):
     """Get pattern analysis for a specific historical event"""
     logger.info("Fetching event patterns", event_id=event_id)
     
+    patterns = _EVENT_PATTERNS_CACHE.get(event_id)
+    if patterns is not None:
+        return patterns
+    
     try:
         # Placeholder for event pattern analysis
         # TODO: Implement actual pattern analysis
@@ -273,12 +342,43 @@ async def get_event_patterns(event_id: str):
             "similar_events": ["event_003", "event_007", "event_012"]
         }
         
+        _EVENT_PATTERNS_CACHE[event_id] = patterns
         return patterns
         
     except Exception as e:
         logger.error("Error fetching event patterns", event_id=event_id, error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to fetch patterns: {str(e)}")
 
+# Trading days of returns behind each correlation estimate
+_CORRELATION_SAMPLES = 252
+
+def _synthetic_returns(n: int, samples: int) -> np.ndarray:
+    """One-factor (N, T) daily returns standing in for real price series"""
+    market = np.random.standard_normal(samples)
+    loadings = np.random.uniform(0.6, 1.5, n)
+    return loadings[:, None] * market + np.random.standard_normal((n, samples))
+
+def _pearson_matrix(series: np.ndarray) -> np.ndarray:
+    """Pairwise Pearson correlation of an (N, T) series matrix as one BLAS product"""
+    x = np.ascontiguousarray(series, dtype=np.float32)
+    x = x - x.mean(axis=1, keepdims=True)
+    std = x.std(axis=1, keepdims=True)
+    x /= np.where(std == 0, 1, std)
+    corr = (x @ x.T) / x.shape[1]
+    np.clip(corr, -1.0, 1.0, out=corr)
+    np.fill_diagonal(corr, 1.0)
+    # Widen for output so rounded values serialize without float32 noise
+    return corr.astype(np.float64)
+
+async def _stream_correlation_matrix(header: bytes, symbol_list: List[str], matrix: np.ndarray):
+    """Yield the correlation response one matrix row at a time"""
+    # Reopen the header object and append the matrix as its last key
+    yield header[:-1] + b',"correlation_matrix":{'
+    for i, sym in enumerate(symbol_list):
+        row = orjson.dumps(dict(zip(symbol_list, matrix[i].tolist())))
+        yield (b',' if i else b'') + orjson.dumps(sym) + b':' + row
+    yield b'}}'
+
 # Get correlation analysis
 @app.get("/correlations")
 async def get_correlations(
@@ -286,28 +386,25 @@ async def get_correlations(
     timeframe: str = Query(default="1y", description="Timeframe for correlation analysis")
 ):
     """Get correlation analysis between symbols"""
-    symbol_list = [s.strip().upper() for s in symbols.split(",")]
+    # Dedupe, keeping order, so repeated symbols don't emit duplicate JSON keys
+    symbol_list = list(dict.fromkeys(s.strip().upper() for s in symbols.split(",")))
     logger.info("Computing correlations", symbols=symbol_list, timeframe=timeframe)
     
     try:
         # Placeholder for correlation analysis
         # TODO: Implement actual correlation computation
-        correlations = {}
-        for i, sym1 in enumerate(symbol_list):
-            correlations[sym1] = {}
-            for j, sym2 in enumerate(symbol_list):
-                if i == j:
-                    correlations[sym1][sym2] = 1.0
-                else:
-                    # Generate realistic correlation values
-                    correlations[sym1][sym2] = round(np.random.uniform(0.3, 0.9), 3)
+        returns = _synthetic_returns(len(symbol_list), _CORRELATION_SAMPLES)
+        matrix = np.round(_pearson_matrix(returns), 3)
         
-        return {
+        header = orjson.dumps({
             "symbols": symbol_list,
             "timeframe": timeframe,
-            "correlation_matrix": correlations,
-            "generated_at": datetime.utcnow().isoformat()
-        }
+            "generated_at": datetime.now(timezone.utc).isoformat()
+        })
+        return StreamingResponse(
+            _stream_correlation_matrix(header, symbol_list, matrix),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error("Error computing correlations", error=str(e))
@@ -332,7 +429,7 @@ async def get_analysis_status(request_id: str):
         "status": "completed",
         "progress": 100,
         "estimated_completion": None,
-        "last_updated": datetime.utcnow().isoformat()
+        "last_updated": datetime.now(timezone.utc).isoformat()
     }
 
 if __name__ == "__main__":
@@ -344,5 +441,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=port,
         reload=False,
+        loop="uvloop",
+        http="httptools",
         log_config=None  # Use structlog instead
     ) 
\ No newline at end of file
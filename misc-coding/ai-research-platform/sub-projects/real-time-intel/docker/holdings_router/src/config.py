@@ -1,7 +1,7 @@
 """Configuration settings for Holdings Router service."""
 
-from functools import lru_cache
-from typing import List
+from functools import cached_property, lru_cache
+from typing import FrozenSet, Tuple
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
@@ -20,18 +20,22 @@ class Settings(BaseSettings):
     db_user: str = Field(default="postgres", env="DB_USER")
     db_password: str = Field(default="password", env="DB_PASSWORD")
     db_name: str = Field(default="real_time_intel", env="DB_NAME")
+    db_pool_min_size: int = Field(default=16, env="DB_POOL_MIN_SIZE")
+    db_pool_max_size: int = Field(default=64, env="DB_POOL_MAX_SIZE")
     
     # External service URLs
     event_processor_url: str = Field(default="http://event-processor:8303", env="EVENT_PROCESSOR_URL")
     sentiment_analyzer_url: str = Field(default="http://sentiment-analyzer:8304", env="SENTIMENT_ANALYZER_URL")
     alert_engine_url: str = Field(default="http://alert-engine:8307", env="ALERT_ENGINE_URL")
     
-    # CORS settings
-    cors_origins: List[str] = Field(default=["*"], env="CORS_ORIGINS")
+    # CORS settings: comma-separated origins. Kept as a plain str because
+    # pydantic-settings JSON-decodes sequence fields from the environment.
+    cors_origins: str = Field(default="*", env="CORS_ORIGINS")
     
     # Performance settings
     max_concurrent_routes: int = Field(default=100, env="MAX_CONCURRENT_ROUTES")
     portfolio_cache_ttl_minutes: int = Field(default=30, env="PORTFOLIO_CACHE_TTL")
+    portfolio_cache_max_size: int = Field(default=10000, env="PORTFOLIO_CACHE_MAX_SIZE")
     batch_size_limit: int = Field(default=1000, env="BATCH_SIZE_LIMIT")
     
     # Routing thresholds
@@ -40,6 +44,16 @@ class Settings(BaseSettings):
     medium_threshold: float = Field(default=0.4, env="MEDIUM_THRESHOLD")
     low_threshold: float = Field(default=0.2, env="LOW_THRESHOLD")
     
+    @cached_property
+    def cors_origin_list(self) -> Tuple[str, ...]:
+        """Origins parsed from the comma-separated cors_origins value."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(",") if origin.strip())
+    
+    @cached_property
+    def allowed_origin_set(self) -> FrozenSet[str]:
+        """Origins as a frozenset for O(1) membership checks."""
+        return frozenset(self.cors_origin_list)
+    
     class Config:
         env_file = ".env"
         case_sensitive = False
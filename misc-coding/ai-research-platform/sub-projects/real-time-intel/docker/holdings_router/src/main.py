@@ -9,11 +9,14 @@ import asyncio
 import logging
 import time
 from contextlib import asynccontextmanager
+from dataclasses import asdict
 from typing import Dict, List, Optional
 
 import asyncpg
+import orjson
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel, Field
 
 from .config import get_settings
@@ -27,6 +30,32 @@ logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+# Static part of the health payload; only the timestamp changes per call
+_HEALTH_STATIC = {
+    "status": "healthy",
+    "service": "holdings-router",
+    "version": "1.0.0"
+}
+
+# Hot-path SQL kept as stable text so asyncpg's statement cache reuses the plans
+UPSERT_PORTFOLIO_SQL = """
+    INSERT INTO portfolios (user_id, total_value, cash_balance, risk_level, last_updated)
+    VALUES ($1, $2, $3, $4, NOW())
+    ON CONFLICT (user_id) 
+    DO UPDATE SET 
+        total_value = $2,
+        cash_balance = $3,
+        risk_level = $4,
+        last_updated = NOW()
+"""
+
+DELETE_HOLDINGS_SQL = "DELETE FROM holdings WHERE user_id = $1"
+
+HOLDINGS_COPY_COLUMNS = (
+    'user_id', 'symbol', 'name', 'shares', 'avg_cost', 'market_value',
+    'sector', 'position_pct', 'unrealized_pnl'
+)
+
 
 # Request/Response Models
 class EventRoutingRequest(BaseModel):
@@ -98,13 +127,14 @@ app = FastAPI(
     title="Holdings Router Service",
     description="Routes events to users based on portfolio relevance",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=settings.cors_origins,
+    allow_origins=settings.allowed_origin_set,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -115,12 +145,10 @@ app.add_middleware(
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "service": "holdings-router",
-        "version": "1.0.0",
-        "timestamp": time.time()
-    }
+    return Response(
+        content=orjson.dumps({**_HEALTH_STATIC, "timestamp": time.time()}),
+        media_type="application/json"
+    )
 
 
 # Core routing endpoints
@@ -169,6 +197,12 @@ async def route_batch_events(request: BatchEventRoutingRequest):
     
     Used for bulk processing of events.
     """
+    if len(request.events) > settings.batch_size_limit:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(request.events)} events exceeds limit of {settings.batch_size_limit}"
+        )
+    
     try:
         start_time = time.time()
         
@@ -212,20 +246,24 @@ async def get_user_relevant_events(request: UserEventsRequest):
     Used by frontend to show personalized event feed.
     """
     try:
-        events = await portfolio_router.get_user_relevant_events(
+        events_count, events_json = await portfolio_router.get_user_relevant_events_json(
             user_id=request.user_id,
             hours_back=request.hours_back,
             min_relevance_level=request.min_relevance_level
         )
         
-        return {
-            "status": "success",
-            "user_id": request.user_id,
-            "events_count": len(events),
-            "hours_back": request.hours_back,
-            "min_relevance_level": request.min_relevance_level.value,
-            "events": events
-        }
+        # Postgres already built the events array; embed it without re-parsing
+        return Response(
+            content=orjson.dumps({
+                "status": "success",
+                "user_id": request.user_id,
+                "events_count": events_count,
+                "hours_back": request.hours_back,
+                "min_relevance_level": request.min_relevance_level.value,
+                "events": orjson.Fragment(events_json)
+            }),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Error getting events for user {request.user_id}: {e}")
@@ -244,35 +282,34 @@ async def update_user_portfolio(request: PortfolioUpdateRequest):
         if request.user_id in portfolio_router.portfolio_cache:
             del portfolio_router.portfolio_cache[request.user_id]
         
-        # Store portfolio update in database
+        records = [
+            (
+                request.user_id, holding.symbol, holding.name, holding.shares,
+                holding.avg_cost, holding.market_value, holding.sector.value if holding.sector else None,
+                holding.position_pct, holding.unrealized_pnl
+            )
+            for holding in request.holdings
+        ]
+        
+        # Store portfolio update in database as one atomic commit
         async with app.state.db_pool.acquire() as conn:
-            # Update portfolio summary
-            await conn.execute("""
-                INSERT INTO portfolios (user_id, total_value, cash_balance, risk_level, last_updated)
-                VALUES ($1, $2, $3, $4, NOW())
-                ON CONFLICT (user_id) 
-                DO UPDATE SET 
-                    total_value = $2,
-                    cash_balance = $3,
-                    risk_level = $4,
-                    last_updated = NOW()
-            """, request.user_id, request.total_value, request.cash_balance, request.risk_level.value)
-            
-            # Clear existing holdings
-            await conn.execute("DELETE FROM holdings WHERE user_id = $1", request.user_id)
-            
-            # Insert new holdings
-            for holding in request.holdings:
-                await conn.execute("""
-                    INSERT INTO holdings (
-                        user_id, symbol, name, shares, avg_cost, market_value,
-                        sector, position_pct, unrealized_pnl
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
-                """, 
-                    request.user_id, holding.symbol, holding.name, holding.shares,
-                    holding.avg_cost, holding.market_value, holding.sector.value if holding.sector else None,
-                    holding.position_pct, holding.unrealized_pnl
+            async with conn.transaction():
+                # Update portfolio summary
+                await conn.execute(
+                    UPSERT_PORTFOLIO_SQL,
+                    request.user_id, request.total_value, request.cash_balance, request.risk_level.value
                 )
+                
+                # Clear existing holdings
+                await conn.execute(DELETE_HOLDINGS_SQL, request.user_id)
+                
+                # Insert new holdings in a single COPY
+                if records:
+                    await conn.copy_records_to_table(
+                        'holdings',
+                        records=records,
+                        columns=HOLDINGS_COPY_COLUMNS
+                    )
         
         return {
             "status": "success",
@@ -315,7 +352,7 @@ async def get_performance_metrics():
     
     return {
         "status": "success",
-        "metrics": portfolio_router.routing_stats,
+        "metrics": asdict(portfolio_router.routing_stats),
         "cache_size": len(portfolio_router.portfolio_cache),
         "uptime_seconds": time.time() - getattr(app.state, 'start_time', time.time())
     }
@@ -338,22 +375,30 @@ async def clear_portfolio_cache(user_id: Optional[str] = None):
         return {"status": "success", "message": f"Cleared cache for {cache_size} users"}
 
 
-@app.get("/admin/cache/stats")
-async def get_cache_stats():
-    """Get detailed cache statistics."""
-    
-    cache_stats = {}
-    for user_id, cache_entry in portfolio_router.portfolio_cache.items():
-        cache_stats[user_id] = {
+def _summarize_cache_entries(entries: List[tuple]) -> Dict[str, Dict]:
+    """Build per-user cache stats from a snapshot of cache entries."""
+    return {
+        user_id: {
             "last_updated": cache_entry.last_updated.isoformat(),
             "holdings_count": len(cache_entry.portfolio.get('holdings', [])),
             "total_value": cache_entry.portfolio.get('total_value', 0)
         }
+        for user_id, cache_entry in entries
+    }
+
+
+@app.get("/admin/cache/stats")
+async def get_cache_stats():
+    """Get detailed cache statistics."""
+    
+    # Snapshot on the loop (TTLCache is not thread-safe), format off it
+    entries = list(portfolio_router.portfolio_cache.items())
+    cache_stats = await asyncio.to_thread(_summarize_cache_entries, entries)
     
     return {
         "status": "success",
         "total_cached_users": len(cache_stats),
-        "cache_hit_rate": portfolio_router.routing_stats.get('cache_hit_rate', 0.0),
+        "cache_hit_rate": portfolio_router.routing_stats.cache_hit_rate,
         "cache_details": cache_stats
     }
 
@@ -365,5 +410,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8305,
         reload=False,
+        loop="uvloop",
+        http="httptools",
         log_level="info"
     )
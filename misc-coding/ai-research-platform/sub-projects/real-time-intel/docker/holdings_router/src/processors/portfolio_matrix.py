@@ -0,0 +1,130 @@
+"""
+Portfolio Matrix
+
+Inverted indexes and a dense sector-exposure matrix over the active
+portfolios, used to find the users an event can possibly be relevant to
+without scoring every portfolio in Python.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set
+
+import numpy as np
+
+from .relevance_engine import relevance_engine
+from .scoring import sector_hits
+
+# Share of the overall score carried by sector correlation; without a
+# holdings match it is the only component that can be non-zero
+SECTOR_SCORE_WEIGHT = 0.25
+
+# Slack for float32 rounding so the prefilter never drops a borderline user
+_SCORE_EPSILON = 1e-4
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+
+@dataclass
+class PortfolioMatrix:
+    """Inverted ticker/sector indexes plus a users x sectors exposure matrix."""
+    user_ids: List[str]
+    ticker_rows: Dict[str, np.ndarray]  # ticker -> rows of users holding it
+    ticker_names: Dict[str, Set[str]]  # ticker -> lowercased holding names
+    sector_index: Dict[str, int]
+    sector_rows: List[np.ndarray]  # sector column -> rows of users exposed to it
+    exposure: np.ndarray  # float32, (n_users, n_sectors) market-value weights
+    
+    def rows_for_tickers(self, symbols: Set[str]) -> np.ndarray:
+        """Rows of users holding any of the given tickers."""
+        rows = [self.ticker_rows[symbol] for symbol in symbols if symbol in self.ticker_rows]
+        return np.concatenate(rows) if rows else _NO_ROWS
+
+
+def build_portfolio_matrix(user_portfolios: Dict[str, Dict]) -> PortfolioMatrix:
+    """Index a set of user portfolios by ticker and sector."""
+    user_ids = list(user_portfolios)
+    ticker_rows: Dict[str, List[int]] = {}
+    ticker_names: Dict[str, Set[str]] = {}
+    sector_index: Dict[str, int] = {}
+    sector_weights: List[Dict[int, float]] = []
+    
+    for row, user_id in enumerate(user_ids):
+        portfolio = user_portfolios[user_id]
+        total_value = float(portfolio.get('total_value') or 0) or 1.0
+        weights: Dict[int, float] = {}
+        for holding in portfolio.get('holdings', []):
+            symbol = holding['symbol']
+            rows = ticker_rows.setdefault(symbol, [])
+            if not rows or rows[-1] != row:
+                rows.append(row)
+            name = (holding.get('name') or '').lower()
+            if len(name) > 3:
+                ticker_names.setdefault(symbol, set()).add(name)
+            sector = holding.get('sector')
+            if sector:
+                column = sector_index.setdefault(sector, len(sector_index))
+                market_value = float(holding.get('market_value') or 0)
+                weights[column] = weights.get(column, 0.0) + market_value / total_value
+        sector_weights.append(weights)
+    
+    exposure = np.zeros((len(user_ids), len(sector_index)), dtype=np.float32)
+    sector_rows: List[List[int]] = [[] for _ in sector_index]
+    for row, weights in enumerate(sector_weights):
+        for column, weight in weights.items():
+            exposure[row, column] = weight
+            sector_rows[column].append(row)
+    
+    return PortfolioMatrix(
+        user_ids=user_ids,
+        ticker_rows={symbol: np.array(rows, dtype=np.intp) for symbol, rows in ticker_rows.items()},
+        ticker_names=ticker_names,
+        sector_index=sector_index,
+        sector_rows=[np.array(rows, dtype=np.intp) for rows in sector_rows],
+        exposure=exposure
+    )
+
+
+def candidate_rows(
+    matrix: PortfolioMatrix,
+    event_text: str,
+    event_entities: List[str],
+    event_metadata: Optional[Dict],
+    min_score: float
+) -> np.ndarray:
+    """Row indices of users whose relevance score can reach min_score.
+    
+    A user qualifies if they hold a ticker the event names (by symbol or
+    company name), or if their sector exposure alone can reach min_score.
+    Every other user scores below min_score in the relevance engine. Only
+    users found through the inverted indexes are ever touched.
+    """
+    # Users holding a ticker named by the event
+    symbols = {entity.upper() for entity in event_entities}
+    text_lower = event_text.lower()
+    symbols.update(
+        symbol for symbol, names in matrix.ticker_names.items()
+        if any(name in text_lower for name in names)
+    )
+    direct_rows = matrix.rows_for_tickers(symbols)
+    
+    # Users exposed to a sector the event touches, scored on those sectors only
+    columns = []
+    strengths = []
+    for sector in relevance_engine._extract_event_sectors(event_text, event_metadata):
+        column = matrix.sector_index.get(sector)
+        if column is not None:
+            columns.append(column)
+            strengths.append(relevance_engine.sector_correlations.get(sector, 0.5))
+    if not columns:
+        return np.unique(direct_rows)
+    
+    exposed = np.unique(np.concatenate([matrix.sector_rows[column] for column in columns]))
+    hits = sector_hits(
+        matrix.exposure,
+        exposed,
+        np.asarray(columns, dtype=np.intp),
+        np.asarray(strengths, dtype=np.float32),
+        SECTOR_SCORE_WEIGHT,
+        min_score - _SCORE_EPSILON
+    )
+    return np.union1d(direct_rows, exposed[hits])
@@ -7,13 +7,161 @@ This is the main orchestration service that uses the RelevanceEngine.
 
 import asyncio
 import logging
-from typing import Dict, List, Optional, Set
-from dataclasses import dataclass
-from datetime import datetime, timedelta
+import time
+from collections import defaultdict
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, Optional, Set, Tuple
+from dataclasses import asdict, dataclass
+from datetime import datetime
 
+import orjson
+from cachetools import LRUCache, TTLCache
+
+from ..config import get_settings
+from .portfolio_matrix import PortfolioMatrix, build_portfolio_matrix, candidate_rows
 from .relevance_engine import relevance_engine, RelevanceLevel, RelevanceScore
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Hot-path SQL kept as stable text so asyncpg's statement cache reuses the plans
+ACTIVE_USERS_SQL = """
+    SELECT user_id, last_portfolio_update
+    FROM users 
+    WHERE is_active = true 
+    AND portfolio_enabled = true
+"""
+
+PORTFOLIOS_SQL = """
+    SELECT 
+        user_id,
+        total_value,
+        cash_balance,
+        total_return_pct,
+        risk_level,
+        last_updated
+    FROM portfolios 
+    WHERE user_id = ANY($1::text[])
+"""
+
+HOLDINGS_SQL = """
+    SELECT 
+        user_id,
+        symbol,
+        name,
+        shares,
+        avg_cost,
+        market_value,
+        sector,
+        position_pct,
+        unrealized_pnl
+    FROM holdings 
+    WHERE user_id = ANY($1::text[])
+    AND shares > 0
+    ORDER BY user_id, market_value DESC
+"""
+
+# Trailing windows are bound as an hour count so one plan serves every hours_back
+USER_RELEVANT_EVENTS_SQL = """
+    SELECT 
+        er.event_id,
+        er.relevance_score,
+        er.relevance_level,
+        er.matched_entities,
+        er.reasoning,
+        er.created_at,
+        e.title,
+        e.content,
+        e.source_url
+    FROM event_routing er
+    JOIN events e ON er.event_id = e.event_id
+    WHERE er.user_id = $1
+    AND er.created_at >= NOW() - ($3::int * INTERVAL '1 hour')
+    AND er.relevance_level::text = ANY($2)
+    ORDER BY er.relevance_score DESC, er.created_at DESC
+    LIMIT 100
+"""
+
+# Same rows aggregated into one JSON array by Postgres, for handlers that only re-serialize them
+USER_RELEVANT_EVENTS_JSON_SQL = f"""
+    SELECT
+        COUNT(*) AS events_count,
+        COALESCE(
+            json_agg(t ORDER BY t.relevance_score DESC, t.created_at DESC),
+            '[]'::json
+        ) AS events
+    FROM ({USER_RELEVANT_EVENTS_SQL}) t
+"""
+
+ROUTING_STATS_SQL = """
+    SELECT 
+        relevance_level,
+        COUNT(*) as count,
+        AVG(relevance_score) as avg_score,
+        COUNT(DISTINCT user_id) as unique_users,
+        COUNT(DISTINCT event_id) as unique_events
+    FROM event_routing
+    WHERE created_at >= NOW() - ($1::int * INTERVAL '1 hour')
+    GROUP BY relevance_level
+"""
+
+ROUTING_PERFORMANCE_SQL = """
+    SELECT 
+        COUNT(*) as total_events,
+        AVG(processing_time_ms) as avg_processing_time,
+        MAX(processing_time_ms) as max_processing_time,
+        MIN(processing_time_ms) as min_processing_time
+    FROM routing_decisions
+    WHERE created_at >= NOW() - ($1::int * INTERVAL '1 hour')
+"""
+
+ROUTING_COPY_COLUMNS = (
+    'event_id', 'user_id', 'relevance_score', 'relevance_level',
+    'entity_match_score', 'sector_correlation_score',
+    'sentiment_impact_score', 'position_weight_score',
+    'matched_entities', 'affected_positions', 'reasoning', 'confidence'
+)
+
+# Relevance levels in ascending order of importance
+_LEVEL_RANK = {
+    RelevanceLevel.IRRELEVANT: 0,
+    RelevanceLevel.LOW: 1,
+    RelevanceLevel.MEDIUM: 2,
+    RelevanceLevel.HIGH: 3,
+    RelevanceLevel.CRITICAL: 4
+}
+
+# Enum values looked up once instead of through Enum attribute access per score
+_LEVEL_VALUES: Dict[RelevanceLevel, str] = {level: level.value for level in RelevanceLevel}
+
+# Level values that satisfy each minimum level, bound as-is in relevance queries
+_VALID_LEVELS_BY_MIN: Dict[RelevanceLevel, Tuple[str, ...]] = {
+    min_level: tuple(
+        level.value for level in RelevanceLevel if _LEVEL_RANK[level] >= _LEVEL_RANK[min_level]
+    )
+    for min_level in RelevanceLevel
+}
+
+# Window aggregates are recomputed at most once a minute per hours_back
+ANALYTICS_CACHE_TTL_SECONDS = 60
+
+# Active users fetched per cursor round trip, also the cache-miss load chunk size
+ACTIVE_USERS_PREFETCH = 1000
+
+# Relevance scores remembered per (portfolio content, event content) pair
+RELEVANCE_MEMO_SIZE = 100_000
+
+
+def portfolio_content_hash(portfolio: Dict) -> int:
+    """Hash every portfolio field the relevance engine reads, in holdings order."""
+    return hash((
+        portfolio.get('total_value'),
+        tuple(
+            (holding['symbol'], holding.get('name'), holding.get('sector'), holding.get('market_value'))
+            for holding in portfolio.get('holdings', [])
+        )
+    ))
 
 
 @dataclass
@@ -26,13 +174,21 @@ class RoutingDecision:
     timestamp: datetime
 
 
+@dataclass(slots=True)
+class RoutingStats:
+    """Running routing counters, updated once per routed event."""
+    total_events_processed: int = 0
+    total_users_notified: int = 0
+    avg_processing_time_ms: float = 0.0
+    cache_hit_rate: float = 0.0
+
+
 @dataclass
 class UserPortfolioCache:
     """Cached user portfolio data."""
     user_id: str
     portfolio: Dict
-    last_updated: datetime
-    cache_ttl_minutes: int = 30
+    last_updated: datetime  # load time, for cache stats; expiry is the TTLCache's job
 
 
 class PortfolioRouter:
@@ -49,7 +205,11 @@ class PortfolioRouter:
     
     def __init__(self, db_pool=None):
         self.db_pool = db_pool
-        self.portfolio_cache: Dict[str, UserPortfolioCache] = {}
+        # Bounded and self-expiring, so stale portfolios drop out without a manual sweep
+        self.portfolio_cache: TTLCache = TTLCache(
+            maxsize=settings.portfolio_cache_max_size,
+            ttl=settings.portfolio_cache_ttl_minutes * 60
+        )
         self.routing_thresholds = {
             RelevanceLevel.CRITICAL: 0.8,
             RelevanceLevel.HIGH: 0.6,
@@ -58,12 +218,17 @@ class PortfolioRouter:
         }
         
         # Performance tracking
-        self.routing_stats = {
-            'total_events_processed': 0,
-            'total_users_notified': 0,
-            'avg_processing_time_ms': 0.0,
-            'cache_hit_rate': 0.0
-        }
+        self.routing_stats = RoutingStats()
+        
+        self._analytics_cache: TTLCache = TTLCache(maxsize=256, ttl=ANALYTICS_CACHE_TTL_SECONDS)
+        
+        # Scores for portfolio/event pairs already seen; identical inputs score identically
+        self._relevance_memo: LRUCache = LRUCache(maxsize=RELEVANCE_MEMO_SIZE)
+        
+        # Last active-portfolio snapshot and the exposure matrix built from it
+        self._active_portfolios: Dict[str, Dict] = {}
+        self._portfolio_matrix: Optional[PortfolioMatrix] = None
+        self._matrix_source: Optional[Dict[str, Dict]] = None
     
     async def route_event(
         self,
@@ -72,7 +237,10 @@ class PortfolioRouter:
         event_entities: List[str],
         event_sentiment: Optional[Dict],
         event_metadata: Optional[Dict] = None,
-        min_relevance_level: RelevanceLevel = RelevanceLevel.LOW
+        min_relevance_level: RelevanceLevel = RelevanceLevel.LOW,
+        user_portfolios: Optional[Dict[str, Dict]] = None,
+        pending_records: Optional[List[tuple]] = None,
+        pending_alerts: Optional[List[Tuple[str, Dict[str, RelevanceScore]]]] = None
     ) -> RoutingDecision:
         """
         Route an event to relevant users based on portfolio analysis.
@@ -84,17 +252,24 @@ class PortfolioRouter:
             event_sentiment: Sentiment analysis results
             event_metadata: Additional event metadata
             min_relevance_level: Minimum relevance level to route
+            user_portfolios: Preloaded active portfolios, fetched when omitted
+            pending_records: Collects routing rows for the caller to store instead
+                of writing them here
+            pending_alerts: Collects (event_id, routing_results) for the caller to
+                send once pending_records are stored; required with pending_records
             
         Returns:
             RoutingDecision with routing results
         """
         start_time = datetime.now()
+        start = time.perf_counter()
         
         logger.info(f"Routing event {event_id} to users")
         
         try:
             # Get all active user portfolios
-            user_portfolios = await self._get_active_user_portfolios()
+            if user_portfolios is None:
+                user_portfolios = await self._get_active_user_portfolios()
             
             if not user_portfolios:
                 logger.warning("No active user portfolios found")
@@ -108,39 +283,58 @@ class PortfolioRouter:
             
             # Calculate relevance for each user
             routing_results = {}
-            users_by_level = {level.value: [] for level in RelevanceLevel}
+            users_by_level: Dict[str, List[str]] = defaultdict(list)
+            event_fingerprint = self._event_fingerprint(
+                event_text, event_entities, event_sentiment, event_metadata
+            )
             
-            for user_id, portfolio in user_portfolios.items():
+            for user_id, portfolio in self._candidate_portfolios(
+                user_portfolios, event_text, event_entities, event_metadata, min_relevance_level
+            ):
                 try:
-                    relevance_score = relevance_engine.calculate_relevance(
-                        event_text=event_text,
-                        event_entities=event_entities,
-                        event_sentiment=event_sentiment,
-                        user_portfolio=portfolio,
-                        event_metadata=event_metadata
-                    )
+                    content_hash = portfolio.get('content_hash')
+                    if content_hash is None:
+                        content_hash = portfolio_content_hash(portfolio)
+                    memo_key = (content_hash, event_fingerprint)
+                    
+                    relevance_score = self._relevance_memo.get(memo_key)
+                    if relevance_score is None:
+                        relevance_score = relevance_engine.calculate_relevance(
+                            event_text=event_text,
+                            event_entities=event_entities,
+                            event_sentiment=event_sentiment,
+                            user_portfolio=portfolio,
+                            event_metadata=event_metadata
+                        )
+                        self._relevance_memo[memo_key] = relevance_score
                     
                     # Check if meets minimum threshold
                     if self._meets_threshold(relevance_score.level, min_relevance_level):
                         routing_results[user_id] = relevance_score
-                        users_by_level[relevance_score.level.value].append(user_id)
-                        
-                        # Store routing decision in database
-                        await self._store_routing_decision(
-                            event_id, user_id, relevance_score
-                        )
+                        users_by_level[_LEVEL_VALUES[relevance_score.level]].append(user_id)
                     
                 except Exception as e:
                     logger.error(f"Error calculating relevance for user {user_id}: {e}")
                     continue
             
-            # Send to Alert Engine for delivery
-            if routing_results:
-                await self._send_to_alert_engine(event_id, routing_results)
+            # Store routing decisions in database, one COPY per event. Alerts
+            # go out only after the write, so deferred writes defer them too.
+            records = self._routing_records(event_id, routing_results)
+            if pending_records is not None:
+                pending_records.extend(records)
+                if routing_results:
+                    pending_alerts.append((event_id, routing_results))
+            else:
+                if records:
+                    await self._write_routing_records(records)
+                
+                # Send to Alert Engine for delivery
+                if routing_results:
+                    await self._send_to_alert_engine(event_id, routing_results)
             
             # Calculate metrics
-            processing_time = (datetime.now() - start_time).total_seconds() * 1000
-            total_matched = sum(len(users) for users in users_by_level.values())
+            processing_time = (time.perf_counter() - start) * 1000
+            total_matched = len(routing_results)
             
             # Update stats
             self._update_routing_stats(processing_time, total_matched)
@@ -152,7 +346,7 @@ class PortfolioRouter:
             return RoutingDecision(
                 event_id=event_id,
                 total_users_matched=total_matched,
-                users_by_level=users_by_level,
+                users_by_level=dict(users_by_level),  # only levels that matched someone
                 processing_time_ms=processing_time,
                 timestamp=start_time
             )
@@ -170,26 +364,74 @@ class PortfolioRouter:
         
         logger.info(f"Batch routing {len(events)} events")
         
-        # Pre-load all user portfolios once
-        user_portfolios = await self._get_active_user_portfolios()
+        # Pre-load all user portfolios once, overlapping the query with event parsing.
+        # Yield once so the task gets its query on the wire before parsing starts.
+        portfolios_task = asyncio.create_task(self._get_active_user_portfolios())
+        await asyncio.sleep(0)
         
-        routing_tasks = []
+        routable = []
         for event in events:
-            task = self.route_event(
-                event_id=event['event_id'],
-                event_text=event['text'],
-                event_entities=event.get('entities', []),
-                event_sentiment=event.get('sentiment'),
-                event_metadata=event.get('metadata'),
-                min_relevance_level=min_relevance_level
-            )
-            routing_tasks.append(task)
+            try:
+                routable.append({
+                    'event_id': event['event_id'],
+                    'event_text': event['text'],
+                    'event_entities': event.get('entities', []),
+                    'event_sentiment': event.get('sentiment'),
+                    'event_metadata': event.get('metadata')
+                })
+            except (KeyError, TypeError, AttributeError) as e:
+                logger.error(f"Skipping malformed event in batch: {e!r}")
+        
+        user_portfolios = await portfolios_task
+        
+        # A single event needs none of the fan-out machinery
+        if len(routable) == 1:
+            try:
+                return [await self.route_event(
+                    **routable[0],
+                    min_relevance_level=min_relevance_level,
+                    user_portfolios=user_portfolios
+                )]
+            except Exception as e:
+                logger.error(f"Error routing event {routable[0]['event_id']} in batch: {e}")
+                return []
+        
+        # Routing rows from every event, stored together after the fan-out,
+        # and the alerts held back until that write succeeds
+        pending_records: List[tuple] = []
+        pending_alerts: List[Tuple[str, Dict[str, RelevanceScore]]] = []
+        
+        # Bound fan-out so a large batch cannot exhaust the DB pool
+        semaphore = asyncio.Semaphore(settings.max_concurrent_routes)
+        
+        async def _route_one(event: Dict) -> Optional[RoutingDecision]:
+            # Failures stay per-event so one bad event cannot cancel the group
+            async with semaphore:
+                try:
+                    return await self.route_event(
+                        **event,
+                        min_relevance_level=min_relevance_level,
+                        user_portfolios=user_portfolios,
+                        pending_records=pending_records,
+                        pending_alerts=pending_alerts
+                    )
+                except Exception as e:
+                    logger.error(f"Error routing event {event['event_id']} in batch: {e}")
+                    return None
         
         # Process all events concurrently
-        results = await asyncio.gather(*routing_tasks, return_exceptions=True)
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(_route_one(event)) for event in routable]
+        
+        # Store the whole batch's routing decisions in one COPY; a failed
+        # write fails the batch before any alert is sent
+        if pending_records:
+            await self._write_routing_records(pending_records)
         
-        # Filter out exceptions
-        successful_results = [r for r in results if isinstance(r, RoutingDecision)]
+        for event_id, routing_results in pending_alerts:
+            await self._send_to_alert_engine(event_id, routing_results)
+        
+        successful_results = [task.result() for task in tasks if task.result() is not None]
         
         logger.info(f"Batch routing completed: {len(successful_results)}/{len(events)} successful")
         
@@ -208,31 +450,10 @@ class PortfolioRouter:
         
         try:
             async with self.db_pool.acquire() as conn:
-                query = """
-                    SELECT 
-                        er.event_id,
-                        er.relevance_score,
-                        er.relevance_level,
-                        er.matched_entities,
-                        er.reasoning,
-                        er.created_at,
-                        e.title,
-                        e.content,
-                        e.source_url
-                    FROM event_routing er
-                    JOIN events e ON er.event_id = e.event_id
-                    WHERE er.user_id = $1
-                    AND er.created_at >= NOW() - INTERVAL '%s hours'
-                    AND er.relevance_level::text = ANY($2)
-                    ORDER BY er.relevance_score DESC, er.created_at DESC
-                    LIMIT 100
-                """ % hours_back
-                
                 # Get relevance levels that meet threshold
-                valid_levels = [level.value for level in RelevanceLevel 
-                              if self._meets_threshold(level, min_relevance_level)]
+                valid_levels = _VALID_LEVELS_BY_MIN[min_relevance_level]
                 
-                rows = await conn.fetch(query, user_id, valid_levels)
+                rows = await conn.fetch(USER_RELEVANT_EVENTS_SQL, user_id, valid_levels, hours_back)
                 
                 return [dict(row) for row in rows]
                 
@@ -240,58 +461,103 @@ class PortfolioRouter:
             logger.error(f"Error getting relevant events for user {user_id}: {e}")
             return []
     
+    async def get_user_relevant_events_json(
+        self,
+        user_id: str,
+        hours_back: int = 24,
+        min_relevance_level: RelevanceLevel = RelevanceLevel.LOW
+    ) -> Tuple[int, str]:
+        """Get a user's recent relevant events as (count, JSON array text)."""
+        
+        if not self.db_pool:
+            return 0, '[]'
+        
+        try:
+            async with self.db_pool.acquire() as conn:
+                row = await conn.fetchrow(
+                    USER_RELEVANT_EVENTS_JSON_SQL,
+                    user_id, _VALID_LEVELS_BY_MIN[min_relevance_level], hours_back
+                )
+                return row['events_count'], row['events']
+                
+        except Exception as e:
+            logger.error(f"Error getting relevant events for user {user_id}: {e}")
+            return 0, '[]'
+    
     async def get_routing_analytics(self, hours_back: int = 24) -> Dict:
         """Get routing analytics and performance metrics."""
         
         if not self.db_pool:
             return {}
         
+        window_stats = self._analytics_cache.get(hours_back)
+        if window_stats is None:
+            window_stats = await self._query_routing_window(hours_back)
+            if window_stats is None:
+                return {}
+            self._analytics_cache[hours_back] = window_stats
+        
+        return {
+            **window_stats,
+            'cache_stats': {
+                'cached_portfolios': len(self.portfolio_cache),
+                'cache_hit_rate': self.routing_stats.cache_hit_rate
+            },
+            'overall_stats': asdict(self.routing_stats)
+        }
+    
+    async def _query_routing_window(self, hours_back: int) -> Optional[Dict]:
+        """Query routing and performance aggregates for the trailing window."""
+        
         try:
             async with self.db_pool.acquire() as conn:
                 # Event routing stats
-                routing_query = """
-                    SELECT 
-                        relevance_level,
-                        COUNT(*) as count,
-                        AVG(relevance_score) as avg_score,
-                        COUNT(DISTINCT user_id) as unique_users,
-                        COUNT(DISTINCT event_id) as unique_events
-                    FROM event_routing
-                    WHERE created_at >= NOW() - INTERVAL '%s hours'
-                    GROUP BY relevance_level
-                """ % hours_back
-                
-                routing_stats = await conn.fetch(routing_query)
+                routing_stats = await conn.fetch(ROUTING_STATS_SQL, hours_back)
                 
                 # Performance stats
-                perf_query = """
-                    SELECT 
-                        COUNT(*) as total_events,
-                        AVG(processing_time_ms) as avg_processing_time,
-                        MAX(processing_time_ms) as max_processing_time,
-                        MIN(processing_time_ms) as min_processing_time
-                    FROM routing_decisions
-                    WHERE created_at >= NOW() - INTERVAL '%s hours'
-                """ % hours_back
-                
-                perf_stats = await conn.fetchrow(perf_query)
+                perf_stats = await conn.fetchrow(ROUTING_PERFORMANCE_SQL, hours_back)
                 
                 return {
                     'routing_by_level': [dict(row) for row in routing_stats],
-                    'performance': dict(perf_stats) if perf_stats else {},
-                    'cache_stats': {
-                        'cached_portfolios': len(self.portfolio_cache),
-                        'cache_hit_rate': self.routing_stats['cache_hit_rate']
-                    },
-                    'overall_stats': self.routing_stats
+                    'performance': dict(perf_stats) if perf_stats else {}
                 }
                 
         except Exception as e:
             logger.error(f"Error getting routing analytics: {e}")
-            return {}
+            return None
+    
+    def _candidate_portfolios(
+        self,
+        user_portfolios: Dict[str, Dict],
+        event_text: str,
+        event_entities: List[str],
+        event_metadata: Optional[Dict],
+        min_relevance_level: RelevanceLevel
+    ):
+        """Yield (user_id, portfolio) pairs that can reach the minimum relevance level."""
+        
+        min_score = self.routing_thresholds.get(min_relevance_level)
+        if min_score is None:
+            # Every user qualifies for IRRELEVANT, nothing to prefilter
+            yield from user_portfolios.items()
+            return
+        
+        # Snapshots are reused while portfolios are unchanged, so rebuild only on a new one
+        if self._matrix_source is not user_portfolios:
+            self._portfolio_matrix = build_portfolio_matrix(user_portfolios)
+            self._matrix_source = user_portfolios
+        
+        matrix = self._portfolio_matrix
+        for row in candidate_rows(matrix, event_text, event_entities, event_metadata, min_score):
+            user_id = matrix.user_ids[row]
+            yield user_id, user_portfolios[user_id]
     
     async def _get_active_user_portfolios(self) -> Dict[str, Dict]:
-        """Get all active user portfolios with caching."""
+        """Get all active user portfolios with caching.
+        
+        Returns the previous snapshot object when nothing changed, so callers
+        can detect a new snapshot by identity.
+        """
         
         if not self.db_pool:
             return {}
@@ -302,170 +568,206 @@ class PortfolioRouter:
         
         try:
             async with self.db_pool.acquire() as conn:
-                # Get list of active users
-                users_query = """
-                    SELECT user_id, last_portfolio_update
-                    FROM users 
-                    WHERE is_active = true 
-                    AND portfolio_enabled = true
-                """
-                
-                user_rows = await conn.fetch(users_query)
-                
-                for user_row in user_rows:
-                    user_id = user_row['user_id']
-                    
-                    # Check cache first
-                    cached_portfolio = self.portfolio_cache.get(user_id)
-                    if (cached_portfolio and 
-                        cached_portfolio.last_updated > datetime.now() - timedelta(minutes=cached_portfolio.cache_ttl_minutes)):
-                        portfolios[user_id] = cached_portfolio.portfolio
-                        cache_hits += 1
-                        continue
-                    
-                    # Load from database
-                    portfolio = await self._load_user_portfolio(conn, user_id)
-                    if portfolio:
-                        portfolios[user_id] = portfolio
+                # Stream active users through a cursor, loading cache misses a chunk at a time
+                async with conn.transaction(readonly=True):
+                    missing_user_ids = []
+                    async for user_row in conn.cursor(ACTIVE_USERS_SQL, prefetch=ACTIVE_USERS_PREFETCH):
+                        user_id = user_row['user_id']
                         
-                        # Update cache
-                        self.portfolio_cache[user_id] = UserPortfolioCache(
-                            user_id=user_id,
-                            portfolio=portfolio,
-                            last_updated=datetime.now()
-                        )
-                        cache_misses += 1
+                        # Check cache first
+                        cached_portfolio = self.portfolio_cache.get(user_id)
+                        if cached_portfolio:
+                            portfolios[user_id] = cached_portfolio.portfolio
+                            cache_hits += 1
+                        else:
+                            missing_user_ids.append(user_id)
+                            if len(missing_user_ids) >= ACTIVE_USERS_PREFETCH:
+                                cache_misses += await self._cache_user_portfolios(conn, missing_user_ids, portfolios)
+                                missing_user_ids = []
+                    
+                    if missing_user_ids:
+                        cache_misses += await self._cache_user_portfolios(conn, missing_user_ids, portfolios)
                 
                 # Update cache hit rate
                 total_requests = cache_hits + cache_misses
                 if total_requests > 0:
-                    self.routing_stats['cache_hit_rate'] = cache_hits / total_requests
+                    self.routing_stats.cache_hit_rate = cache_hits / total_requests
                 
                 logger.debug(f"Portfolio cache: {cache_hits} hits, {cache_misses} misses")
                 
+                if cache_misses == 0 and portfolios.keys() == self._active_portfolios.keys():
+                    return self._active_portfolios
+                self._active_portfolios = portfolios
+                
         except Exception as e:
             logger.error(f"Error loading user portfolios: {e}")
         
         return portfolios
     
-    async def _load_user_portfolio(self, conn, user_id: str) -> Optional[Dict]:
-        """Load a single user's portfolio from database."""
+    async def _cache_user_portfolios(self, conn, user_ids: List[str], portfolios: Dict[str, Dict]) -> int:
+        """Load portfolios for cache misses into both the snapshot and the cache."""
+        
+        loaded = await self._load_user_portfolios(conn, user_ids)
+        now = datetime.now()
+        for user_id, portfolio in loaded.items():
+            portfolios[user_id] = portfolio
+            self.portfolio_cache[user_id] = UserPortfolioCache(
+                user_id=user_id,
+                portfolio=portfolio,
+                last_updated=now
+            )
+        return len(loaded)
+    
+    async def _load_user_portfolios(self, conn, user_ids: List[str]) -> Dict[str, Dict]:
+        """Load several users' portfolios from database with one query per table."""
         
         try:
-            # Get portfolio summary
-            portfolio_query = """
-                SELECT 
-                    total_value,
-                    cash_balance,
-                    total_return_pct,
-                    risk_level,
-                    last_updated
-                FROM portfolios 
-                WHERE user_id = $1
-            """
-            
-            portfolio_row = await conn.fetchrow(portfolio_query, user_id)
-            if not portfolio_row:
-                return None
+            # Get portfolio summaries
+            portfolio_rows = await conn.fetch(PORTFOLIOS_SQL, user_ids)
+            if not portfolio_rows:
+                return {}
             
-            # Get holdings
-            holdings_query = """
-                SELECT 
-                    symbol,
-                    name,
-                    shares,
-                    avg_cost,
-                    market_value,
-                    sector,
-                    position_pct,
-                    unrealized_pnl
-                FROM holdings 
-                WHERE user_id = $1 
-                AND shares > 0
-                ORDER BY market_value DESC
-            """
-            
-            holdings_rows = await conn.fetch(holdings_query, user_id)
+            # Get holdings for every user found
+            holdings_rows = await conn.fetch(
+                HOLDINGS_SQL, [row['user_id'] for row in portfolio_rows]
+            )
             
-            return {
-                'user_id': user_id,
-                'total_value': float(portfolio_row['total_value']),
-                'cash_balance': float(portfolio_row['cash_balance']),
-                'total_return_pct': float(portfolio_row['total_return_pct']),
-                'risk_level': portfolio_row['risk_level'],
-                'last_updated': portfolio_row['last_updated'],
-                'holdings': [dict(row) for row in holdings_rows]
-            }
+            # Rows arrive ordered by user_id, so each user's holdings are contiguous
+            holdings_by_user: Dict[str, List[Dict]] = {}
+            for user_id, rows in groupby(holdings_rows, key=itemgetter('user_id')):
+                holdings = holdings_by_user[user_id] = []
+                for row in rows:
+                    holding = dict(row)
+                    del holding['user_id']
+                    holdings.append(holding)
             
         except Exception as e:
-            logger.error(f"Error loading portfolio for user {user_id}: {e}")
-            return None
+            logger.error(f"Error loading portfolios for {len(user_ids)} users: {e}")
+            return {}
+        
+        portfolios = {}
+        for portfolio_row in portfolio_rows:
+            user_id = portfolio_row['user_id']
+            try:
+                portfolio = {
+                    'user_id': user_id,
+                    'total_value': float(portfolio_row['total_value']),
+                    'cash_balance': float(portfolio_row['cash_balance']),
+                    'total_return_pct': float(portfolio_row['total_return_pct']),
+                    'risk_level': portfolio_row['risk_level'],
+                    'last_updated': portfolio_row['last_updated'],
+                    'holdings': holdings_by_user.get(user_id, [])
+                }
+                portfolio['content_hash'] = portfolio_content_hash(portfolio)
+                portfolios[user_id] = portfolio
+            except Exception as e:
+                logger.error(f"Error loading portfolio for user {user_id}: {e}")
+        
+        return portfolios
+    
+    @staticmethod
+    def _event_fingerprint(
+        event_text: str,
+        event_entities: List[str],
+        event_sentiment: Optional[Dict],
+        event_metadata: Optional[Dict]
+    ) -> int:
+        """Hash every event input the relevance engine reads."""
+        
+        return hash((
+            event_text,
+            tuple(event_entities),
+            orjson.dumps(event_sentiment, option=orjson.OPT_SORT_KEYS),
+            orjson.dumps(event_metadata, option=orjson.OPT_SORT_KEYS)
+        ))
     
-    async def _store_routing_decision(self, event_id: str, user_id: str, relevance_score: RelevanceScore):
-        """Store routing decision in database."""
+    @staticmethod
+    def _routing_records(event_id: str, routing_results: Dict[str, RelevanceScore]) -> List[tuple]:
+        """Build event_routing rows in ROUTING_COPY_COLUMNS order."""
+        
+        return [
+            (
+                event_id, user_id, score.overall_score, _LEVEL_VALUES[score.level],
+                score.entity_match_score, score.sector_correlation_score,
+                score.sentiment_impact_score, score.position_weight_score,
+                score.matched_entities, score.affected_positions,
+                score.reasoning, score.confidence
+            )
+            for user_id, score in routing_results.items()
+        ]
+    
+    async def _write_routing_records(self, records: List[tuple]):
+        """Run the write phase for routed events on one pooled connection."""
         
         if not self.db_pool:
             return
         
         try:
+            # Every write for these records shares this connection instead of
+            # acquiring its own
             async with self.db_pool.acquire() as conn:
-                await conn.execute("""
-                    INSERT INTO event_routing (
-                        event_id, user_id, relevance_score, relevance_level,
-                        entity_match_score, sector_correlation_score,
-                        sentiment_impact_score, position_weight_score,
-                        matched_entities, affected_positions, reasoning, confidence
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12)
-                """, 
-                    event_id, user_id, relevance_score.overall_score, relevance_score.level.value,
-                    relevance_score.entity_match_score, relevance_score.sector_correlation_score,
-                    relevance_score.sentiment_impact_score, relevance_score.position_weight_score,
-                    relevance_score.matched_entities, relevance_score.affected_positions,
-                    relevance_score.reasoning, relevance_score.confidence
-                )
+                await self._store_routing_decisions(conn, records)
                 
         except Exception as e:
-            logger.error(f"Error storing routing decision: {e}")
+            logger.error(f"Error storing {len(records)} routing decisions: {e}")
+            raise
+    
+    @staticmethod
+    async def _store_routing_decisions(conn, records: List[tuple]):
+        """Store routing decisions with a single COPY on the given connection."""
+        
+        await conn.copy_records_to_table(
+            'event_routing',
+            records=records,
+            columns=ROUTING_COPY_COLUMNS
+        )
     
     async def _send_to_alert_engine(self, event_id: str, routing_results: Dict[str, RelevanceScore]):
         """Send routing results to Alert Engine for delivery."""
         
         # This would integrate with the Alert Engine service
-        # For now, just log the routing decisions
+        # For now, build the payload and log the routing decisions
+        payload = self._alert_payload(event_id, routing_results)
         
-        logger.info(f"Sending event {event_id} to Alert Engine for {len(routing_results)} users")
+        logger.info(
+            f"Sending event {event_id} to Alert Engine for {len(routing_results)} users "
+            f"({len(payload)} bytes)"
+        )
         
-        for user_id, score in routing_results.items():
-            logger.debug(
-                f"User {user_id}: {score.level.value} relevance "
-                f"(score: {score.overall_score:.3f}, reason: {score.reasoning})"
-            )
+        if logger.isEnabledFor(logging.DEBUG):
+            for user_id, score in routing_results.items():
+                logger.debug(
+                    f"User {user_id}: {_LEVEL_VALUES[score.level]} relevance "
+                    f"(score: {score.overall_score:.3f}, reason: {score.reasoning})"
+                )
+    
+    @staticmethod
+    def _alert_payload(event_id: str, routing_results: Dict[str, RelevanceScore]) -> bytes:
+        """Serialize routing results as compact (user_id, level, score) rows."""
+        
+        return orjson.dumps({
+            "event_id": event_id,
+            "users": [
+                (user_id, _LEVEL_VALUES[score.level], score.overall_score)
+                for user_id, score in routing_results.items()
+            ]
+        })
     
     def _meets_threshold(self, relevance_level: RelevanceLevel, min_level: RelevanceLevel) -> bool:
         """Check if relevance level meets minimum threshold."""
         
-        level_order = [
-            RelevanceLevel.IRRELEVANT,
-            RelevanceLevel.LOW,
-            RelevanceLevel.MEDIUM,
-            RelevanceLevel.HIGH,
-            RelevanceLevel.CRITICAL
-        ]
-        
-        return level_order.index(relevance_level) >= level_order.index(min_level)
+        return _LEVEL_RANK[relevance_level] >= _LEVEL_RANK[min_level]
     
     def _update_routing_stats(self, processing_time_ms: float, users_notified: int):
         """Update internal routing statistics."""
         
-        self.routing_stats['total_events_processed'] += 1
-        self.routing_stats['total_users_notified'] += users_notified
-        
-        # Update rolling average processing time
-        current_avg = self.routing_stats['avg_processing_time_ms']
-        total_events = self.routing_stats['total_events_processed']
+        stats = self.routing_stats
+        stats.total_events_processed += 1
+        stats.total_users_notified += users_notified
         
-        self.routing_stats['avg_processing_time_ms'] = (
-            (current_avg * (total_events - 1) + processing_time_ms) / total_events
+        # Update rolling average processing time incrementally
+        stats.avg_processing_time_ms += (
+            (processing_time_ms - stats.avg_processing_time_ms) / stats.total_events_processed
         )
 
 
@@ -0,0 +1,66 @@
+"""
+Sector Scoring Kernels
+
+Fused gather, weighted sum and threshold pass over the sector-exposure
+matrix. Compiled with Numba when it is installed, otherwise the same
+computation runs as NumPy array operations.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    # Numba is optional; sector_hits falls back to NumPy
+    njit = None
+
+
+def _sector_hits_numpy(
+    exposure: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    strengths: np.ndarray,
+    weight: float,
+    min_score: float
+) -> np.ndarray:
+    """NumPy fallback: gather the submatrix, then score and mask it."""
+    scores = exposure[np.ix_(rows, columns)] @ strengths
+    return weight * np.minimum(scores, 1.0) >= min_score
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _sector_hits_kernel(exposure, rows, columns, strengths, weight, min_score, out_hits):
+        """Score each row in place without materializing the submatrix."""
+        for i in prange(rows.shape[0]):
+            row = rows[i]
+            total = 0.0
+            for j in range(columns.shape[0]):
+                total += exposure[row, columns[j]] * strengths[j]
+            out_hits[i] = weight * min(total, 1.0) >= min_score
+
+
+def sector_hits(
+    exposure: np.ndarray,
+    rows: np.ndarray,
+    columns: np.ndarray,
+    strengths: np.ndarray,
+    weight: float,
+    min_score: float
+) -> np.ndarray:
+    """Boolean mask over rows whose capped, weighted sector score reaches min_score.
+    
+    Args:
+        exposure: float32 users x sectors market-value weights
+        rows: Row indices to score
+        columns: Sector columns the event touches
+        strengths: Correlation strength per column, float32
+        weight: Share of the overall score carried by the sector component
+        min_score: Score a row must reach to be kept
+    """
+    if njit is None:
+        return _sector_hits_numpy(exposure, rows, columns, strengths, weight, min_score)
+    
+    out_hits = np.empty(rows.shape[0], dtype=np.bool_)
+    _sector_hits_kernel(exposure, rows, columns, strengths, weight, min_score, out_hits)
+    return out_hits
@@ -19,9 +19,12 @@ async def get_db_pool() -> asyncpg.Pool:
             user=settings.db_user,
             password=settings.db_password,
             database=settings.db_name,
-            min_size=2,
-            max_size=10,
-            command_timeout=30
+            min_size=settings.db_pool_min_size,
+            max_size=settings.db_pool_max_size,
+            max_inactive_connection_lifetime=300,
+            command_timeout=30,
+            statement_cache_size=1024,
+            max_cached_statement_lifetime=0
         )
         
         logger.info("Database connection pool created successfully")
@@ -0,0 +1,142 @@
+"""Tests for the portfolio matrix prefilter and sector scoring kernels."""
+
+import random
+
+import numpy as np
+import pytest
+
+from src.processors import scoring
+from src.processors.portfolio_matrix import build_portfolio_matrix, candidate_rows
+from src.processors.relevance_engine import relevance_engine
+
+
+TICKERS = [
+    ("AAPL", "Apple Inc", "technology"),
+    ("MSFT", "Microsoft", "technology"),
+    ("NVDA", "Nvidia", "technology"),
+    ("JPM", "JPMorgan Chase", "financials"),
+    ("BAC", "Bank of America", "financials"),
+    ("XOM", "Exxon Mobil", "energy"),
+    ("PFE", "Pfizer", "healthcare"),
+    ("WMT", "Walmart", "consumer"),
+    ("DUK", "Duke Energy", "utilities"),
+    ("AMT", "American Tower", "real_estate"),
+    ("VZ", "Verizon", "communications"),
+    ("CAT", "Caterpillar", "industrials"),
+    ("FCX", "Freeport", "materials"),
+    ("IBM", "IBM", None),
+]
+
+HEADLINES = [
+    "Chip stocks rally as semiconductor demand surges",
+    "Regional bank shares slide on credit concerns",
+    "Oil prices jump after supply cut",
+    "Pharma approvals lift the drug sector",
+    "Retail sales beat forecasts",
+    "Telecom and media merger announced",
+    "Mining output falls on weak metals prices",
+    "Quiet session with little movement",
+]
+
+THRESHOLDS = [0.05, 0.1, 0.15, 0.2, 0.25, 0.4, 0.6, 0.8]
+
+
+def _random_portfolios(rng: random.Random, n_users: int):
+    """Generate portfolios with random holdings, weights and sectors."""
+    portfolios = {}
+    for i in range(n_users):
+        holdings = []
+        for symbol, name, sector in rng.sample(TICKERS, rng.randint(0, 6)):
+            holdings.append({
+                "symbol": symbol,
+                "name": name,
+                "sector": sector,
+                "market_value": round(rng.uniform(100, 50000), 2),
+            })
+        total_value = sum(h["market_value"] for h in holdings) + rng.choice([0, 1000, 25000])
+        portfolios[f"user_{i}"] = {"holdings": holdings, "total_value": total_value or 1.0}
+    return portfolios
+
+
+def _random_event(rng: random.Random):
+    """Generate event text, entities and metadata touching random tickers and sectors."""
+    text = rng.choice(HEADLINES)
+    if rng.random() < 0.3:
+        text += f" while {rng.choice(TICKERS)[1]} reports earnings"
+    entities = [symbol.lower() if rng.random() < 0.5 else symbol
+                for symbol, _, _ in rng.sample(TICKERS, rng.randint(0, 2))]
+    metadata = None
+    if rng.random() < 0.3:
+        metadata = {"sectors": [rng.choice(TICKERS)[2] or "technology"]}
+    return text, entities, metadata
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_candidates_cover_brute_force_scoring(seed):
+    """Every user scoring at or above the threshold must be a candidate."""
+    rng = random.Random(seed)
+    portfolios = _random_portfolios(rng, 200)
+    matrix = build_portfolio_matrix(portfolios)
+    
+    for _ in range(10):
+        text, entities, metadata = _random_event(rng)
+        sentiment = {"overall": {"score": rng.uniform(-1, 1), "confidence": rng.random()}}
+        scores = {
+            user_id: relevance_engine.calculate_relevance(
+                text, entities, sentiment, portfolio, metadata
+            ).overall_score
+            for user_id, portfolio in portfolios.items()
+        }
+        
+        for threshold in THRESHOLDS:
+            rows = candidate_rows(matrix, text, entities, metadata, threshold)
+            candidates = {matrix.user_ids[row] for row in rows}
+            expected = {user_id for user_id, score in scores.items() if score >= threshold}
+            assert expected <= candidates, (
+                f"missed {sorted(expected - candidates)} for {text!r} at {threshold}"
+            )
+
+
+def test_candidate_rows_are_unique_and_sorted():
+    """Candidate rows come back once each, in row order."""
+    portfolios = _random_portfolios(random.Random(7), 100)
+    matrix = build_portfolio_matrix(portfolios)
+    rows = candidate_rows(matrix, "Tech and bank stocks move", ["AAPL", "JPM"], None, 0.05)
+    assert rows.tolist() == sorted(set(rows.tolist()))
+
+
+def test_no_sectors_or_tickers_yields_no_candidates():
+    """An event touching nothing held returns an empty candidate set."""
+    portfolios = _random_portfolios(random.Random(3), 50)
+    matrix = build_portfolio_matrix(portfolios)
+    rows = candidate_rows(matrix, "Quiet session with little movement", [], None, 0.2)
+    assert rows.size == 0
+
+
+def _random_exposure(seed: int):
+    """Random exposure matrix plus row/column selections for the kernels."""
+    rng = np.random.default_rng(seed)
+    n_users, n_sectors = 500, 10
+    exposure = rng.random((n_users, n_sectors), dtype=np.float32)
+    exposure[rng.random((n_users, n_sectors)) < 0.6] = 0.0
+    rows = np.unique(rng.integers(0, n_users, 300)).astype(np.intp)
+    columns = rng.choice(n_sectors, rng.integers(1, 4), replace=False).astype(np.intp)
+    strengths = rng.uniform(0.5, 0.9, columns.shape[0]).astype(np.float32)
+    return exposure, rows, columns, strengths
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("min_score", [0.0, 0.05, 0.1, 0.2, 0.25])
+def test_numba_kernel_matches_numpy_fallback(seed, min_score):
+    """The compiled kernel and the NumPy fallback agree on every row."""
+    pytest.importorskip("numba")
+    exposure, rows, columns, strengths = _random_exposure(seed)
+    
+    expected = scoring._sector_hits_numpy(exposure, rows, columns, strengths, 0.25, min_score)
+    out_hits = np.empty(rows.shape[0], dtype=np.bool_)
+    scoring._sector_hits_kernel(exposure, rows, columns, strengths, 0.25, min_score, out_hits)
+    
+    # float32 matmul vs float64 accumulation may split rows sitting on the threshold
+    scores = exposure[np.ix_(rows, columns)].astype(np.float64) @ strengths.astype(np.float64)
+    clear = np.abs(0.25 * np.minimum(scores, 1.0) - min_score) > 1e-5
+    np.testing.assert_array_equal(out_hits[clear], expected[clear])
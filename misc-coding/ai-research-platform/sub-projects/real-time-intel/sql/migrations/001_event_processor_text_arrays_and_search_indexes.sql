@@ -0,0 +1,77 @@
+-- Event Processor migration 001: native text[] string lists and search indexes
+--
+-- Run once against the event processor database after its tables exist, with psql
+-- in autocommit mode (no --single-transaction), since CREATE INDEX CONCURRENTLY
+-- cannot run inside a transaction block:
+--
+--   psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/migrations/001_event_processor_text_arrays_and_search_indexes.sql
+--
+-- Every statement is idempotent. If a concurrent build fails it leaves an INVALID
+-- index behind; drop that index before re-running. The event processor refuses to
+-- start until the version recorded at the end of this file is present.
+
+CREATE TABLE IF NOT EXISTS event_processor_schema_migrations (
+    version INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- ============================================================================
+-- STRING LISTS AS text[]
+-- ============================================================================
+
+-- ALTER ... USING does not allow subqueries, hence the helper
+CREATE OR REPLACE FUNCTION jsonb_to_text_array(value jsonb) RETURNS text[] AS $$
+    SELECT ARRAY(SELECT jsonb_array_elements_text(value))
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Rewrites each affected table under an ACCESS EXCLUSIVE lock; run in a maintenance
+-- window. Columns already converted are skipped.
+DO $$
+DECLARE
+    col record;
+BEGIN
+    FOR col IN
+        SELECT table_name, column_name FROM information_schema.columns
+        WHERE data_type = 'jsonb' AND (table_name, column_name) IN (
+            ('event_classifications', 'primary_indicators'),
+            ('event_classifications', 'secondary_indicators'),
+            ('event_enrichments', 'keywords'),
+            ('event_routing', 'secondary_destinations')
+        )
+    LOOP
+        EXECUTE format(
+            'ALTER TABLE %I ALTER COLUMN %I TYPE text[] USING jsonb_to_text_array(%I)',
+            col.table_name, col.column_name, col.column_name
+        );
+    END LOOP;
+END $$;
+
+-- ============================================================================
+-- SEARCH INDEXES (built without blocking writes)
+-- ============================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_enrichments_keywords
+    ON event_enrichments USING gin (keywords);
+
+-- Keyset pagination over (published_at, event_id)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_events_published_event
+    ON processed_events (published_at DESC, event_id DESC);
+
+-- Search filters: date range with list-view columns, and the child-table filters
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_events_published_covering
+    ON processed_events (published_at DESC) INCLUDE (event_id, title, status, source_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_classifications_type_event
+    ON event_classifications (event_type, event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_severity_assessments_severity_event
+    ON event_severity_assessments (severity, event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_entities_ticker_event
+    ON event_entities (ticker_symbol, event_id);
+
+-- Retention cleanup by creation time
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_events_created_at
+    ON processed_events (created_at);
+
+INSERT INTO event_processor_schema_migrations (version, description)
+VALUES (1, 'text[] string lists and search indexes')
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,55 @@
+-- Event Processor migration 002: child rows cascade with their event
+--
+-- Run after 001, the same way (psql in autocommit mode, ON_ERROR_STOP=1). The
+-- retention cleanup deletes only processed_events rows and relies on these
+-- cascades to remove the child rows.
+
+-- event_id indexes on every child table keep cascade lookups cheap
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_classifications_event_id ON event_classifications (event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_severity_assessments_event_id ON event_severity_assessments (event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_entities_event_id ON event_entities (event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_enrichments_event_id ON event_enrichments (event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_routing_event_id ON event_routing (event_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_event_processing_metrics_event_id ON event_processing_metrics (event_id);
+
+-- Added NOT VALID so the ALTER only takes a brief lock; new rows are checked at once
+DO $$
+DECLARE
+    child text;
+BEGIN
+    FOREACH child IN ARRAY ARRAY[
+        'event_classifications', 'event_severity_assessments', 'event_entities',
+        'event_enrichments', 'event_routing', 'event_processing_metrics'
+    ]
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_constraint WHERE conname = 'fk_' || child || '_event'
+        ) THEN
+            EXECUTE format(
+                'ALTER TABLE %I ADD CONSTRAINT %I FOREIGN KEY (event_id) '
+                'REFERENCES processed_events (event_id) ON DELETE CASCADE NOT VALID',
+                child, 'fk_' || child || '_event'
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+-- Child rows whose event was already deleted are unreachable and would fail validation
+DELETE FROM event_classifications c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+DELETE FROM event_severity_assessments c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+DELETE FROM event_entities c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+DELETE FROM event_enrichments c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+DELETE FROM event_routing c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+DELETE FROM event_processing_metrics c WHERE NOT EXISTS (SELECT 1 FROM processed_events pe WHERE pe.event_id = c.event_id);
+
+-- Validation scans existing rows under SHARE UPDATE EXCLUSIVE, so writes keep flowing
+ALTER TABLE event_classifications VALIDATE CONSTRAINT fk_event_classifications_event;
+ALTER TABLE event_severity_assessments VALIDATE CONSTRAINT fk_event_severity_assessments_event;
+ALTER TABLE event_entities VALIDATE CONSTRAINT fk_event_entities_event;
+ALTER TABLE event_enrichments VALIDATE CONSTRAINT fk_event_enrichments_event;
+ALTER TABLE event_routing VALIDATE CONSTRAINT fk_event_routing_event;
+ALTER TABLE event_processing_metrics VALIDATE CONSTRAINT fk_event_processing_metrics_event;
+
+INSERT INTO event_processor_schema_migrations (version, description)
+VALUES (2, 'cascade child rows with their event')
+ON CONFLICT (version) DO NOTHING;
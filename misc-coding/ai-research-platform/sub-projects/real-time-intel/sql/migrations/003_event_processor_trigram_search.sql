@@ -0,0 +1,17 @@
+-- Event Processor migration 003: trigram indexes for keyword search
+--
+-- Run after 002, the same way (psql in autocommit mode, ON_ERROR_STOP=1). Keyword
+-- filters are bound as ILIKE '%kw%' patterns, which only a trigram index can serve.
+-- The builds are CONCURRENTLY so writes to processed_events keep flowing.
+
+-- init_db.sql already creates the extension on fresh databases
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_events_title_trgm
+    ON processed_events USING gin (title gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_processed_events_content_trgm
+    ON processed_events USING gin (content gin_trgm_ops);
+
+INSERT INTO event_processor_schema_migrations (version, description)
+VALUES (3, 'trigram indexes for keyword search')
+ON CONFLICT (version) DO NOTHING;